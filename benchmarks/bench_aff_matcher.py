@@ -0,0 +1,79 @@
+# coding: utf-8
+"""
+aff_validator.SimilarityMatcher (exact ratio) against the
+TieredSimilarityMatcher, on institution, city and state pairs. The results
+of both matchers are checked to be identical.
+
+    $ python benchmarks/bench_aff_matcher.py
+"""
+import itertools
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.aff_validator import (
+    STATES, SimilarityMatcher, TieredSimilarityMatcher, normalize_value)
+
+INSTITUTIONS = [
+    u'Universidade de São Paulo', u'Universidade Federal de São Paulo',
+    u'Universidade Estadual Paulista', u'Universidade Federal do Rio de Janeiro',
+    u'Universidade Federal de Minas Gerais', u'Fundação Oswaldo Cruz',
+    u'Universidad Nacional Autónoma de México', u'Universidad de Buenos Aires',
+    u'Universidad de Chile', u'Pontificia Universidad Católica de Chile',
+    u'Empresa Brasileira de Pesquisa Agropecuária', u'Instituto Butantan',
+    u'Universidade Estadual de Campinas', u'Universidad de la República',
+]
+
+CITIES = [
+    u'São Paulo', u'Sao Paulo', u'S. Paulo', u'Rio de Janeiro', u'Belo Horizonte',
+    u'Campinas', u'Botucatu', u'Ribeirão Preto', u'Ciudad de México', u'México',
+    u'Buenos Aires', u'Santiago', u'Montevideo', u'Porto Alegre', u'Curitiba',
+]
+
+STATE_NAMES = [
+    u'SP', u'São Paulo', u'S Paulo', u'RJ', u'Rio de Janeiro', u'MG',
+    u'Minas Gerais', u'D.F.', u'Distrito Federal', u'Paraná', u'Pará',
+    u'Paraíba', u'Rio Grande do Sul', u'Rio Grande do Norte', u'Yucatán',
+]
+
+
+def pairs(values):
+    values = [normalize_value(i) for i in values]
+
+    return list(itertools.product(values, values))
+
+
+def main(argv):
+    exact = SimilarityMatcher()
+    number = 20
+
+    for name, data in (('institutions', INSTITUTIONS), ('cities', CITIES), ('states', STATE_NAMES)):
+        data = pairs(data)
+        tiered = TieredSimilarityMatcher()
+
+        assert [exact.matches(*i) for i in data] == [tiered.matches(*i) for i in data]
+
+        exact_time = timeit.timeit(lambda: [exact.matches(*i) for i in data], number=number)
+        tiered_time = timeit.timeit(lambda: [tiered.matches(*i) for i in data], number=number)
+        print('%-13s %5d pairs  exact %7.2f ms  tiered %7.2f ms  (%.1fx, %d%% exact ratios)' % (
+            name, len(data), exact_time * 1000 / number, tiered_time * 1000 / number,
+            exact_time / tiered_time, 100 * tiered.computed / (tiered.computed +
+            tiered.rejected_by_length + tiered.rejected_by_characters)))
+
+    choices = list(STATES._states.items())
+    values = [normalize_value(i) for i in STATE_NAMES + CITIES]
+    tiered = TieredSimilarityMatcher()
+
+    assert [exact.best(i, choices) for i in values] == [tiered.best(i, choices) for i in values]
+
+    exact_time = timeit.timeit(lambda: [exact.best(i, choices) for i in values], number=number)
+    tiered_time = timeit.timeit(lambda: [tiered.best(i, choices) for i in values], number=number)
+    print('%-13s %5d values exact %7.2f ms  tiered %7.2f ms  (%.1fx)' % (
+        'state abbrev', len(values), exact_time * 1000 / number,
+        tiered_time * 1000 / number, exact_time / tiered_time))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,89 @@
+# coding: utf-8
+"""
+Allocation budget of the Article and Citation properties: the blocks and
+bytes retained, and the peak bytes, per call, measured with tracemalloc on
+the fixture document, against a baseline file.
+
+    $ python benchmarks/bench_allocations.py [--update] [--tolerance 0.1]
+
+The exit status is 1 when a property allocates more than the baseline plus
+the tolerance. --update writes the current measures as the new baseline.
+The measures depend on the python version and on the number of objects
+measured per property, which are kept in the baseline.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.profiling import allocation_budget, allocation_regressions
+from xylose.scielodocument import Article
+
+HERE = os.path.dirname(os.path.realpath(__file__))
+FIXTURE = os.path.join(HERE, '..', 'tests', 'fixtures', 'full_document.json')
+BASELINE = os.path.join(HERE, 'allocations_baseline.json')
+
+
+def measure(repeat):
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        data = json.load(fp)
+
+    result = allocation_budget(lambda: [Article(data)], repeat=repeat)
+    result.update(allocation_budget(lambda: Article(data).citations, repeat=repeat))
+
+    return result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Allocation budget of the document properties.')
+    parser.add_argument('--baseline', default=BASELINE, help='the baseline file')
+    parser.add_argument('--update', action='store_true', help='write the current measures as baseline')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed increase ratio')
+    parser.add_argument('--repeat', type=int, help='objects measured per property, as in the baseline')
+    args = parser.parse_args(argv[1:])
+
+    baseline = None
+    if not args.update and os.path.exists(args.baseline):
+        with io.open(args.baseline, encoding='utf-8') as fp:
+            baseline = json.load(fp)
+
+    repeat = args.repeat or (baseline or {}).get('repeat', 10)
+    current = measure(repeat)
+
+    print('%-44s %10s %10s %10s' % ('property', 'blocks', 'bytes', 'peak'))
+    for name, item in sorted(current.items(), key=lambda i: (-i[1]['bytes'], i[0])):
+        print('%-44s %10.1f %10.1f %10s' % (
+            name, item['blocks'], item['bytes'],
+            '%.1f' % item['peak_bytes'] if item['peak_bytes'] is not None else '-'))
+
+    if baseline is None:
+        with io.open(args.baseline, 'w', encoding='utf-8') as fp:
+            fp.write(json.dumps({
+                'python': platform.python_version(),
+                'repeat': repeat,
+                'properties': dict(
+                    (name, dict((k, round(v, 1) if v is not None else None) for k, v in item.items()))
+                    for name, item in current.items()
+                ),
+            }, indent=2, sort_keys=True))
+        print('\nbaseline written to %s' % args.baseline)
+        return 0
+
+    if baseline['python'].rsplit('.', 1)[0] != platform.python_version().rsplit('.', 1)[0]:
+        print('\nwarning: baseline measured on python %s' % baseline['python'])
+
+    regressions = allocation_regressions(baseline['properties'], current, tolerance=args.tolerance)
+
+    print('\n%d regressions above %d%%' % (len(regressions), args.tolerance * 100))
+    for name, metric, before, after in regressions:
+        print('%-44s %-10s %10.1f -> %.1f' % (name, metric, before, after))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,57 @@
+# coding: utf-8
+"""
+The author properties of the citations of a citation heavy article, read
+on the same Citation objects, which decode v10, v11, v16 and v17 once,
+against fresh Citation objects per property, which decode them on every
+read as the properties did before.
+
+    $ python benchmarks/bench_citation_authors.py [citations]
+"""
+import io
+import json
+import os
+import sys
+import timeit
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.scielodocument import Citation
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+PROPERTIES = (
+    'authors_groups', 'analytic_authors_group', 'monographic_authors_group',
+    'first_author_info', 'analytic_person_authors', 'monographic_person_authors',
+)
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 200
+
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        citations = json.load(fp)['citations']
+
+    records = [citations[i % len(citations)] for i in range(size)]
+
+    def shared():
+        for data in records:
+            citation = Citation(data)
+            for name in PROPERTIES:
+                getattr(citation, name)
+
+    def fresh():
+        for data in records:
+            for name in PROPERTIES:
+                getattr(Citation(data), name)
+
+    warnings.simplefilter('ignore')
+    for name, func in (('fresh Citation per property', fresh), ('same Citation', shared)):
+        number = 20
+        elapsed = timeit.timeit(func, number=number)
+        print('%-30s %8.3f ms per %d citations' % (name, elapsed * 1000 / number, size))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,63 @@
+# coding: utf-8
+"""
+Overhead of the deprecated accessors: the former warnings.warn per call
+against xylose.deprecation, under the default warnings filters, the
+'ignore' and 'always' actions, and in silent mode.
+
+    $ python benchmarks/bench_deprecation.py [calls]
+"""
+import os
+import sys
+import timeit
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose import deprecation
+from xylose.deprecation import Deprecation
+
+MESSAGE = '"first_author" will be deprecated in future version. Use "first_author_info" instead. '
+FIRST_AUTHOR = Deprecation(MESSAGE, PendingDeprecationWarning)
+
+
+def legacy_accessor():
+    msg = '"{}" will be deprecated in future version. '.format('first_author') + \
+        'Use "{}" instead. {}'.format('first_author_info', '')
+    warnings.warn(msg, PendingDeprecationWarning)
+
+
+def accessor():
+    FIRST_AUTHOR.warn()
+
+
+def plain_accessor():
+    pass
+
+
+def main(argv):
+    number = int(argv[1]) if len(argv) > 1 else 200000
+
+    cases = [
+        ('plain accessor', plain_accessor),
+        ('warn_future_deprecation', legacy_accessor),
+        ('Deprecation.warn', accessor),
+    ]
+
+    for label, setup in (('default filters', None), ('ignore', 'ignore'), ('always', 'always')):
+        print(label)
+        for name, func in cases:
+            with warnings.catch_warnings(record=True):
+                if setup is not None:
+                    warnings.simplefilter(setup)
+                elapsed = timeit.timeit(func, number=number)
+            print('  %-28s %8.1f ns per call' % (name, elapsed * 1e9 / number))
+
+    deprecation.set_silent(True)
+    elapsed = timeit.timeit(accessor, number=number)
+    deprecation.set_silent(False)
+    print('silent')
+    print('  %-28s %8.1f ns per call' % ('Deprecation.warn', elapsed * 1e9 / number))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
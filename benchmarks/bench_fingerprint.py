@@ -0,0 +1,51 @@
+# coding: utf-8
+"""
+Article.fingerprint against a digest of json.dumps(sort_keys=True).
+
+    $ python benchmarks/bench_fingerprint.py [body_kbytes]
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.scielodocument import Article
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+
+def json_digest(data):
+
+    return hashlib.blake2b(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def main(argv):
+    body_kbytes = int(argv[1]) if len(argv) > 1 else 200
+
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        data = json.load(fp)
+
+    paragraph = u'<p>Fulltext "body" with diacritics: ação, niño.</p>\n'
+    repeat = body_kbytes * 1024 // len(paragraph)
+    data['body'] = {u'en': paragraph * repeat, u'pt': paragraph * repeat}
+    article = Article(data)
+
+    cases = [
+        ('json.dumps(sort_keys=True)', lambda: json_digest(article.data)),
+        ('fingerprint()', lambda: article.fingerprint()),
+        ("fingerprint(exclude=['body'])", lambda: article.fingerprint(exclude=['body'])),
+    ]
+
+    for name, func in cases:
+        number = 200
+        elapsed = timeit.timeit(func, number=number)
+        print('%-32s %8.3f ms' % (name, elapsed * 1000 / number))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
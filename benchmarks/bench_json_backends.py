@@ -0,0 +1,48 @@
+# coding: utf-8
+"""
+Records/sec of each installed JSON backend decoding the same corpus.
+
+    $ python benchmarks/bench_json_backends.py [dump.jsonl]
+
+Without a dump file the corpus is built replicating the full document
+fixture of the test suite.
+"""
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose import corpus
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+
+def sample_corpus(size=2000):
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        line = json.dumps(json.load(fp)).encode('utf-8')
+
+    return [line] * size
+
+
+def main(argv):
+    if len(argv) > 1:
+        with open(argv[1], 'rb') as fp:
+            lines = fp.readlines()
+    else:
+        lines = sample_corpus()
+
+    print('%d records, %d bytes' % (len(lines), sum(len(i) for i in lines)))
+
+    for name in corpus.available_backends():
+        start = time.perf_counter()
+        total = sum(1 for _ in corpus.iter_articles(lines, backend=name))
+        elapsed = time.perf_counter() - start
+        print('%-10s %10.0f records/sec' % (name, total / elapsed))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,47 @@
+# coding: utf-8
+"""
+Article.bibliographic_legends per article against bibliographic_legends_batch,
+over a table of contents made of copies of the fixture document.
+
+    $ python benchmarks/bench_legends.py [articles]
+"""
+import io
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.scielodocument import Article, bibliographic_legends_batch
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 50
+
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        text = fp.read()
+
+    records = []
+    for i in range(size):
+        data = json.loads(text)
+        data['article']['v880'] = [{'_': u'S2179-975X20110003%05d' % i}]
+        data['article']['v14'] = [{'f': str(i * 10 + 1), 'l': str(i * 10 + 9)}]
+        records.append(data)
+
+    cases = [
+        ('bibliographic_legends()', lambda: [Article(i).bibliographic_legends() for i in records]),
+        ('bibliographic_legends_batch()', lambda: bibliographic_legends_batch([Article(i) for i in records])),
+    ]
+
+    for name, func in cases:
+        number = 20
+        elapsed = timeit.timeit(func, number=number)
+        print('%-32s %8.3f ms per %d articles' % (name, elapsed * 1000 / number, size))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
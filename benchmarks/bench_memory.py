@@ -0,0 +1,63 @@
+# coding: utf-8
+"""
+Bytes per document object, with and without a per instance __dict__.
+
+    $ python benchmarks/bench_memory.py [count]
+
+The "dict" figures are taken from a plain subclass of each document class,
+which gets back the instance __dict__ the slotted classes no longer have.
+"""
+import io
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose.scielodocument import Article, Citation, Issue, Journal
+
+FIXTURES = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures')
+
+
+def fixture(name):
+    with io.open(os.path.join(FIXTURES, name), encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def bytes_per_object(cls, data, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(data) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+
+    return (after - before) / float(count)
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 100000
+
+    fulldoc = fixture('full_document.json')
+    issue = fixture('sample_issue.json')
+
+    cases = [
+        (Article, fulldoc),
+        (Issue, issue),
+        (Journal, fulldoc['title']),
+        (Citation, fixture('sample_citation.json')),
+    ]
+
+    print('%-10s %12s %12s' % ('class', 'dict', 'slots'))
+    for cls, data in cases:
+        unslotted = type(cls.__name__, (cls,), {})
+        print('%-10s %12.1f %12.1f' % (
+            cls.__name__,
+            bytes_per_object(unslotted, data, count),
+            bytes_per_object(cls, data, count)
+        ))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
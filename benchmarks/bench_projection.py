@@ -0,0 +1,72 @@
+# coding: utf-8
+"""
+Parse time and peak memory of a metadata only run, with and without a
+fields projection.
+
+    $ python benchmarks/bench_projection.py [dump.jsonl]
+
+Without a dump file the corpus is built from the full document fixture of
+the test suite, with 100KB fulltext bodies in two languages.
+"""
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose import corpus
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+FIELDS = set(['article', 'title', 'issue', 'collection'])
+
+
+def sample_corpus(size=500):
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        data = json.load(fp)
+
+    body = u'<p>Fulltext body, ação.</p>\n' * 4000
+    data['body'] = {u'en': body, u'pt': body}
+
+    return [json.dumps(data).encode('utf-8')] * size
+
+
+def run(lines, backend, **kwargs):
+    start = time.perf_counter()
+    for article in corpus.iter_articles(lines, backend=backend, **kwargs):
+        article.original_title()
+    elapsed = time.perf_counter() - start
+
+    # A batch of articles held in memory, as the batch jobs and caches do.
+    tracemalloc.start()
+    batch = list(corpus.iter_articles(lines, backend=backend, **kwargs))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del batch
+
+    return len(lines) / elapsed, peak / 1024.0 / 1024.0
+
+
+def main(argv):
+    if len(argv) > 1:
+        with open(argv[1], 'rb') as fp:
+            lines = fp.readlines()
+    else:
+        lines = sample_corpus()
+
+    for backend in corpus.available_backends():
+        for name, kwargs in [
+            ('full', {}),
+            ('projected', {'fields': FIELDS}),
+            ('projected lazy', {'fields': FIELDS, 'lazy': True}),
+        ]:
+            rate, peak = run(lines, backend, **kwargs)
+            print('%-10s %-16s %10.0f records/sec %10.1f MB peak' % (backend, name, rate, peak))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
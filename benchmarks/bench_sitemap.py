@@ -0,0 +1,51 @@
+# coding: utf-8
+"""
+Article.html_url per article against urls.article_urls, and the time to
+write the sitemaps of the URLs.
+
+    $ python benchmarks/bench_sitemap.py [articles]
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from xylose import urls
+from xylose.scielodocument import Article
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), '..', 'tests', 'fixtures', 'full_document.json')
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 20000
+
+    with io.open(FIXTURE, encoding='utf-8') as fp:
+        data = json.load(fp)
+
+    articles = [Article(data) for i in range(size)]
+    tmpdir = tempfile.mkdtemp()
+
+    cases = [
+        ('Article.html_url()', lambda: [i.html_url() for i in articles]),
+        ('urls.article_urls()', lambda: list(urls.article_urls(articles, languages=['en']))),
+        ('urls.write_sitemaps()', lambda: urls.write_sitemaps(
+            articles, tmpdir, base_url='http://www.scielo.br/sitemaps/', languages=['en'])),
+    ]
+
+    try:
+        for name, func in cases:
+            number = 3
+            elapsed = timeit.timeit(func, number=number)
+            print('%-24s %8.1f ms per %d articles' % (name, elapsed * 1000 / number, size))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
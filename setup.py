@@ -32,4 +32,9 @@ setup(
     tests_require=[],
     install_requires=requires,
     test_suite="tests",
+    entry_points={
+        "console_scripts": [
+            "xylose = xylose.__main__:main",
+        ],
+    },
 )
@@ -5,7 +5,10 @@ import unittest
 from xylose.aff_validator import (
     is_a_match,
     has_conflicts,
+    normalize_value,
     States,
+    SimilarityMatcher,
+    TieredSimilarityMatcher,
 )
 
 
@@ -61,3 +64,53 @@ class TestHasConflicts(unittest.TestCase):
         expected = [("state", "SP", "DF")]
         result = has_conflicts(original_aff, norm_aff)
         self.assertEqual(expected, result)
+
+
+class TestTieredSimilarityMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [
+            normalize_value(i) for i in [
+                "São Paulo", "Sao Paulo", "S Paulo", "SP", "(SP)", "Rio de Janeiro",
+                "Rio Janeiro", "RJ", "Minas Gerais", "Belo Horizonte", "Guangdong",
+                "Universidade de São Paulo", "Universidade Federal de São Paulo",
+                "Universidad Nacional Autónoma de México", "", "A", "AB", "BA",
+            ]
+        ]
+
+    def test_matches_is_identical_to_the_exact_ratio(self):
+        exact = SimilarityMatcher()
+        tiered = TieredSimilarityMatcher()
+
+        for value1 in self.values:
+            for value2 in self.values:
+                self.assertEqual(
+                    tiered.matches(value1, value2),
+                    exact.matches(value1, value2),
+                    (value1, value2)
+                )
+
+        self.assertTrue(tiered.rejected_by_length > 0)
+        self.assertTrue(tiered.rejected_by_characters > 0)
+        self.assertTrue(tiered.computed < len(self.values) ** 2)
+
+    def test_best_is_identical_to_the_exact_ratio(self):
+        choices = [(normalize_value(i), i) for i in ["Sao Paulo", "Sao Paula", "Parana", "Para", "Paraiba"]]
+        exact = SimilarityMatcher()
+        tiered = TieredSimilarityMatcher()
+
+        for value in self.values + ["SAO PAUL", "PARANA", "PARAN"]:
+            self.assertEqual(tiered.best(value, choices), exact.best(value, choices), value)
+
+    def test_best_ties_are_broken_by_key(self):
+        choices = [("ABCDEFGHIJ", "second"), ("ABCDEFGHIK", "first")]
+
+        self.assertEqual(TieredSimilarityMatcher().best("ABCDEFGHIL", choices), (0.9, "second"))
+        self.assertEqual(SimilarityMatcher().best("ABCDEFGHIL", choices), (0.9, "second"))
+
+    def test_is_a_match_with_matcher(self):
+        matcher = TieredSimilarityMatcher()
+
+        self.assertTrue(is_a_match("Sao Paulo", "S Paulo", matcher=matcher))
+        self.assertFalse(is_a_match("Sao Paulo", "Rio de Janeiro", matcher=matcher))
+        self.assertEqual(matcher.rejected_by_length + matcher.rejected_by_characters + matcher.computed, 2)
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose.affiliations import AffiliationNormalizer
+from xylose.scielodocument import Article
+
+
+class AffiliationNormalizerTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.fulldoc['article']['v240'] = [
+            {u'i': u'A01', u'p': u'BR', u'_': u'UNIVERSIDADE FEDERAL DE SAO CARLOS'},
+            {u'i': u'A02', u'p': u'BR', u's': u'São Paulo', u'_': u'UNIVERSIDADE FEDERAL DE SAO CARLOS'},
+            {u'i': u'A03', u'p': u'BR', u's': u'São Paulo', u'_': u'UNIVERSIDADE DE SAO PAULO'},
+            {u'p': u'BR', u'_': u'UNIVERSIDADE DE SAO PAULO'},
+            {u'i': u'A05', u'_': u' '},
+        ]
+        self.fulldoc['article']['v70'] = [
+            {u'i': u'A01', u'p': u'BRAZIL', u'_': u'UNIVERSIDADE FEDERAL DE SAO CARLOS'},
+            {u'i': u'A02', u'p': u'BRAZIL', u's': u'SP', u'_': u'UNIVERSIDADE FEDERAL DE SAO CARLOS'},
+            {u'i': u'A03', u'q': u'Mexico', u'p': u'MX', u's': u'Yucatán', u'_': u'Secretaría de Salud'},
+            {u'i': u'A04', u'p': u'US', u'e': u'<a href="mailto:a@b.org">a@b.org</a>', u'_': u'University of Florida'},
+        ]
+        self.articles = []
+        for i in range(3):
+            data = json.loads(json.dumps(self.fulldoc))
+            data['article']['v880'] = [{'_': u'S2179-975X201100030000%d' % i}]
+            self.articles.append(Article(data))
+
+    def test_results_match_article_properties(self):
+        normalizer = AffiliationNormalizer()
+
+        for pid, result in normalizer.normalize_corpus(self.articles):
+            article = [i for i in self.articles if i.publisher_id == pid][0]
+            self.assertEqual(result['affiliations'], article.affiliations)
+            self.assertEqual(result['normalized_affiliations'], article.normalized_affiliations)
+
+    def test_without_affiliations(self):
+        del(self.fulldoc['article']['v70'])
+        del(self.fulldoc['article']['v240'])
+
+        result = AffiliationNormalizer().normalize(Article(self.fulldoc))
+
+        self.assertEqual(result, {'affiliations': None, 'normalized_affiliations': None})
+
+    def test_results_are_copies(self):
+        normalizer = AffiliationNormalizer()
+        first = normalizer.normalize(self.articles[0])
+        first['affiliations'][0]['institution'] = u'Changed'
+
+        second = normalizer.normalize(self.articles[1])
+
+        self.assertEqual(second['affiliations'][0]['institution'], u'UNIVERSIDADE FEDERAL DE SAO CARLOS')
+
+    def test_report(self):
+        normalizer = AffiliationNormalizer()
+        list(normalizer.normalize_corpus(self.articles))
+        report = normalizer.report
+
+        self.assertEqual(report.documents, 3)
+        self.assertEqual(report.occurrences, 27)
+        self.assertEqual(report.unique, 9)
+        self.assertEqual(report.comparisons, 9)
+        self.assertEqual(report.unique_comparisons, 3)
+        self.assertEqual(report.dedupe_ratio, 3.0)
+        self.assertTrue(report.estimated_time_saved >= 0)
+        self.assertEqual(report.as_dict()['unique'], 9)
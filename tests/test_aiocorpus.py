@@ -0,0 +1,119 @@
+# coding: utf-8
+"""
+The asynchronous generators of xylose.corpus need Python 3.6. The tests
+drive them through __anext__ so that this module is parsed by every
+interpreter and skipped where they are not available.
+"""
+import unittest
+import json
+import os
+import sys
+
+from xylose import corpus
+
+if sys.version_info >= (3, 6):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'asynchronous generators need Python 3.6')
+class AsyncCorpusTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def _lines(self, count):
+        lines = []
+        for i in range(count):
+            self.fulldoc['article']['v880'] = [{'_': u'S0000-000020000001%05d' % i}]
+            lines.append(json.dumps(self.fulldoc).encode('utf-8') + b'\n')
+
+        return lines
+
+    def _reader(self, lines, limit=2 ** 16):
+        reader = asyncio.StreamReader(limit=limit)
+        for line in lines:
+            reader.feed_data(line)
+        reader.feed_data(b'\n')
+        reader.feed_eof()
+
+        return reader
+
+    def _collect(self, items):
+        collected = []
+
+        while True:
+            try:
+                collected.append(self.loop.run_until_complete(items.__anext__()))
+            except StopAsyncIteration:
+                return collected
+
+    def test_aiter_articles_keeps_the_stream_order(self):
+        reader = self._reader(self._lines(25))
+
+        with ThreadPoolExecutor(2) as executor:
+            articles = self._collect(corpus.aiter_articles(
+                reader, executor=executor, batch_size=4, prefetch=2))
+
+        self.assertEqual(
+            [i.publisher_id for i in articles],
+            [u'S0000-000020000001%05d' % i for i in range(25)]
+        )
+
+    def test_aiter_articles_iso_format(self):
+        articles = self._collect(
+            corpus.aiter_articles(self._reader(self._lines(1)), iso_format='iso 639-2'))
+
+        self.assertEqual([i.original_language() for i in articles], [u'eng'])
+
+    def test_aiter_records(self):
+        records = self._collect(corpus.aiter_records(self._reader(self._lines(3)), batch_size=2))
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[2]['article']['v880'][0]['_'], u'S0000-00002000000100002')
+
+    def test_aiter_articles_prefetch_is_bounded(self):
+        lines = iter(self._lines(20))
+        loop, read = self.loop, []
+
+        class Stream(object):
+
+            def __aiter__(self):
+                return self
+
+            def __anext__(self):
+                for line in lines:
+                    read.append(line)
+                    future = loop.create_future()
+                    future.set_result(line)
+                    return future
+                raise StopAsyncIteration
+
+        articles = corpus.aiter_articles(Stream(), batch_size=2, prefetch=2)
+        self.loop.run_until_complete(articles.__anext__())
+        self.loop.run_until_complete(articles.aclose())
+
+        # Two batches in flight and the one being filled, at most.
+        self.assertTrue(len(read) <= 6)
+
+    def test_aiter_records_line_longer_than_the_reader_limit(self):
+        lines = self._lines(2)
+
+        with self.assertRaises(ValueError):
+            self._collect(corpus.aiter_records(self._reader(lines, limit=1024)))
+
+        records = self._collect(corpus.aiter_records(self._reader(lines, limit=2 ** 20)))
+
+        self.assertEqual(len(records), 2)
+
+    def test_aiter_articles_invalid_batch_size(self):
+
+        with self.assertRaises(ValueError):
+            self._collect(corpus.aiter_articles(self._reader([]), batch_size=0))
@@ -0,0 +1,154 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+import pickle
+import shutil
+import tempfile
+
+from xylose import corpus
+from xylose.bodystore import BodyStore, LazyBodies
+from xylose.extraction import Extractor
+from xylose.scielodocument import Article
+
+
+class BodyStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.fulldoc['body'] = {
+            u'en': u'<p>English body</p>',
+            u'pt': u'<p>Corpo em português, ação</p>',
+        }
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'bodies.dat')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_detach_keeps_the_article_api(self):
+        with BodyStore(self.path) as store:
+            article = Article(store.detach(json.loads(json.dumps(self.fulldoc))))
+
+            self.assertTrue(isinstance(article.data['body'], LazyBodies))
+            self.assertEqual(article.original_html(), u'<p>English body</p>')
+            self.assertEqual(article.translated_htmls(), {u'pt': u'<p>Corpo em português, ação</p>'})
+            self.assertEqual(article.data['body'], self.fulldoc['body'])
+
+    def test_detach_does_not_keep_the_bodies_in_memory(self):
+        with BodyStore(self.path) as store:
+            record = store.detach(self.fulldoc)
+
+            pt_size = len(self.fulldoc['body'][u'pt'].encode('utf-8'))
+
+            self.assertEqual(
+                record['body'].offsets(),
+                {u'en': (0, 19), u'pt': (19, pt_size)}
+            )
+
+    def test_lazy_bodies_is_not_a_dict_of_offsets(self):
+        with BodyStore(self.path) as store:
+            bodies = store.detach(self.fulldoc)['body']
+
+            self.assertFalse(isinstance(bodies, dict))
+            self.assertEqual(dict(bodies), self.fulldoc['body'])
+            self.assertEqual(json.loads(json.dumps(dict(bodies))), self.fulldoc['body'])
+            self.assertTrue(u'en' in bodies)
+            self.assertEqual(bodies.get(u'es'), None)
+
+    def test_detach_an_already_stored_key(self):
+        line = json.dumps(self.fulldoc)
+
+        with BodyStore(self.path) as store:
+            store.detach(json.loads(line))
+        size = os.path.getsize(self.path)
+
+        with BodyStore(self.path) as store:
+            record = store.detach(json.loads(line))
+
+            self.assertEqual(os.path.getsize(self.path), size)
+            self.assertEqual(record['body'], self.fulldoc['body'])
+
+            self.fulldoc['body'][u'en'] = u'<p>Updated body</p>'
+            record = store.detach(self.fulldoc)
+
+            self.assertEqual(os.path.getsize(self.path), size + 19)
+            self.assertEqual(record['body'][u'en'], u'<p>Updated body</p>')
+            self.assertEqual(record['body'].offsets()[u'pt'], (19, size - 19))
+
+    def test_fingerprint_of_a_detached_record(self):
+        expected = Article(json.loads(json.dumps(self.fulldoc))).fingerprint()
+
+        with BodyStore(self.path) as store:
+            article = Article(store.detach(self.fulldoc))
+
+            self.assertEqual(article.fingerprint(), expected)
+
+    def test_dead_letter_of_a_detached_record(self):
+        dead_letter = io.StringIO()
+        del self.fulldoc['title']
+
+        with BodyStore(self.path) as store:
+            article = Article(store.detach(json.loads(json.dumps(self.fulldoc))))
+            extractor = Extractor(
+                [('journal_title', lambda a: a.journal.title)], dead_letter=dead_letter)
+
+            list(extractor.extract([article]))
+
+        lines = [json.loads(i) for i in dead_letter.getvalue().splitlines()]
+        self.assertEqual(lines[0]['record'], self.fulldoc)
+
+    def test_lru_cache(self):
+        with BodyStore(self.path, cache_size=1) as store:
+            bodies = store.put(u'S1', {u'en': u'a', u'es': u'b'})
+
+            bodies[u'en']
+            bodies[u'es']
+            bodies[u'es']
+
+            self.assertEqual(list(store._cache.values()), [u'b'])
+
+    def test_reopen_and_attach(self):
+        with BodyStore(self.path) as store:
+            store.detach(self.fulldoc)
+
+        with BodyStore(self.path) as store:
+            record = {'article': self.fulldoc['article']}
+            article = Article(store.attach(record))
+
+            self.assertIn(u'S2179-975X2011000300002', store)
+            self.assertEqual(article.original_html(), u'<p>English body</p>')
+
+    def test_attach_unknown_key(self):
+        with BodyStore(self.path) as store:
+            record = store.attach({'article': {'v880': [{'_': u'S1'}]}})
+
+            self.assertNotIn('body', record)
+
+    def test_pickle_materializes_the_bodies(self):
+        with BodyStore(self.path) as store:
+            record = store.detach(self.fulldoc)
+
+            self.assertEqual(pickle.loads(pickle.dumps(record['body'])), self.fulldoc['body'])
+
+    def test_iter_articles_with_body_store(self):
+        line = json.dumps(self.fulldoc)
+
+        with BodyStore(self.path) as store:
+            articles = list(corpus.iter_articles([line, line], body_store=store))
+
+            self.assertEqual(len(store), 1)
+            self.assertEqual(articles[1].original_html(), u'<p>English body</p>')
+
+    def test_iter_articles_with_body_store_and_projection(self):
+        line = json.dumps(self.fulldoc)
+
+        with BodyStore(self.path) as store:
+            articles = list(corpus.iter_articles(
+                [line], fields=set(['article', 'title']), body_store=store))
+
+            self.assertEqual(len(store), 0)
+            self.assertEqual(articles[0].publisher_id, u'S2179-975X2011000300002')
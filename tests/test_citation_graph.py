@@ -0,0 +1,119 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import citation_graph
+from xylose.citation_graph import CitationGraph, CitationGraphBuilder, build_citation_graph
+from xylose.citation_resolver import CitationResolver
+from xylose.scielodocument import Article
+
+
+class CitationGraphTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.numpy = citation_graph.numpy
+
+        builder = CitationGraphBuilder()
+        builder.add(u'S0001-000020100001001', [u'S0002-000020090001001', u'S0002-000020090001002'])
+        builder.add(u'S0001-000020100001002', [u'S0002-000020090001001', u'S0002-000020090001001'])
+        builder.add(u'S0002-000020090001002', [u'S0002-000020090001001'])
+        builder.add(u'S0003-000020100001001')
+        self.builder = builder
+        self.graph = builder.build()
+
+    def tearDown(self):
+        citation_graph.numpy = self.numpy
+        shutil.rmtree(self.tmpdir)
+
+    def assertGraph(self, graph):
+        self.assertEqual(len(graph), 5)
+        self.assertEqual(graph.edges, 4)
+        self.assertEqual(
+            graph.cited(u'S0001-000020100001001'),
+            [u'S0002-000020090001001', u'S0002-000020090001002']
+        )
+        self.assertEqual(graph.cited(u'S0003-000020100001001'), [])
+        self.assertEqual(
+            graph.citing(u'S0002-000020090001001'),
+            [u'S0001-000020100001001', u'S0002-000020090001002', u'S0001-000020100001002']
+        )
+        self.assertEqual(graph.in_degree(u'S0002-000020090001001'), 3)
+        self.assertEqual(graph.out_degree(u'S0001-000020100001002'), 1)
+        self.assertEqual(list(graph.in_degrees()), [0, 3, 1, 0, 0])
+        self.assertEqual(list(graph.out_degrees()), [2, 0, 1, 1, 0])
+
+    def test_graph(self):
+
+        self.assertGraph(self.graph)
+
+    def test_graph_without_numpy(self):
+        citation_graph.numpy = None
+
+        self.assertGraph(self.builder.build())
+
+    def test_unknown_pid(self):
+
+        with self.assertRaises(ValueError):
+            self.graph.in_degree(u'S9999-999920100001001')
+
+    def test_degree_statistics(self):
+        statistics = self.graph.degree_statistics()
+
+        self.assertEqual(statistics['nodes'], 5)
+        self.assertEqual(statistics['edges'], 4)
+        self.assertEqual(statistics['in'], {'min': 0, 'max': 3, 'mean': 0.8})
+        self.assertEqual(statistics['out']['max'], 2)
+
+    def test_degree_statistics_without_numpy(self):
+        citation_graph.numpy = None
+
+        self.assertEqual(
+            self.builder.build().degree_statistics(),
+            self.graph.degree_statistics()
+        )
+
+    def test_aggregate_per_journal(self):
+
+        self.assertEqual(self.graph.aggregate(), {
+            (u'0001-0000', u'0002-0000'): 3,
+            (u'0002-0000', u'0002-0000'): 1,
+        })
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmpdir, 'citations')
+        self.graph.save(path)
+
+        loaded = CitationGraph.load(path)
+
+        self.assertGraph(loaded)
+        self.assertEqual(loaded.pids, self.graph.pids)
+
+    def test_load_truncated_graph(self):
+        path = os.path.join(self.tmpdir, 'citations')
+        self.graph.save(path)
+        with open(path + '.indices', 'r+b') as fp:
+            fp.truncate(4)
+
+        with self.assertRaises(ValueError):
+            CitationGraph.load(path)
+
+    def test_build_from_resolver(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        resolver = CitationResolver([Article(fulldoc)])
+
+        citing = json.loads(json.dumps(fulldoc))
+        citing['article']['v880'] = [{'_': u'S0000-000020120001001'}]
+        citing['citations'] = [
+            {'v30': [{'_': u'Acta Limnol. Bras.'}], 'v35': [{'_': u'2179-975X'}], 'v31': [{'_': u'23'}], 'v14': [{'_': u'229-232'}]},
+        ]
+
+        graph = build_citation_graph(resolver, [fulldoc, citing])
+
+        self.assertEqual(graph.cited(u'S0000-000020120001001'), [u'S2179-975X2011000300002'])
+        self.assertEqual(graph.in_degree(u'S2179-975X2011000300002'), 1)
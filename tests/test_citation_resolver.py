@@ -0,0 +1,114 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+
+from xylose import citation_resolver
+from xylose.citation_resolver import CitationResolver
+from xylose.scielodocument import Article, Citation
+
+
+class CitationResolverTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.fulldoc['article']['v237'] = [{'_': u'10.1590/S2179-975X2011000300002'}]
+        self.resolver = CitationResolver([Article(self.fulldoc)])
+
+        self.citing = json.loads(json.dumps(self.fulldoc))
+        self.citing['article']['v880'] = [{'_': u'S0000-000020120001001'}]
+        self.citing['citations'] = [
+            {'v30': [{'_': u'Acta Limnol. Bras.'}], 'v237': [{'_': u'http://dx.doi.org/10.1590/s2179-975x2011000300002'}], 'v701': [{'_': u'1'}]},
+            {'v30': [{'_': u'Acta Limnol. Bras.'}], 'v35': [{'_': u'2179-975x'}], 'v31': [{'_': u'23'}], 'v14': [{'_': u'229-232'}]},
+            {'v30': [{'_': u'Acta Limnologica Brasiliensia'}], 'v65': [{'_': u'20110000'}], 'v10': [{'s': u'GÓMES', 'n': u'CID'}]},
+            {'v30': [{'_': u'Other Journal'}], 'v65': [{'_': u'20110000'}], 'v10': [{'s': u'Gomes', 'n': u'CID'}]},
+        ]
+
+    def test_normalize(self):
+
+        self.assertEqual(citation_resolver.normalize_doi(u'http://dx.doi.org/10.1590/ABC'), u'10.1590/abc')
+        self.assertIsNone(citation_resolver.normalize_doi(u'not a doi'))
+        self.assertEqual(citation_resolver.normalize_text(u'Acta Limnol. Brás.'), u'actalimnolbras')
+        self.assertEqual(citation_resolver.normalize_page(u'0229'), u'229')
+
+    def test_resolve_citation_object(self):
+        citation = Citation(self.citing['citations'][0])
+
+        self.assertEqual(
+            self.resolver.resolve(citation),
+            (u'S2179-975X2011000300002', citation_resolver.DOI)
+        )
+
+    def test_join(self):
+        result = list(self.resolver.join([self.citing]))
+
+        self.assertEqual(result, [
+            (u'S0000-000020120001001', 1, u'S2179-975X2011000300002', citation_resolver.DOI),
+            (u'S0000-000020120001001', 2, u'S2179-975X2011000300002', citation_resolver.ISSN_VOLUME_PAGE),
+            (u'S0000-000020120001001', 3, u'S2179-975X2011000300002', citation_resolver.SOURCE_YEAR_AUTHOR),
+            (u'S0000-000020120001001', 4, None, None),
+        ])
+        self.assertEqual(self.resolver.report.total, 4)
+        self.assertEqual(self.resolver.report.resolved, 3)
+        self.assertEqual(self.resolver.report.unresolved_types, {u'article': 1})
+
+    def test_join_with_an_invalid_index_number(self):
+        self.citing['citations'][1]['v701'] = [{'_': u'1a'}]
+
+        result = list(self.resolver.join([self.citing]))
+
+        self.assertEqual([i[1] for i in result], [1, 2, 3, 4])
+        self.assertEqual(self.resolver.report.invalid_index_numbers, 1)
+        self.assertEqual(self.resolver.report.as_dict()['invalid_index_numbers'], 1)
+
+    def test_join_writes_unresolved(self):
+        unresolved = io.StringIO()
+
+        list(self.resolver.join([Article(self.citing)], unresolved=unresolved))
+
+        lines = [json.loads(i) for i in unresolved.getvalue().splitlines()]
+        self.assertEqual(lines, [{
+            'citing_pid': u'S0000-000020120001001',
+            'index_number': 4,
+            'publication_type': u'article',
+            'keys': [citation_resolver.SOURCE_YEAR_AUTHOR],
+        }])
+
+    def test_index_articles_with_missing_fields(self):
+        without_title = json.loads(json.dumps(self.fulldoc))
+        del without_title['title']
+        without_date = json.loads(json.dumps(self.fulldoc))
+        del without_date['article']['v65']
+        without_date['article']['v237'] = [{'_': u'10.1590/other'}]
+
+        resolver = CitationResolver([Article(without_title), Article(without_date)])
+
+        self.assertEqual(len(resolver), 2)
+        self.assertEqual(resolver.report.key_failures, {
+            citation_resolver.ISSN_VOLUME_PAGE: 1,
+            citation_resolver.SOURCE_YEAR_AUTHOR: 2,
+        })
+        self.assertEqual(
+            resolver.resolve(self.citing['citations'][0]),
+            (u'S2179-975X2011000300002', citation_resolver.DOI)
+        )
+
+    def test_ambiguous_keys_are_not_resolved(self):
+        other = json.loads(json.dumps(self.fulldoc))
+        other['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        del(other['article']['v237'])
+        self.resolver.add_article(Article(other))
+
+        self.assertEqual(len(self.resolver), 2)
+        self.assertEqual(self.resolver.resolve(self.citing['citations'][1]), (None, None))
+        self.assertEqual(self.resolver.resolve(self.citing['citations'][0])[1], citation_resolver.DOI)
+
+    def test_cited_by(self):
+
+        self.assertEqual(
+            self.resolver.cited_by([self.citing, self.citing]),
+            {u'S2179-975X2011000300002': 6}
+        )
@@ -0,0 +1,134 @@
+# coding: utf-8
+
+import unittest
+import copy
+import json
+import os
+
+from xylose.citation_table import CitationTable, citation_row
+from xylose.scielodocument import Article, Citation
+
+
+class CitationTableTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.table = CitationTable([self.fulldoc])
+
+    def _other_article(self):
+        doc = copy.deepcopy(self.fulldoc)
+        doc['article']['v880'] = [{'_': u'S0000-00002000000100001'}]
+        doc['citations'] = [
+            {'v30': [{'_': u'Rev. Test'}], 'v65': [{'_': u'20100000'}],
+             'v10': [{'s': u'Silva', 'n': u'J'}], 'v237': [{'_': u'10.1590/xyz'}]},
+            {'v18': [{'_': u'A Thesis'}], 'v51': [{'_': u'PhD'}], 'v45': [{'_': u'2005'}],
+             'v11': [{'_': u'Org'}]},
+        ]
+        return doc
+
+    def test_len(self):
+
+        self.assertEqual(len(self.table), 18)
+
+    def test_rows_match_citation_properties(self):
+        article = Article(self.fulldoc)
+
+        for index, citation in enumerate(article.citations):
+            row = self.table.row(index)
+            info = citation.first_author_info
+            self.assertEqual(row['citing_pid'], article.publisher_id)
+            self.assertEqual(row['publication_type'], citation.publication_type)
+            self.assertEqual(row['source'], citation.source)
+            self.assertEqual(row['volume'], citation.volume)
+            self.assertEqual(row['issue'], citation.issue)
+            self.assertEqual(row['start_page'], citation.start_page)
+            self.assertEqual(row['issn'], citation.issn)
+            self.assertEqual(row['doi'], citation.doi)
+            self.assertEqual(
+                row['year'],
+                int(citation.publication_date[:4]) if citation.publication_date else None
+            )
+            self.assertEqual(
+                row['first_author_surname'],
+                info[2].get('surname') if info and info[1] == 'person' else None
+            )
+
+    def test_citation_row_of_each_publication_type(self):
+        fields = {
+            'v31': [{'_': u'3'}],
+            'v32': [{'_': u'2'}], 'v35': [{'_': u'1234-5678'}], 'v14': [{'_': u'10-20'}],
+            'v45': [{'_': u'20010000'}], 'v55': [{'_': u'20020000'}],
+        }
+        types = [
+            {'v30': [{'_': u'Journal'}]}, {'v18': [{'_': u'Book'}]},
+            {'v18': [{'_': u'Proceedings'}], 'v53': [{'_': u'Conference'}]},
+            {'v18': [{'_': u'Thesis'}], 'v51': [{'_': u'PhD'}]},
+            {'v150': [{'_': u'Patent'}]}, {'v37': [{'_': u'http://www.scielo.br'}]},
+        ]
+
+        for record in types:
+            record.update(fields)
+            for data in (record, dict(record, v65=[{'_': u'19990000'}])):
+                citation = Citation(data)
+                row = citation_row(data)
+
+                self.assertEqual(row[0], citation.publication_type)
+                self.assertEqual(row[1], citation.source)
+                self.assertEqual(
+                    row[2], int(citation.publication_date[:4]) if citation.publication_date else None)
+                self.assertEqual(row[3:7], (citation.volume, citation.issue, citation.start_page, citation.issn))
+
+    def test_citation_row_thesis(self):
+        data = self._other_article()['citations'][1]
+
+        self.assertEqual(
+            citation_row(data),
+            (u'thesis', None, 2005, None, None, None, None, None, None)
+        )
+
+    def test_filter(self):
+        self.table.add_article(self._other_article())
+
+        rows = self.table.filter(citing_pid=u'S0000-00002000000100001')
+
+        self.assertEqual(list(rows), [18, 19])
+        self.assertEqual(list(self.table.filter(year=2010, doi=u'10.1590/xyz')), [18])
+        self.assertEqual(self.table.count(publication_type=[u'thesis', u'link']), 1)
+        self.assertEqual(self.table.count(source=u'Unknown source'), 0)
+
+    def test_filter_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self.table.filter(title=u'x')
+
+    def test_group_by(self):
+        self.table.add_article(self._other_article())
+
+        groups = self.table.group_by('citing_pid')
+
+        self.assertEqual(groups[u'S0000-00002000000100001'], 2)
+        self.assertEqual(groups[u'S2179-975X2011000300002'], 18)
+
+    def test_group_by_rows(self):
+        self.table.add_article(self._other_article())
+
+        rows = self.table.filter(citing_pid=u'S0000-00002000000100001')
+
+        self.assertEqual(
+            self.table.group_by('publication_type', rows),
+            {u'article': 1, u'thesis': 1}
+        )
+        self.assertEqual(self.table.column('year', rows), [2010, 2005])
+
+    def test_add_article_after_codes(self):
+        codes = self.table.codes('publication_type')
+
+        self.table.add_article(self._other_article())
+
+        self.assertEqual(len(codes), 18)
+        self.assertEqual(len(self.table.codes('publication_type')), 20)
+
+    def test_article_without_citations(self):
+        del self.fulldoc['citations']
+
+        self.assertEqual(len(CitationTable([Article(self.fulldoc)])), 0)
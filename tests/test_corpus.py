@@ -0,0 +1,151 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+
+from xylose import corpus
+from xylose.scielodocument import Article, XyloseException
+
+
+class CorpusTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.line = json.dumps(self.fulldoc)
+
+    def test_stdlib_backend_is_always_available(self):
+        self.assertIn('json', corpus.available_backends())
+
+    def test_default_backend_is_the_preferred_installed_one(self):
+        self.assertEqual(corpus.default_backend(), corpus.available_backends()[0])
+
+    def test_get_backend_unknown(self):
+        with self.assertRaises(ValueError):
+            corpus.get_backend('yaml')
+
+    def test_set_default_backend(self):
+        current = corpus.default_backend()
+        try:
+            corpus.set_default_backend('json')
+            self.assertEqual(corpus.default_backend(), 'json')
+        finally:
+            corpus.set_default_backend(current)
+
+    def test_loads_every_backend_gives_the_same_record(self):
+        for name in corpus.available_backends():
+            self.assertEqual(corpus.loads(self.line, backend=name), self.fulldoc)
+
+    def test_iter_records_skip_blank_lines(self):
+        lines = [self.line, '\n', self.line.encode('utf-8')]
+
+        records = list(corpus.iter_records(lines, backend='json'))
+
+        self.assertEqual(len(records), 2)
+
+    def test_iter_articles(self):
+        articles = list(corpus.iter_articles([self.line], iso_format='iso 639-2'))
+
+        self.assertEqual(len(articles), 1)
+        self.assertTrue(isinstance(articles[0], Article))
+        self.assertEqual(articles[0].publisher_id, u'S2179-975X2011000300002')
+        self.assertEqual(articles[0].original_language(), u'eng')
+
+
+class ProjectionTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.line = json.dumps(self.fulldoc)
+        self.fields = set(['article', 'title', 'issue', 'collection'])
+
+    def test_projection_keeps_only_the_given_fields(self):
+        record = corpus.loads(self.line, fields=self.fields)
+
+        self.assertEqual(sorted(record.keys()), sorted(self.fields))
+        self.assertEqual(record['article'], self.fulldoc['article'])
+        self.assertIn('body', record.skipped_fields)
+
+    def test_projection_from_bytes_and_indented_json(self):
+        for line in [self.line.encode('utf-8'), json.dumps(self.fulldoc, indent=2, ensure_ascii=False)]:
+            record = corpus.loads(line, fields=self.fields)
+            self.assertEqual(record['title'], self.fulldoc['title'])
+
+    def test_projection_of_escaped_strings(self):
+        line = u'{"a\\"b": 1, "b": [1, {"x": "}\\\\\\"]\\\\"}], "c": true, "d": null, "e": -1.5e3}'
+
+        record = corpus.loads(line, fields=set([u'a"b', u'e']), lazy=True)
+
+        self.assertEqual(dict(record), {u'a"b': 1, u'e': -1500.0})
+        self.assertEqual(record['b'], json.loads(line)['b'])
+        self.assertEqual(record.get('c'), True)
+        self.assertTrue('d' in record)
+
+    def test_projection_skips_nested_values(self):
+        line = u'{"a": [[1, {"b": "]}"}], {"c": {"d": []}}], "e": {"f": "[{\\""}, "g": 2}'
+
+        record = corpus.loads(line, fields=set([u'g']), lazy=True)
+
+        self.assertEqual(dict(record), {u'g': 2})
+        self.assertEqual(record['a'], json.loads(line)['a'])
+        self.assertEqual(record['e'], json.loads(line)['e'])
+
+    def test_contains_does_not_load_the_skipped_fields(self):
+        lazy = corpus.loads(self.line, fields=self.fields, lazy=True)
+        dropped = corpus.loads(self.line, fields=self.fields)
+
+        self.assertTrue('body' in lazy)
+        self.assertIn('body', lazy.skipped_fields)
+        self.assertTrue('body' in dropped)
+        self.assertFalse('nothing' in dropped)
+
+    def test_multilingual_of_a_metadata_projection(self):
+        article = Article(corpus.loads(self.line, fields=self.fields))
+
+        self.assertEqual(article.multilingual()[u'en'][u'title'], article.original_title())
+        self.assertNotIn(u'html', article.multilingual()[u'en'])
+
+    def test_fingerprint_of_a_projection(self):
+        expected = Article(self.fulldoc).fingerprint()
+        lazy = Article(corpus.loads(self.line, fields=self.fields, lazy=True))
+        dropped = Article(corpus.loads(self.line, fields=self.fields))
+        skipped = dropped.data.skipped_fields
+
+        self.assertEqual(lazy.fingerprint(), expected)
+        with self.assertRaises(corpus.FieldNotLoadedException):
+            dropped.fingerprint()
+        self.assertEqual(
+            dropped.fingerprint(exclude=skipped),
+            Article(self.fulldoc).fingerprint(exclude=skipped)
+        )
+
+    def test_skipped_field_raises_a_clear_error(self):
+        article = Article(corpus.loads(self.line, fields=self.fields))
+
+        self.assertEqual(article.publisher_id, u'S2179-975X2011000300002')
+        with self.assertRaises(corpus.FieldNotLoadedException) as ctx:
+            article.original_html()
+        self.assertTrue(isinstance(ctx.exception, XyloseException))
+        self.assertIn('body', str(ctx.exception))
+
+    def test_lazy_field_is_loaded_on_access(self):
+        article = Article(corpus.loads(self.line, fields=self.fields, lazy=True))
+
+        self.assertEqual(len(article.citations), 18)
+        self.assertNotIn('citations', article.data.skipped_fields)
+        self.assertEqual(article.data['citations'], self.fulldoc['citations'])
+
+    def test_missing_field_out_of_the_projection_is_still_missing(self):
+        del self.fulldoc['body']
+
+        record = corpus.loads(json.dumps(self.fulldoc), fields=self.fields)
+
+        self.assertFalse('body' in record)
+        self.assertEqual(record.get('body', {}), {})
+
+    def test_iter_articles_with_projection(self):
+        articles = list(corpus.iter_articles([self.line], fields=self.fields))
+
+        self.assertEqual(articles[0].journal.acronym, u'alb')
@@ -0,0 +1,141 @@
+# coding: utf-8
+
+import unittest
+import warnings
+
+from xylose import deprecation
+from xylose.deprecation import Deprecation
+from xylose.scielodocument import Citation
+
+
+def call(item):
+    item.warn()
+
+
+class DeprecationTests(unittest.TestCase):
+
+    def tearDown(self):
+        deprecation.set_silent(False)
+
+    def test_future_message(self):
+        item = Deprecation.future('authors', 'author_groups', 'Details.')
+
+        self.assertEqual(
+            item.message,
+            '"authors" will be deprecated in future version. Use "author_groups" instead. Details.'
+        )
+        self.assertIs(item.category, PendingDeprecationWarning)
+
+    def test_always_warns_every_call(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            for i in range(3):
+                call(item)
+
+        self.assertEqual(len(w), 3)
+        self.assertIs(w[0].category, DeprecationWarning)
+        self.assertEqual(str(w[0].message), 'deprecated')
+
+    def test_default_warns_once_per_site(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('default')
+            for i in range(3):
+                call(item)
+            call(item)
+
+        self.assertEqual(len(w), 2)
+
+    def test_warning_location_is_the_caller(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            call(item)
+
+        self.assertEqual(w[0].filename, __file__.replace('.pyc', '.py'))
+
+    def test_ignore_does_not_warn(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('ignore')
+            call(item)
+
+        self.assertEqual(len(w), 0)
+
+    def test_error_raises_every_call(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for i in range(2):
+                with self.assertRaises(DeprecationWarning):
+                    call(item)
+
+    def test_sites_reset_when_filters_change(self):
+        item = Deprecation('deprecated')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('ignore')
+            call(item)
+            warnings.simplefilter('always')
+            call(item)
+            call(item)
+
+        self.assertEqual(len(w), 2)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('default')
+            call(item)
+
+        self.assertEqual(len(w), 1)
+
+    def test_message_filter(self):
+        item = Deprecation('deprecated, use another')
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            warnings.filterwarnings('ignore', message='deprecated, use')
+            call(item)
+
+        self.assertEqual(len(w), 0)
+
+    def test_silent(self):
+        item = Deprecation('deprecated')
+        deprecation.set_silent(True)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('error')
+            call(item)
+            self.assertTrue(deprecation.is_silent())
+
+        self.assertEqual(len(w), 0)
+
+    def test_silent_document_accessors(self):
+        citation = Citation({})
+        deprecation.set_silent(True)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.assertEqual(citation.authors, [])
+
+        self.assertEqual(len(w), 0)
+
+    def test_filter_action(self):
+
+        with warnings.catch_warnings():
+            warnings.resetwarnings()
+            warnings.filterwarnings('error', category=DeprecationWarning, module='legacy')
+            warnings.filterwarnings('once', category=DeprecationWarning, lineno=10, append=True)
+
+            self.assertEqual(
+                deprecation.filter_action(DeprecationWarning, 'deprecated', 'legacy.tasks', 1), 'error')
+            self.assertEqual(
+                deprecation.filter_action(DeprecationWarning, 'deprecated', 'tasks', 10), 'once')
+            self.assertEqual(
+                deprecation.filter_action(DeprecationWarning, 'deprecated', 'tasks', 1),
+                warnings.defaultaction)
@@ -3,8 +3,10 @@
 import unittest
 import json
 import os
+import pickle
 import warnings
-from xylose.scielodocument import Article, Citation, Journal, Issue, html_decode, UnavailableMetadataException, email_html_remove
+from xylose.scielodocument import Article, Citation, Journal, Issue, html_decode, UnavailableMetadataException, email_html_remove, bibliographic_legends_batch, CITATION_FIELDS
+from xylose import scielodocument
 from xylose import tools
 
 warnings.simplefilter("always")
@@ -197,6 +199,49 @@ class ToolsTests(unittest.TestCase):
         date = tools.get_date('2012xx01')
         self.assertEqual(date, '2012')
 
+    def test_fingerprint_ignores_keys_order(self):
+        first = {'a': u'1', 'b': {'v10': [{'s': u'Silva', 'n': u'J'}]}, 'body': {'en': u'text'}}
+        second = {'body': {'en': u'text'}, 'b': {'v10': [{'n': u'J', 's': u'Silva'}]}, 'a': u'1'}
+
+        self.assertEqual(tools.fingerprint(first), tools.fingerprint(second))
+
+    def test_fingerprint_distinguishes_types(self):
+
+        self.assertNotEqual(tools.fingerprint({'a': u'1'}), tools.fingerprint({'a': 1}))
+        self.assertNotEqual(tools.fingerprint({'a': [u'1']}), tools.fingerprint({'a': u'1'}))
+        self.assertNotEqual(tools.fingerprint({'a': {'b': u'c'}}), tools.fingerprint({'a': {'b': [u'c']}}))
+
+    def test_fingerprint_distinguishes_strings_boundaries(self):
+
+        self.assertNotEqual(
+            tools.fingerprint({'a': {'x': u'ab', 'y': u'c'}}),
+            tools.fingerprint({'a': {'x': u'a', 'y': u'bc'}})
+        )
+
+    def test_fingerprint_exclude(self):
+
+        self.assertEqual(
+            tools.fingerprint({'a': u'1', 'processing_date': u'2020'}, exclude=['processing_date']),
+            tools.fingerprint({'a': u'1', 'processing_date': u'2021'}, exclude=['processing_date'])
+        )
+
+    def test_fingerprint_digest_size(self):
+
+        self.assertEqual(len(tools.fingerprint({}, digest_size=8)), 16)
+
+    def test_fingerprint_without_blake2b(self):
+        blake2b = tools.hashlib.__dict__.pop('blake2b', None)
+
+        try:
+            first = tools.fingerprint({'a': u'1', 'b': [u'2']})
+            second = tools.fingerprint({'b': [u'2'], 'a': u'1'})
+        finally:
+            if blake2b is not None:
+                tools.hashlib.blake2b = blake2b
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 32)
+
 
 class IssueTests(unittest.TestCase):
 
@@ -205,6 +250,11 @@ class IssueTests(unittest.TestCase):
         self.fulldoc = json.loads(open('%s/fixtures/sample_issue.json' % path).read())
         self.issue = Issue(self.fulldoc)
 
+    def test_fingerprint(self):
+
+        self.assertEqual(self.issue.fingerprint(), Issue(dict(self.fulldoc)).fingerprint())
+        self.assertNotEqual(self.issue.fingerprint(), self.issue.journal.fingerprint())
+
     def test_sections(self):
         issue = self.issue
 
@@ -3429,6 +3479,22 @@ class ArticleTests(unittest.TestCase):
 
         self.assertEqual(article.affiliations, expected)
 
+    def test_affiliation_with_country_name_with_diacritics_and_punctuation(self):
+        article = self.article
+
+        article.data['article']['v70'] = [
+            {u"i": u"A01", u"p": u"BRASIL.", u"_": u"Universidade de São Paulo"},
+            {u"i": u"A02", u"p": u"México", u"_": u"Universidad Nacional Autónoma de México"},
+            {u"i": u"A03", u"p": u"Nowhere", u"_": u"Unknown"},
+        ]
+
+        affiliations = article.affiliations
+
+        self.assertEqual(affiliations[0]['country'], u'BRASIL.')
+        self.assertEqual(affiliations[0]['country_iso_3166'], u'BR')
+        self.assertEqual(affiliations[1]['country_iso_3166'], u'MX')
+        self.assertNotIn('country_iso_3166', affiliations[2])
+
     def test_affiliation_with_country_iso_3166(self):
 
         article = self.article
@@ -3814,6 +3880,20 @@ class ArticleTests(unittest.TestCase):
 
         article.data['citations']
 
+    def test_citations_to_dict(self):
+        article = self.article
+
+        result = article.citations_to_dict(fields=['index_number', 'first_page'])
+
+        self.assertEqual(len(result), 18)
+        self.assertEqual(result[0], article.citations[0].to_dict(fields=['index_number', 'first_page']))
+
+    def test_citations_to_dict_without_citations(self):
+        article = self.article
+        del(article.data['citations'])
+
+        self.assertIsNone(article.citations_to_dict())
+
     def test_doi_and_lang_no_v237(self):
         expected = []
         doc = {}
@@ -3942,6 +4022,116 @@ class ArticleTests(unittest.TestCase):
         article = Article(doc)
         self.assertEqual(article.doi_and_lang, expected)
 
+    def test_fingerprint(self):
+        article = Article(self.fulldoc)
+        other = Article(json.loads(json.dumps(self.fulldoc)))
+        other.data['body'] = {u'en': u'<p>Changed</p>'}
+
+        self.assertEqual(len(article.fingerprint()), 32)
+        self.assertNotEqual(article.fingerprint(), other.fingerprint())
+        self.assertEqual(article.fingerprint(exclude=['body']), other.fingerprint(exclude=['body']))
+
+    def test_bibliographic_legends(self):
+        legends = self.article.bibliographic_legends()
+
+        self.assertEqual(
+            legends['descriptive_format'],
+            u'Acta Limnologica Brasiliensia, Volume: 23, Issue: 3, Pages: 229-232, Published: SEP 2011'
+        )
+
+    def test_bibliographic_legends_without_deprecation_warning(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.article.bibliographic_legends()
+
+        self.assertEqual([i for i in w if i.category is DeprecationWarning], [])
+
+    def test_bibliographic_legends_batch(self):
+        other_doc = json.loads(json.dumps(self.fulldoc))
+        other_doc['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        other_doc['article']['v14'] = [{'f': u'233', 'l': u'240'}]
+        other = Article(other_doc)
+
+        articles = [self.article, other, self.article]
+        legends = bibliographic_legends_batch(articles, language='pt')
+
+        self.assertEqual(legends, [i.bibliographic_legends(language='pt') for i in articles])
+        self.assertIn(u'233-240', legends[1]['descriptive_format'])
+
+    def test_bibliographic_legends_batch_empty(self):
+
+        self.assertEqual(bibliographic_legends_batch([]), [])
+
+    def test_multilingual(self):
+        multilingual = self.article.multilingual()
+
+        self.assertEqual(sorted(multilingual.keys()), [u'en', u'es', u'pt'])
+        self.assertEqual(multilingual[u'en'][u'title'], self.article.original_title())
+        self.assertEqual(multilingual[u'pt'][u'abstract'], self.article.translated_abstracts()[u'pt'])
+        self.assertEqual(multilingual[u'pt'][u'keywords'], self.article.keywords()[u'pt'])
+        self.assertEqual(multilingual[u'es'], {u'html': True})
+
+    def test_multilingual_iso_639_2(self):
+        multilingual = self.article.multilingual(iso_format='iso 639-2')
+
+        self.assertEqual(sorted(multilingual.keys()), [u'eng', u'por', u'spa'])
+        self.assertEqual(multilingual[u'por'][u'keywords'], self.article.keywords(iso_format='iso 639-2')[u'por'])
+
+    def test_multilingual_with_section(self):
+        self.article.data['section'] = {u'en': u'Notes', u'pt': u'Notas'}
+
+        multilingual = self.article.multilingual()
+
+        self.assertEqual(multilingual[u'en'][u'section'], u'Notes')
+        self.assertEqual(multilingual[u'pt'][u'section'], u'Notas')
+
+    def test_multilingual_is_built_once(self):
+        multilingual = self.article.multilingual()
+        del(self.article.data['article']['v12'])
+
+        self.assertEqual(self.article.multilingual(), multilingual)
+        self.assertEqual(self.article.translated_titles().keys(), {u'pt': None}.keys())
+
+    def test_multilingual_views_are_copies(self):
+        self.article.keywords()[u'en'].append(u'Changed')
+        self.article.multilingual()[u'en'][u'keywords'].append(u'Changed')
+        self.article.abstracts().pop(u'en')
+        self.article.multilingual().pop(u'pt')
+        self.article.multilingual()[u'es'][u'html'] = False
+
+        self.assertNotIn(u'Changed', self.article.keywords()[u'en'])
+        self.assertIn(u'en', self.article.abstracts())
+        self.assertIn(u'pt', self.article.multilingual())
+        self.assertEqual(self.article.multilingual()[u'es'], {u'html': True})
+        self.assertNotIn(u'Changed', self.article.multilingual()[u'en'][u'keywords'])
+
+    def test_article_has_no_instance_dict(self):
+        article = Article(self.fulldoc)
+
+        self.assertFalse(hasattr(article, '__dict__'))
+        with self.assertRaises(AttributeError):
+            article.unknown_attribute = 1
+
+    def test_article_pickle_roundtrip(self):
+        article = pickle.loads(pickle.dumps(Article(self.fulldoc, iso_format='iso 639-2')))
+
+        self.assertEqual(article.publisher_id, u'S2179-975X2011000300002')
+        self.assertEqual(article.original_language(), u'eng')
+        self.assertEqual(article.journal.electronic_issn, u'2179-975X')
+
+    def test_pickle_protocols_of_python_2(self):
+        article = Article(self.fulldoc, iso_format='iso 639-2')
+        article.citations
+
+        for protocol in (0, 1, 2):
+            copy = pickle.loads(pickle.dumps(article, protocol))
+
+            self.assertEqual(copy.original_language(), u'eng')
+            self.assertEqual(copy.issue.volume, article.issue.volume)
+            self.assertEqual(copy.journal.electronic_issn, u'2179-975X')
+            self.assertIs(type(copy.citations[0]), type(article.citations[0]))
+            self.assertEqual(copy.citations[0].data, article.citations[0].data)
+
 
 class CitationTest(unittest.TestCase):
 
@@ -5199,6 +5389,98 @@ class CitationTest(unittest.TestCase):
             ('monographic', 'institution', u'Article Institution')
         )
 
+    def _properties(self, citation):
+        result = {}
+        for name in CITATION_FIELDS:
+            value = getattr(citation, name)
+            result[name] = value() if name == 'title' else value
+
+        return result
+
+    def test_to_dict_of_each_publication_type(self):
+        records = [
+            {'v30': [{'_': u'Journal'}], 'v12': [{'_': u'Article'}], 'v65': [{'_': u'20110000'}],
+             'v14': [{'_': u'10-20'}], 'v10': [{'s': u'Sullivan', 'n': u'Mike'}]},
+            {'v18': [{'_': u'Book'}], 'v12': [{'_': u'Chapter'}], 'v17': [{'_': u'Institution'}],
+             'v63': [{'_': u'2'}]},
+            {'v18': [{'_': u'Thesis'}], 'v45': [{'_': u'20100500'}], 'v51': [{'_': u'Doctorate'}]},
+            {'v53': [{'_': u'Conference'}], 'v12': [{'_': u'Paper'}], 'v55': [{'_': u'20091000'}]},
+            {'v37': [{'_': u'http://www.scielo.br'}], 'v12': [{'_': u'Link'}],
+             'v110': [{'_': u'20120102'}]},
+        ]
+
+        for record in records:
+            citation = Citation(record)
+            self.assertEqual(Citation(record).to_dict(), self._properties(citation))
+
+    def test_to_dict_derived_fields(self):
+        citation = Citation({'v18': [{'_': u'Thesis'}], 'v45': [{'_': u'20100500'}],
+                             'v51': [{'_': u'Doctorate'}], 'v514': [{'f': u'10', 'l': u'20'}]})
+
+        result = citation.to_dict(fields=['date', 'first_page', 'last_page'])
+
+        self.assertEqual(result, {'date': u'2010-05', 'first_page': u'10', 'last_page': u'20'})
+
+    def test_to_dict_deprecated_fields(self):
+        citation = Citation({'v30': [{'_': u'Journal'}], 'v10': [{'s': u'Sullivan'}]})
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            result = citation.to_dict(fields=['authors'])
+
+        self.assertEqual(result, {'authors': [{'surname': u'Sullivan'}]})
+        self.assertTrue(issubclass(w[0].category, PendingDeprecationWarning))
+
+    def test_to_dict_field_not_allowed(self):
+        citation = Citation({})
+
+        with self.assertRaises(ValueError):
+            citation.to_dict(fields=['data'])
+
+    def test_first_author_info_of_a_journal_ignores_monographic_authors(self):
+        json_citation = {}
+        json_citation['v30'] = [{u'_': u'It is the journal title'}]
+        json_citation['v16'] = [{u's': u'Sullivan', u'n': u'Mike'}]
+        json_citation['v17'] = [{u'_': u'Book Institution'}]
+        citation = Citation(json_citation)
+
+        self.assertIsNone(citation.first_author_info)
+        self.assertIsNone(citation.monographic_authors_group)
+
+    def test_author_groups_are_decoded_once(self):
+        json_citation = {}
+        json_citation['v18'] = [{u'_': u'It is the book title'}]
+        json_citation['v10'] = [{u's': u'Sullivan', u'n': u'Mike'}]
+        json_citation['v17'] = [{u'_': u'Book Institution'}]
+        citation = Citation(json_citation)
+
+        groups = citation._author_groups()
+        citation.data['v10'] = [{u's': u'Carter', u'n': u'Rubin'}]
+
+        self.assertIs(citation._author_groups(), groups)
+        self.assertEqual(
+            citation.authors_groups,
+            {
+                'analytic': {'person': [{'surname': u'Sullivan', 'given_names': u'Mike'}]},
+                'monographic': {'institution': [u'Book Institution']},
+            }
+        )
+
+    def test_author_groups_return_copies(self):
+        json_citation = {}
+        json_citation['v18'] = [{u'_': u'It is the book title'}]
+        json_citation['v10'] = [{u's': u'Sullivan', u'n': u'Mike'}]
+        json_citation['v17'] = [{u'_': u'Book Institution'}]
+        citation = Citation(json_citation)
+
+        citation.analytic_person_authors[0]['surname'] = u'Changed'
+        citation.analytic_person_authors.append({'surname': u'Carter'})
+        citation.monographic_institution_authors.append(u'Another Institution')
+        citation.first_author_info[2]['surname'] = u'Changed'
+
+        self.assertEqual(citation.analytic_person_authors, [{'surname': u'Sullivan', 'given_names': u'Mike'}])
+        self.assertEqual(citation.monographic_institution_authors, [u'Book Institution'])
+
     def test_first_author_article(self):
         json_citation = {}
 
@@ -5780,6 +6062,63 @@ class CitationTest(unittest.TestCase):
 
         self.assertEqual(citation.mixed_citation, u'ALCHIAN, A .A., The basis of some recent advances in the theory of   management of the firm, <i>Journal of Industrial Economics</i>, v. 14, n. 4, p. 30-44, 1965.')
 
+    def test_citation_classes_by_publication_type(self):
+        records = [
+            ({'v30': [{'_': u'Journal'}]}, scielodocument.ArticleCitation),
+            ({'v53': [{'_': u'Conference'}]}, scielodocument.ConferenceCitation),
+            ({'v18': [{'_': u'Thesis'}], 'v51': [{'_': u'Doctorate'}]}, scielodocument.ThesisCitation),
+            ({'v18': [{'_': u'Book'}]}, scielodocument.BookCitation),
+            ({'v150': [{'_': u'Patent'}]}, scielodocument.PatentCitation),
+            ({'v37': [{'_': u'http://www.scielo.br'}]}, scielodocument.LinkCitation),
+            ({}, scielodocument.UndefinedCitation),
+        ]
+
+        for record, cls in records:
+            citation = Citation(record)
+            self.assertIs(type(citation), cls)
+            self.assertIsInstance(citation, Citation)
+            self.assertEqual(citation.publication_type, cls._PUBLICATION_TYPE)
+            self.assertFalse(hasattr(citation, '__dict__'))
+
+    def test_typed_properties_match_the_generic_ones(self):
+        fields = {
+            'v12': [{'_': u'Title'}], 'v25': [{'_': u'Serie'}], 'v31': [{'_': u'12'}],
+            'v32': [{'_': u'3'}], 'v33': [{'_': u'Issue &amp;amp; title'}], 'v34': [{'_': u'Part'}],
+            'v35': [{'_': u'0000-0000'}], 'v45': [{'_': u'20100500'}], 'v52': [{'_': u'Sponsor'}],
+            'v55': [{'_': u'20091000'}], 'v56': [{'_': u'Location'}], 'v63': [{'_': u'2'}],
+            'v69': [{'_': u'9788500000000'}], 'v110': [{'_': u'20120102'}],
+        }
+        types = [
+            {'v30': [{'_': u'Journal'}]},
+            {'v53': [{'_': u'Conference'}, {'_': u'Meeting'}], 'v18': [{'_': u'Proceedings'}]},
+            {'v18': [{'_': u'Thesis'}], 'v51': [{'_': u'Doctorate'}]},
+            {'v18': [{'_': u'Book'}]},
+            {'v150': [{'_': u'Patent'}]},
+            {'v37': [{'_': u'http://www.scielo.br'}]},
+            {},
+        ]
+
+        for record in types:
+            record.update(fields)
+            citation = Citation(record)
+            generic = object.__new__(Citation)
+            generic.__init__(record)
+            for name in scielodocument.TYPED_CITATION_FIELDS:
+                self.assertEqual(getattr(citation, name), getattr(generic, name), name)
+                self.assertEqual(
+                    getattr(type(citation), name).__doc__, getattr(Citation, name).__doc__)
+
+    def test_citation_has_no_instance_dict(self):
+
+        self.assertFalse(hasattr(self.citation, '__dict__'))
+
+    def test_citation_pickle_roundtrip(self):
+        citation = pickle.loads(pickle.dumps(self.citation))
+
+        self.assertEqual(citation.publication_type, u'book')
+        self.assertEqual(citation.data, self.citation.data)
+        self.assertIs(type(citation), scielodocument.BookCitation)
+
 
 class EmailHtmlRemoveTests(unittest.TestCase):
     def test_valid_email_content(self):
@@ -0,0 +1,122 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+
+from xylose import extraction
+from xylose.extraction import Extractor, SKIP, DEFAULT, DROP
+
+
+class ExtractorTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+        self.without_title = json.loads(json.dumps(self.fulldoc))
+        self.without_title['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        del(self.without_title['title'])
+
+        self.records = [self.fulldoc, self.without_title]
+        self.fields = ['publisher_id', 'original_title', ('journal_title', lambda a: a.journal.title)]
+
+    def test_extract(self):
+        rows = list(Extractor(self.fields).extract([self.fulldoc]))
+
+        self.assertEqual(rows, [{
+            'publisher_id': u'S2179-975X2011000300002',
+            'original_title': u'First adult record of Misgurnus anguillicaudatus, Cantor 1842 from Ribeira de Iguape River Basin, Brazil',
+            'journal_title': u'Acta Limnologica Brasiliensia',
+        }])
+
+    def test_skip_policy(self):
+        extractor = Extractor(self.fields, policy=SKIP)
+
+        rows = list(extractor.extract(self.records))
+
+        self.assertEqual(len(rows), 2)
+        self.assertNotIn('journal_title', rows[1])
+        self.assertEqual(rows[1]['publisher_id'], u'S2179-975X2011000300003')
+        self.assertEqual(extractor.report.errors, {'journal_title': 1})
+        self.assertEqual(extractor.report.failed_records, 1)
+
+    def test_default_policy(self):
+        extractor = Extractor(self.fields, policy=DEFAULT, defaults={'journal_title': u'Unknown'})
+
+        rows = list(extractor.extract(self.records))
+
+        self.assertEqual(rows[1]['journal_title'], u'Unknown')
+
+    def test_drop_policy_per_field(self):
+        extractor = Extractor(self.fields, policies={'journal_title': DROP})
+
+        rows = list(extractor.extract(self.records))
+
+        self.assertEqual([i['publisher_id'] for i in rows], [u'S2179-975X2011000300002'])
+        self.assertEqual(extractor.report.as_dict(), {
+            'records': 2,
+            'extracted': 1,
+            'dropped': 1,
+            'failed_records': 1,
+            'errors': {'journal_title': 1},
+        })
+
+    def test_dead_letter(self):
+        dead_letter = io.StringIO()
+        extractor = Extractor(self.fields, dead_letter=dead_letter)
+
+        list(extractor.extract(self.records))
+
+        lines = [json.loads(i) for i in dead_letter.getvalue().splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]['record']['article']['v880'][0]['_'], u'S2179-975X2011000300003')
+        self.assertTrue(lines[0]['errors']['journal_title'].startswith(u'UnavailableMetadataException'))
+
+    def test_dead_letter_of_projected_lines(self):
+        dead_letter = io.StringIO()
+        extractor = Extractor(
+            self.fields, dead_letter=dead_letter,
+            projection=set(['article', 'title', 'issue', 'collection']))
+        lines = [json.dumps(i).encode('utf-8') + b'\n' for i in self.records]
+
+        rows = list(extractor.extract_lines(lines + [b'\n']))
+
+        self.assertEqual(len(rows), 2)
+        lines = [json.loads(i) for i in dead_letter.getvalue().splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]['record'], self.without_title)
+        self.assertTrue(lines[0]['errors']['journal_title'].startswith(u'UnavailableMetadataException'))
+
+    def test_extract_lines_with_invalid_lines(self):
+        dead_letter = io.StringIO()
+        extractor = Extractor(['publisher_id'], dead_letter=dead_letter)
+        lines = ['{"article": ', json.dumps(self.fulldoc), b'{"article": [}']
+
+        rows = list(extractor.extract_lines(lines))
+
+        self.assertEqual(rows, [{'publisher_id': u'S2179-975X2011000300002'}])
+        self.assertEqual(extractor.report.as_dict(), {
+            'records': 3,
+            'extracted': 1,
+            'dropped': 2,
+            'failed_records': 2,
+            'errors': {'record': 2},
+        })
+        lines = [json.loads(i) for i in dead_letter.getvalue().splitlines()]
+        self.assertEqual([i['line'] for i in lines], [u'{"article":', u'{"article": [}'])
+        self.assertIn(u'record', lines[0]['errors'])
+
+    def test_field_not_allowed(self):
+
+        with self.assertRaises(ValueError):
+            Extractor(['unknown_field'])
+
+    def test_policy_not_allowed(self):
+
+        with self.assertRaises(ValueError):
+            Extractor(self.fields, policy=u'retry')
+
+        with self.assertRaises(ValueError):
+            Extractor(self.fields, policies={'publisher_id': u'retry'})
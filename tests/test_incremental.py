@@ -0,0 +1,138 @@
+# coding: utf-8
+
+import unittest
+import copy
+import json
+import os
+import shutil
+import tempfile
+
+from xylose.incremental import StateStore, IncrementalRun, record_digest
+from xylose.scielodocument import Article
+
+
+class IncrementalTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmpdir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.tmpdir, 'state.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _record(self, pid):
+        record = copy.deepcopy(self.fulldoc)
+        record['article']['v880'] = [{'_': pid}]
+        return record
+
+    def _run(self, records, **kwargs):
+        state = StateStore(self.state_path)
+        run = IncrementalRun(state, **kwargs)
+        result = [(status, pid) for status, pid, _ in run.process(records)]
+        state.save()
+        return result, run.report
+
+    def test_record_digest_ignores_key_order(self):
+        self.assertEqual(
+            record_digest({'a': 1, 'b': [1, 2]}),
+            record_digest({'b': [1, 2], 'a': 1})
+        )
+
+    def test_first_run_forwards_everything(self):
+        result, report = self._run([self._record(u'S1'), Article(self._record(u'S2'))])
+
+        self.assertEqual(result, [(u'new', u'S1'), (u'new', u'S2')])
+        self.assertEqual(report.new, 2)
+        self.assertEqual(report.skipped, 0)
+
+    def test_second_run_forwards_only_changes(self):
+        self._run([self._record(u'S1'), self._record(u'S2'), self._record(u'S3')])
+
+        changed = self._record(u'S2')
+        changed['article']['v12'] = [{'_': u'New title', 'l': 'en'}]
+
+        result, report = self._run([self._record(u'S1'), changed, self._record(u'S4')])
+
+        self.assertEqual(
+            result,
+            [(u'changed', u'S2'), (u'new', u'S4'), (u'deleted', u'S3')]
+        )
+        self.assertEqual(report.total, 3)
+        self.assertEqual(report.skipped, 1)
+        self.assertEqual(report.deleted, 1)
+        self.assertEqual(StateStore(self.state_path).pids(), set([u'S1', u'S2', u'S4']))
+
+    def test_trust_dates_skips_without_digest(self):
+        self._run([self._record(u'S1')])
+
+        changed = self._record(u'S1')
+        changed['article']['v12'] = [{'_': u'New title', 'l': 'en'}]
+
+        result, report = self._run([changed], trust_dates=True)
+        self.assertEqual(result, [])
+        self.assertEqual(report.skipped, 1)
+
+        changed['article']['v91'] = [{'_': u'20200101'}]
+        result, report = self._run([changed], trust_dates=True)
+        self.assertEqual(result, [(u'changed', u'S1')])
+
+    def test_trust_dates_without_date_compares_the_digest(self):
+        record = self._record(u'S1')
+        for key in ('updated_at', 'processing_date'):
+            record.pop(key, None)
+        record['article'].pop('v91', None)
+        self._run([record])
+
+        record['article']['v12'] = [{'_': u'New title', 'l': 'en'}]
+        result, report = self._run([record], trust_dates=True)
+
+        self.assertEqual(result, [(u'changed', u'S1')])
+        self.assertEqual(report.skipped, 0)
+
+        result, report = self._run([record], trust_dates=True)
+        self.assertEqual(result, [])
+        self.assertEqual(report.skipped, 1)
+
+    def test_report(self):
+        self._run([self._record(u'S1')])
+        result, report = self._run([self._record(u'S1'), self._record(u'S2')])
+
+        data = report.as_dict()
+        self.assertEqual(data['skipped'], 1)
+        self.assertEqual(data['new'], 1)
+        self.assertTrue(data['estimated_time_saved'] >= 0)
+        self.assertIn(u'1 skipped', str(report))
+
+    def test_state_is_recorded_once_the_consumer_resumes(self):
+        state = StateStore()
+        run = IncrementalRun(state)
+        forwarded = run.process([self._record(u'S1'), self._record(u'S2')])
+
+        next(forwarded)
+        self.assertNotIn(u'S1', state)
+
+        next(forwarded)
+        forwarded.close()
+        self.assertIn(u'S1', state)
+        self.assertNotIn(u'S2', state)
+
+    def test_records_without_pid_are_reported(self):
+        record = self._record(u'S1')
+        del record['article']['v880']
+
+        result, report = self._run([record, self._record(u'S2')])
+
+        self.assertEqual(result, [(u'new', u'S2')])
+        self.assertEqual(report.missing_pid, 1)
+        self.assertEqual(report.total, 2)
+        self.assertIn(u'1 without PID', str(report))
+
+    def test_state_store_in_memory(self):
+        state = StateStore()
+        state.set(u'S1', u'2020-01-01', u'abc')
+        state.save()
+
+        self.assertEqual(state.get(u'S1'), (u'2020-01-01', u'abc'))
+        self.assertEqual(len(state), 1)
@@ -1,3 +1,5 @@
+# coding: utf-8
+
 import unittest
 
 from xylose import iso3166
@@ -41,3 +43,62 @@ class ISO3166Tests(unittest.TestCase):
             iso3166.COUNTRY_CODES_ALPHA_2['CI']['name'],
             u"C\xf4te d'Ivoire"
         )
+
+    def test_normalize_country_name(self):
+
+        self.assertEqual(iso3166.normalize_country_name(u' México. '), u'mexico')
+        self.assertEqual(iso3166.normalize_country_name(u'Côte  d’Ivoire'), u'cote d ivoire')
+
+    def test_normalize_decomposed_country_name(self):
+
+        self.assertEqual(iso3166.normalize_country_name(u'Me\u0301xico'), u'mexico')
+        self.assertEqual(iso3166.normalize_country_name(u'Co\u0302te d\u2019Ivoire'), u'cote d ivoire')
+        self.assertEqual(iso3166.CountryResolver().resolve(u'Me\u0301xico'), u'MX')
+
+
+class CountryResolverTests(unittest.TestCase):
+
+    def test_resolve_exact_forms(self):
+        resolver = iso3166.CountryResolver()
+
+        self.assertEqual(resolver.resolve(u'Brazil'), u'BR')
+        self.assertEqual(resolver.resolve(u'BRA'), u'BR')
+        self.assertEqual(resolver.resolve(u'Espanha'), u'ES')
+
+    def test_resolve_normalized_forms(self):
+        resolver = iso3166.CountryResolver()
+
+        self.assertEqual(resolver.resolve(u'BRASIL.'), u'BR')
+        self.assertEqual(resolver.resolve(u' mexico '), u'MX')
+        self.assertEqual(resolver.resolve(u'Colômbia,'), u'CO')
+
+    def test_resolve_unknown(self):
+        resolver = iso3166.CountryResolver()
+
+        self.assertIsNone(resolver.resolve(u'Brazill'))
+        self.assertIsNone(resolver.resolve(u''))
+        self.assertIsNone(resolver.resolve(None))
+
+    def test_resolve_fuzzy(self):
+        resolver = iso3166.CountryResolver(fuzzy=True)
+
+        self.assertEqual(resolver.resolve(u'Brazill'), u'BR')
+        self.assertEqual(resolver.resolve(u'Argentine'), u'AR')
+        self.assertIsNone(resolver.resolve(u'Frnace'))
+        self.assertIsNone(resolver.resolve(u'xx'))
+
+    def test_ambiguous_normalized_forms_are_left_out(self):
+        resolver = iso3166.CountryResolver(forms={u'níger': u'NE', u'niger': u'NG', u'peru': u'PE'})
+
+        self.assertEqual(resolver.resolve(u'niger'), u'NG')
+        self.assertIsNone(resolver.resolve(u'NIGER.'))
+        self.assertEqual(resolver.resolve(u'Perú'), u'PE')
+
+    def test_cache_is_bounded(self):
+        resolver = iso3166.CountryResolver(cache_size=2)
+
+        for name in [u'Brasil', u'México', u'Chile', u'Peru']:
+            resolver.resolve(name)
+
+        self.assertTrue(len(resolver._cache) <= 2)
+        self.assertEqual(resolver.resolve(u'Peru'), u'PE')
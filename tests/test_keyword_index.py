@@ -0,0 +1,127 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import keyword_index
+from xylose.keyword_index import KeywordIndex, build_keyword_index
+from xylose.scielodocument import Article
+
+
+class KeywordIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmpdir = tempfile.mkdtemp()
+
+        other = json.loads(json.dumps(self.fulldoc))
+        other['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        other['article']['v85'] = [
+            {'k': u'Sexual  maturity.', 'l': u'en'},
+            {'k': u'Fish', 'l': u'en'},
+            {'k': u'Peixe', 'l': u'pt'},
+        ]
+
+        self.articles = [Article(self.fulldoc), Article(other)]
+        self.index = build_keyword_index(self.articles)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_normalize_keyword(self):
+
+        self.assertEqual(keyword_index.normalize_keyword(u' São  Paulo\nState. '), u'são paulo state')
+
+    def test_postings_roundtrip(self):
+        ids = [0, 1, 5, 127, 128, 300, 70000, 4000000000]
+        data = keyword_index.encode_postings(ids)
+
+        self.assertEqual(list(keyword_index.decode_postings(data)), ids)
+        self.assertEqual(len(keyword_index.encode_postings([0, 1, 2, 3])), 4)
+
+    def test_lookup(self):
+
+        self.assertEqual(
+            self.index.lookup(u'sexual maturity', u'en'),
+            [u'S2179-975X2011000300002', u'S2179-975X2011000300003']
+        )
+        self.assertEqual(self.index.lookup(u'Estado de São Paulo', u'pt'), [u'S2179-975X2011000300002'])
+        self.assertEqual(self.index.lookup(u'Estado de São Paulo', u'en'), [])
+        self.assertEqual(self.index.frequency(u'FISH', u'en'), 1)
+
+    def test_ids_are_a_copy(self):
+        ids = self.index.ids(u'sexual maturity', u'en')
+        ids.append(7)
+
+        self.assertEqual(list(self.index.ids(u'sexual maturity', u'en')), [0, 1])
+        self.assertEqual(len(self.index.lookup(u'sexual maturity', u'en')), 2)
+
+    def test_languages_and_terms(self):
+
+        self.assertEqual(self.index.languages(), [u'en', u'pt'])
+        self.assertIn(u'oriental weatherfish', self.index.terms(u'en'))
+        self.assertEqual(len(self.index), 2)
+        self.assertIn(u'S2179-975X2011000300003', self.index)
+
+    def test_terms_are_interned(self):
+        path = os.path.join(self.tmpdir, 'keywords.idx')
+        self.index.save(path)
+        loaded = KeywordIndex.load(path)
+        loaded.add(u'S0000-000020000001001', {u'en': [u'Fish']})
+
+        term = [i for i in loaded._postings[u'en'] if i == u'fish'][0]
+
+        self.assertIs(loaded._terms[u'fish'], term)
+
+    def test_intersection_and_related(self):
+
+        self.assertEqual(
+            self.index.intersection([u'sexual maturity', u'fish'], u'en'),
+            [u'S2179-975X2011000300003']
+        )
+        self.assertEqual(
+            self.index.related(self.articles[0].keywords()[u'en'], u'en', exclude=u'S2179-975X2011000300002'),
+            [(u'S2179-975X2011000300003', 1)]
+        )
+
+    def test_pid_already_indexed(self):
+
+        with self.assertRaises(ValueError):
+            self.index.add_article(self.articles[0])
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmpdir, 'keywords.idx')
+        self.index.save(path)
+
+        loaded = KeywordIndex.load(path)
+
+        self.assertEqual(loaded.pids, self.index.pids)
+        self.assertEqual(loaded.languages(), self.index.languages())
+        for language in self.index.languages():
+            self.assertEqual(loaded.terms(language), self.index.terms(language))
+            for term in self.index.terms(language):
+                self.assertEqual(loaded.lookup(term, language), self.index.lookup(term, language))
+
+    def test_add_to_loaded_index(self):
+        path = os.path.join(self.tmpdir, 'keywords.idx')
+        self.index.save(path)
+        loaded = KeywordIndex.load(path)
+
+        loaded.add(u'S0000-000020000001001', {u'en': [u'Fish']})
+
+        self.assertEqual(
+            loaded.lookup(u'fish', u'en'),
+            [u'S2179-975X2011000300003', u'S0000-000020000001001']
+        )
+
+    def test_load_not_an_index(self):
+        path = os.path.join(self.tmpdir, 'other.idx')
+        with open(path, 'wb') as fp:
+            fp.write(b'{}')
+
+        with self.assertRaises(ValueError):
+            KeywordIndex.load(path)
@@ -0,0 +1,168 @@
+# coding: utf-8
+
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+import shutil
+
+from xylose import profiling
+from xylose.__main__ import main
+
+
+class ProfilingTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        fulldoc = open('%s/fixtures/full_document.json' % path).read()
+        self.lines = [json.dumps(json.loads(fulldoc)) + '\n'] * 3
+        self.directory = tempfile.mkdtemp()
+        self.dump = os.path.join(self.directory, 'articles.jsonl')
+        with io.open(self.dump, 'w') as fp:
+            fp.writelines(self.lines)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_profile_extraction(self):
+        report = profiling.profile_extraction(
+            self.lines, fields=['original_title', 'affiliations'], limit=2)
+
+        self.assertEqual(report.records, 2)
+        self.assertEqual(report.extraction.extracted, 2)
+        properties = dict((i[0], i[1]) for i in report.hot_properties())
+        self.assertEqual(properties['Article.original_title'], 2)
+        self.assertEqual(properties['Article.affiliations'], 2)
+        self.assertIn('html_decode', [i[0] for i in report.hot_helpers()])
+
+    @unittest.skipIf(profiling.tracemalloc is None, 'tracemalloc not available')
+    def test_profile_extraction_memory(self):
+        report = profiling.profile_extraction(self.lines, fields=['affiliations'])
+
+        self.assertTrue(report.peak_memory > 0)
+        self.assertIn('Article', report.allocations)
+        self.assertIn(u'(Article.affiliations)', report.allocations['Article'][0][0])
+
+    def test_profile_extraction_without_memory(self):
+        report = profiling.profile_extraction(self.lines, fields=['publisher_id'], memory=False)
+
+        self.assertIsNone(report.peak_memory)
+        self.assertEqual(report.allocations, {})
+
+    def test_collapsed_stacks(self):
+        collapsed = io.StringIO()
+
+        profiling.profile_extraction(
+            self.lines, fields=['original_title'], memory=False, collapsed=collapsed)
+
+        lines = collapsed.getvalue().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, microseconds = line.rsplit(u' ', 1)
+            self.assertTrue(int(microseconds) > 0)
+        self.assertTrue(any(u'scielodocument.py:original_title' in i for i in lines))
+
+    def test_member_labels(self):
+        labels = profiling.member_labels()
+
+        self.assertIn(u'Article.original_title', labels.values())
+        self.assertIn(u'Citation.authors', labels.values())
+
+    def test_profile_extraction_typed_citation_fields(self):
+        report = profiling.profile_extraction(
+            self.lines, fields=['citations_to_dict'], memory=False, top=None)
+
+        properties = dict((i[0], i[1]) for i in report.hot_properties())
+        for name in (u'Citation.source', u'Citation.issn', u'Citation.volume'):
+            self.assertIn(name, properties)
+        self.assertNotIn(u'ArticleCitation.source', properties)
+
+    def test_main_profile(self):
+        collapsed = os.path.join(self.directory, 'stacks.txt')
+        stdout = sys.stdout
+        sys.stdout = output = io.StringIO() if sys.version_info[0] > 2 else io.BytesIO()
+        try:
+            result = main(['profile', self.dump, '--fields', 'publisher_id,original_title',
+                           '--no-memory', '--collapsed', collapsed])
+        finally:
+            sys.stdout = stdout
+
+        self.assertEqual(result, 0)
+        self.assertIn('3 records, 2 fields', output.getvalue())
+        self.assertTrue(os.path.getsize(collapsed) > 0)
+
+    def test_main_without_command(self):
+        stdout = sys.stdout
+        sys.stdout = io.StringIO() if sys.version_info[0] > 2 else io.BytesIO()
+        try:
+            result = main([])
+        finally:
+            sys.stdout = stdout
+
+        self.assertEqual(result, 2)
+
+
+@unittest.skipIf(profiling.tracemalloc is None, 'tracemalloc not available')
+class AllocationBudgetTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+
+    def test_measure_allocations(self):
+        from xylose.scielodocument import Article
+
+        objects = [Article(self.fulldoc) for i in range(5)]
+
+        measure = profiling.measure_allocations(objects, 'affiliations')
+
+        self.assertTrue(measure['blocks'] > 0)
+        self.assertTrue(measure['bytes'] > 0)
+        self.assertFalse(profiling.tracemalloc.is_tracing())
+
+    def test_measure_allocations_nothing_retained(self):
+        from xylose.scielodocument import Article
+
+        objects = [Article(self.fulldoc) for i in range(5)]
+
+        measure = profiling.measure_allocations(objects, 'publisher_id')
+
+        self.assertEqual(measure['blocks'], 0)
+        self.assertEqual(measure['bytes'], 0)
+
+    def test_allocation_budget(self):
+        from xylose.scielodocument import Article
+
+        budget = profiling.allocation_budget(
+            lambda: [Article(self.fulldoc)], repeat=2,
+            names=[('affiliations', False), ('original_title', True), ('doi', False)])
+
+        self.assertEqual(
+            sorted(budget), ['Article.affiliations', 'Article.doi', 'Article.original_title'])
+
+    def test_allocation_budget_leaves_out_failing_members(self):
+        from xylose.scielodocument import Article
+
+        budget = profiling.allocation_budget(
+            lambda: [Article(self.fulldoc)], repeat=2, names=[('unknown_member', False)])
+
+        self.assertEqual(budget, {})
+
+    def test_allocation_regressions(self):
+        baseline = {
+            'Article.affiliations': {'blocks': 36.0, 'bytes': 2982.0, 'peak_bytes': 4000.0},
+            'Article.doi': {'blocks': 0.0, 'bytes': 0.0, 'peak_bytes': 0.0},
+        }
+        current = {
+            'Article.affiliations': {'blocks': 48.0, 'bytes': 3100.0, 'peak_bytes': None},
+            'Article.doi': {'blocks': 1.0, 'bytes': 32.0, 'peak_bytes': 48.0},
+            'Article.new_property': {'blocks': 100.0, 'bytes': 9000.0, 'peak_bytes': 9000.0},
+        }
+
+        self.assertEqual(
+            profiling.allocation_regressions(baseline, current, tolerance=0.1),
+            [('Article.affiliations', 'blocks', 36.0, 48.0)]
+        )
+        self.assertEqual(profiling.allocation_regressions(baseline, current, tolerance=0.5), [])
@@ -0,0 +1,150 @@
+# coding: utf-8
+
+import unittest
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import urls
+from xylose.scielodocument import Article
+
+
+class UrlBuilderTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.article = Article(self.fulldoc)
+
+    def test_builder_matches_article_urls(self):
+        builder = urls.url_builder(u'www.scielo.br')
+        pid = self.article.publisher_id
+
+        self.assertEqual(builder.pdf_url(pid, u'pt'), self.article.pdf_url(language=u'pt'))
+        self.assertEqual(builder.html_url(pid, u'pt'), self.article.html_url(language=u'pt'))
+        self.assertEqual(builder.issue_url(pid, u'pt'), self.article.issue_url(language=u'pt'))
+
+    def test_article_html_url(self):
+
+        self.assertEqual(
+            self.article.html_url(),
+            u'http://www.scielo.br/scielo.php?script=sci_arttext&pid=S2179-975X2011000300002&lng=en&tlng=en'
+        )
+
+    def test_builder_is_cached_per_domain(self):
+
+        self.assertIs(urls.url_builder(u'www.scielo.br'), urls.url_builder(u'www.scielo.br'))
+        self.assertIsNot(urls.url_builder(u'www.scielo.br'), urls.url_builder(u'scielo.isciii.es'))
+
+    def test_builder_url_kind_not_allowed(self):
+
+        with self.assertRaises(ValueError):
+            urls.url_builder(u'www.scielo.br').url('xml', self.article.publisher_id)
+
+    def test_collection_domain(self):
+
+        self.assertEqual(urls.collection_domain(u'scl'), u'www.scielo.br')
+        self.assertIsNone(urls.collection_domain(u'xxx'))
+
+    def test_article_urls(self):
+        result = list(urls.article_urls([self.article], kinds=('html', 'issue')))
+
+        self.assertEqual(result, [
+            (self.article.html_url(language=u'en'), u'2012-04-19'),
+            (self.article.issue_url(language=u'en'), u'2012-04-19'),
+        ])
+
+    def test_article_urls_issue_given_once(self):
+        other_doc = json.loads(json.dumps(self.fulldoc))
+        other_doc['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        articles = [self.article, Article(other_doc)]
+
+        result = [i[0] for i in urls.article_urls(articles, kinds=('issue',), languages=[u'en', u'pt'])]
+
+        self.assertEqual(len(result), 2)
+
+    def test_article_urls_without_domain(self):
+        self.fulldoc['collection'] = u'xxx'
+        del(self.fulldoc['title']['v690'])
+
+        self.assertEqual(list(urls.article_urls([Article(self.fulldoc)])), [])
+
+
+class SitemapWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _read(self, path):
+        opener = gzip.open if path.endswith('.gz') else io.open
+
+        with opener(path, 'rb') as fp:
+            return fp.read().decode('utf-8')
+
+    def test_split_by_max_urls(self):
+        with urls.SitemapWriter(self.tmpdir, max_urls=2) as writer:
+            for i in range(5):
+                writer.add(u'http://www.scielo.br/%d?a=1&b=2' % i, u'2012-04-19')
+
+        self.assertEqual(writer.total, 5)
+        self.assertEqual(
+            [os.path.basename(i) for i in writer.files],
+            ['sitemap-00001.xml', 'sitemap-00002.xml', 'sitemap-00003.xml']
+        )
+        content = self._read(writer.files[0])
+        self.assertTrue(content.startswith(u'<?xml version="1.0" encoding="UTF-8"?>'))
+        self.assertTrue(content.endswith(u'</urlset>\n'))
+        self.assertEqual(content.count(u'<url>'), 2)
+        self.assertIn(
+            u'<url><loc>http://www.scielo.br/0?a=1&amp;b=2</loc><lastmod>2012-04-19</lastmod></url>',
+            content
+        )
+
+    def test_split_by_max_bytes(self):
+        with urls.SitemapWriter(self.tmpdir, max_bytes=400) as writer:
+            for i in range(10):
+                writer.add(u'http://www.scielo.br/%d' % i)
+
+        self.assertTrue(len(writer.files) > 1)
+        for path in writer.files:
+            self.assertTrue(os.path.getsize(path) <= 400)
+
+    def test_compress(self):
+        with urls.SitemapWriter(self.tmpdir, compress=True) as writer:
+            writer.add(u'http://www.scielo.br/1')
+
+        self.assertTrue(writer.files[0].endswith('.xml.gz'))
+        self.assertIn(u'<loc>http://www.scielo.br/1</loc>', self._read(writer.files[0]))
+
+    def test_max_urls_not_allowed(self):
+
+        with self.assertRaises(ValueError):
+            urls.SitemapWriter(self.tmpdir, max_urls=0)
+
+    def test_write_sitemaps_with_index(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        articles = [Article(fulldoc)] * 3
+
+        files = urls.write_sitemaps(
+            articles, self.tmpdir, base_url=u'http://www.scielo.br/sitemaps', max_urls=2)
+
+        self.assertEqual(len(files), 3)
+        index = self._read(files[-1])
+        self.assertIn(u'<loc>http://www.scielo.br/sitemaps/sitemap-00002.xml</loc>', index)
+
+    def test_write_url_list(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        article = Article(json.loads(open('%s/fixtures/full_document.json' % path).read()))
+        fp = io.StringIO()
+
+        total = urls.write_url_list([article], fp, kinds=('html', 'pdf'))
+
+        self.assertEqual(total, 2)
+        self.assertEqual(fp.getvalue().splitlines(), [article.html_url(), article.pdf_url()])
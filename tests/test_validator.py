@@ -0,0 +1,111 @@
+# coding: utf-8
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+
+from xylose import validator
+from xylose.scielodocument import Article, Citation
+
+
+class ValidatorTests(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.dirname(os.path.realpath(__file__))
+        self.fulldoc = json.loads(open('%s/fixtures/full_document.json' % path).read())
+        self.tmpdir = tempfile.mkdtemp()
+
+        without_title = json.loads(json.dumps(self.fulldoc))
+        without_title['article']['v880'] = [{'_': u'S2179-975X2011000300003'}]
+        del(without_title['title'])
+
+        bad_citation = json.loads(json.dumps(self.fulldoc))
+        bad_citation['article']['v880'] = [{'_': u'S2179-975X2011000300004'}]
+        bad_citation['citations'][0]['v701'] = [{'_': u'1a'}]
+
+        without_pid = json.loads(json.dumps(self.fulldoc))
+        del(without_pid['article']['v880'])
+
+        self.lines = [json.dumps(i) for i in [self.fulldoc, without_title, bad_citation, without_pid]]
+        self.lines.insert(1, u'')
+        self.lines.append(u'{"article": ')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def failure(self, report, class_name, name, exception):
+        for item in report.as_dict()['failures']:
+            if (item['class'], item['property'], item['exception']) == (class_name, name, exception):
+                return item
+
+    def test_members(self):
+        members = dict(validator.members(Article))
+
+        self.assertFalse(members['publisher_id'])
+        self.assertTrue(members['original_title'])
+        self.assertNotIn('_multilingual_fields', members)
+        self.assertTrue(members['fingerprint'])
+        self.assertNotIn('bibliographic_legends_batch', members)
+        self.assertIn('index_number', dict(validator.members(Citation)))
+
+    def test_validate_record(self):
+        failures = validator.validate_record(self.fulldoc)
+
+        self.assertNotIn('Article', [i[0] for i in failures])
+        self.assertNotIn('Citation', [i[0] for i in failures])
+
+    def assertReport(self, report):
+        self.assertEqual(report.records, 5)
+
+        item = self.failure(report, 'Article', 'journal', 'UnavailableMetadataException')
+        self.assertEqual(item['samples'], [u'S2179-975X2011000300003'])
+
+        item = self.failure(report, 'Citation', 'index_number', 'ValueError')
+        self.assertEqual(item['count'], 1)
+        self.assertEqual(item['samples'], [u'S2179-975X2011000300004'])
+
+        item = self.failure(report, 'Article', 'publisher_id', 'KeyError')
+        self.assertEqual(item['samples'], [u'line 5'])
+
+        item = self.failure(report, 'record', 'json', 'ValueError') or self.failure(
+            report, 'record', 'json', 'JSONDecodeError')
+        self.assertEqual(item['samples'], [u'line 6'])
+
+    def test_validate_corpus(self):
+
+        self.assertReport(validator.validate_corpus(self.lines, processes=1, chunk_size=2, backend='json'))
+
+    def test_validate_corpus_in_a_process_pool(self):
+
+        self.assertReport(validator.validate_corpus(self.lines, processes=2, chunk_size=2, backend='json'))
+
+    def test_validate_corpus_with_one_pending_chunk(self):
+
+        self.assertReport(validator.validate_corpus(
+            iter(self.lines), processes=2, chunk_size=1, backend='json', max_pending=1))
+
+    def test_chunk_size_not_allowed(self):
+
+        with self.assertRaises(ValueError):
+            validator.validate_corpus(self.lines, chunk_size=0)
+
+    def test_sample_size(self):
+        lines = [json.dumps(self.fulldoc)] * 4
+
+        report = validator.validate_corpus(lines, processes=1, sample_size=1)
+
+        for item in report.as_dict()['failures']:
+            self.assertTrue(len(item['samples']) <= 1)
+
+    def test_write(self):
+        path = os.path.join(self.tmpdir, 'report.json')
+        report = validator.validate_corpus(self.lines, processes=1, backend='json')
+
+        report.write(path)
+
+        with open(path) as fp:
+            data = json.load(fp)
+        self.assertEqual(data['records'], 5)
+        self.assertEqual(data['failed_records'], report.failed_records)
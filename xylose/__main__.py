@@ -0,0 +1,64 @@
+# coding: utf-8
+"""
+Command line interface of xylose.
+
+    $ python -m xylose profile articles.jsonl --fields publisher_id,original_title --limit 1000
+"""
+import sys
+import argparse
+
+from xylose import corpus, profiling
+
+
+def profile(args):
+    fields = [i.strip() for i in args.fields.split(',') if i.strip()] if args.fields else None
+
+    report = profiling.profile_file(
+        args.dump,
+        collapsed_path=args.collapsed,
+        fields=fields,
+        limit=args.limit,
+        backend=args.backend,
+        iso_format=args.iso_format,
+        memory=not args.no_memory,
+        top=args.top,
+    )
+
+    print(report)
+
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='xylose', description='SciELO ISIS2JSON documents tools.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    parser_profile = subparsers.add_parser(
+        'profile', help='profile the extraction of fields of a JSON lines dump')
+    parser_profile.add_argument('dump', help='the JSON lines dump, one article per line')
+    parser_profile.add_argument(
+        '--fields', help='comma separated Article properties, all of them by default')
+    parser_profile.add_argument('--limit', type=int, help='maximum number of records')
+    parser_profile.add_argument(
+        '--backend', choices=corpus.available_backends(), help='JSON decoding backend')
+    parser_profile.add_argument(
+        '--iso-format', choices=['iso 639-1', 'iso 639-2'], help='language format')
+    parser_profile.add_argument(
+        '--top', type=int, default=20, help='number of properties and allocation sites reported')
+    parser_profile.add_argument(
+        '--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser_profile.add_argument(
+        '--collapsed', help='write flamegraph collapsed stacks to this path')
+    parser_profile.set_defaults(func=profile)
+
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# coding: utf-8
+"""
+Asyncio flavour of the corpus loading layer. Kept apart from xylose.corpus
+because the async generator syntax is not available in Python 2.
+"""
+import asyncio
+from collections import deque
+
+from xylose import corpus
+
+try:
+    _running_loop = asyncio.get_running_loop
+except AttributeError:  # Python 3.6
+    _running_loop = asyncio.get_event_loop
+
+
+async def _aiter_batches(stream, batch_size):
+    batch = []
+
+    async for line in stream:
+        if not line.strip():
+            continue
+
+        batch.append(line)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _aiter_parsed(stream, parse_batch, executor, batch_size, prefetch, backend, iso_format):
+    if batch_size < 1 or prefetch < 1:
+        raise ValueError('batch_size and prefetch must be greater than 0')
+
+    corpus.get_backend(backend)
+
+    loop = _running_loop()
+    pending = deque()
+
+    try:
+        async for batch in _aiter_batches(stream, batch_size):
+            pending.append(
+                loop.run_in_executor(executor, parse_batch, batch, backend, iso_format)
+            )
+
+            if len(pending) < prefetch:
+                continue
+
+            for item in await pending.popleft():
+                yield item
+
+        while pending:
+            for item in await pending.popleft():
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def aiter_records(stream, executor=None, batch_size=100, prefetch=4, backend=None):
+    """
+    This method decodes the JSON lines of an asynchronous source, such as an
+    asyncio.StreamReader or an async file object, yielding one record per non
+    blank line.
+
+    Keyword arguments:
+    executor -- the concurrent.futures executor where the batches are
+    decoded, the loop default executor is used when it is None.
+    batch_size -- the number of lines decoded by each executor call.
+    prefetch -- the maximum number of batches in flight. The stream is not
+    read further while the consumer does not take the decoded items.
+    backend -- the JSON backend name, see xylose.corpus.get_backend.
+
+    An asyncio.StreamReader raises ValueError on lines longer than its limit,
+    64 KiB by default, and the documents with their full text often are.
+    Create the reader with a larger limit, e.g.
+    asyncio.open_connection(host, port, limit=2 ** 24).
+    """
+
+    return _aiter_parsed(
+        stream, corpus._parse_records, executor, batch_size, prefetch, backend, None
+    )
+
+
+def aiter_articles(stream, executor=None, batch_size=100, prefetch=4, backend=None, iso_format=None):
+    """
+    This method yields the Article objects of the JSON lines of an
+    asynchronous source. The decoding of the JSON and the building of the
+    objects are offloaded to the executor in batches.
+
+    async for article in corpus.aiter_articles(reader, executor=pool):
+        ...
+
+    See aiter_records for the keyword arguments.
+    """
+
+    return _aiter_parsed(
+        stream, corpus._parse_articles, executor, batch_size, prefetch, backend, iso_format
+    )
@@ -29,6 +29,99 @@ def similarity_ratio(value1, value2):
     return s.ratio()
 
 
+class SimilarityMatcher(object):
+    """
+    Tells whether the SequenceMatcher ratio of two values is above a
+    threshold.
+    """
+
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+
+    def matches(self, value1, value2):
+
+        return similarity_ratio(value1, value2) > self.threshold
+
+    def best(self, value, choices):
+        """
+        This method retrieves the greatest (ratio, key) of the given value
+        against the (name, key) choices, if its ratio is above the threshold.
+        """
+        similar = sorted(
+            (similarity_ratio(name, value), key) for name, key in choices
+        )
+
+        if similar and similar[-1][0] > self.threshold:
+            return similar[-1]
+
+
+class TieredSimilarityMatcher(SimilarityMatcher):
+    """
+    A SimilarityMatcher that computes the exact ratio only when the cheaper
+    upper bounds of the ratio, the length bound (the real_quick_ratio) and
+    the characters bound (the quick_ratio), do not already reject the pair.
+    The results are the ones of SimilarityMatcher.
+    """
+
+    def __init__(self, threshold=0.8):
+        super(TieredSimilarityMatcher, self).__init__(threshold)
+        self.rejected_by_length = 0
+        self.rejected_by_characters = 0
+        self.computed = 0
+
+    def _matcher(self, value1, value2, minimum, inclusive=False):
+        """
+        This method retrieves the SequenceMatcher of the values, or None when
+        an upper bound of their ratio proves it is not above the given
+        minimum (or equal to it, when inclusive).
+        """
+        total = len(value1) + len(value2)
+
+        if total:
+            bound = 2.0 * min(len(value1), len(value2)) / total
+            if bound < minimum or (bound == minimum and not inclusive):
+                self.rejected_by_length += 1
+                return None
+
+        matcher = SequenceMatcher(None, value1, value2)
+
+        bound = matcher.quick_ratio()
+        if bound < minimum or (bound == minimum and not inclusive):
+            self.rejected_by_characters += 1
+            return None
+
+        self.computed += 1
+
+        return matcher
+
+    def matches(self, value1, value2):
+        matcher = self._matcher(value1, value2, self.threshold)
+
+        return matcher is not None and matcher.ratio() > self.threshold
+
+    def best(self, value, choices):
+        best = None
+
+        for name, key in choices:
+            # A choice tying the best ratio may still win it by the key order.
+            if best is None:
+                matcher = self._matcher(name, value, self.threshold)
+            else:
+                matcher = self._matcher(name, value, best[0], inclusive=True)
+
+            if matcher is None:
+                continue
+
+            ratio = matcher.ratio()
+            if ratio > self.threshold and (best is None or (ratio, key) > best):
+                best = (ratio, key)
+
+        return best
+
+
+MATCHER = TieredSimilarityMatcher()
+
+
 def normalize_value(s):
     s = remove_diacritics(s)
     s = s.upper()
@@ -55,14 +148,10 @@ class States:
     def get_state_abbrev(self, state):
         return self._states.get(state)
 
-    def get_state_abbrev_by_similarity(self, state):
-        similar = [
-            (similarity_ratio(name, state), abbrev)
-            for name, abbrev in self._states.items()
-        ]
-        similar = sorted(similar)
-        if similar[-1][0] > 0.8:
-            return similar[-1][1]
+    def get_state_abbrev_by_similarity(self, state, matcher=None):
+        best = (matcher or MATCHER).best(state, self._states.items())
+        if best:
+            return best[1]
 
     def normalize(self, state):
         state = remove_suffixes_and_prefixes(state)
@@ -74,13 +163,13 @@ class States:
         return state_abbrev
 
 
-def is_a_match(original, normalized, states=None):
+def is_a_match(original, normalized, states=None, matcher=None):
     original = normalize_value(original)
     normalized = normalize_value(normalized)
     if original == normalized:
         return True
 
-    if similarity_ratio(original, normalized) > 0.8:
+    if (matcher or MATCHER).matches(original, normalized):
         return True
 
     if states and hasattr(states, 'normalize'):
@@ -0,0 +1,187 @@
+# coding: utf-8
+"""
+Batch normalization of the affiliations of a corpus.
+
+The same affiliations (v70) and normalized affiliations (v240) repeat in
+thousands of documents of a collection. The AffiliationNormalizer decodes
+and resolves each distinct raw occurrence once, checks the conflicts of
+each distinct pair of affiliation and normalized affiliation once, and
+fans the results back out to the documents. The results are the ones of
+Article.affiliations and Article.normalized_affiliations.
+
+    normalizer = AffiliationNormalizer()
+    for pid, result in normalizer.normalize_corpus(corpus.iter_articles(dump, fields={'article'})):
+        ...
+    print(normalizer.report)
+"""
+import time
+
+from xylose.aff_validator import has_conflicts
+from xylose.scielodocument import affiliation, normalized_affiliation
+
+_CONFLICT_LABELS = ('country_iso_3166', 'state', 'city')
+
+
+def _raw_key(aff):
+
+    return tuple(sorted(aff.items()))
+
+
+class AffiliationReport(object):
+
+    def __init__(self):
+        self.documents = 0
+        self.occurrences = 0
+        self.unique = 0
+        self.comparisons = 0
+        self.unique_comparisons = 0
+        self.normalization_time = 0.0
+
+    @property
+    def dedupe_ratio(self):
+        """
+        The number of occurrences (affiliations and conflict checks) per
+        distinct one.
+        """
+        unique = self.unique + self.unique_comparisons
+
+        if not unique:
+            return 0.0
+
+        return float(self.occurrences + self.comparisons) / unique
+
+    @property
+    def estimated_time_saved(self):
+        """
+        The time the repeated occurrences would have taken, given the mean
+        time of the distinct ones.
+        """
+        unique = self.unique + self.unique_comparisons
+
+        if not unique:
+            return 0.0
+
+        repeated = self.occurrences + self.comparisons - unique
+
+        return repeated * self.normalization_time / unique
+
+    def as_dict(self):
+
+        return {
+            'documents': self.documents,
+            'occurrences': self.occurrences,
+            'unique': self.unique,
+            'comparisons': self.comparisons,
+            'unique_comparisons': self.unique_comparisons,
+            'dedupe_ratio': self.dedupe_ratio,
+            'normalization_time': self.normalization_time,
+            'estimated_time_saved': self.estimated_time_saved,
+        }
+
+    def __str__(self):
+
+        return (
+            u'%d documents: %d affiliations (%d distinct), %d conflict checks '
+            u'(%d distinct), dedupe ratio %.1f. %.2fs spent, about %.2fs saved.' % (
+                self.documents, self.occurrences, self.unique, self.comparisons,
+                self.unique_comparisons, self.dedupe_ratio,
+                self.normalization_time, self.estimated_time_saved
+            )
+        )
+
+
+class AffiliationNormalizer(object):
+
+    def __init__(self):
+        self._affiliations = {}
+        self._normalized = {}
+        self._conflicts = {}
+        self.report = AffiliationReport()
+
+    def _cached(self, cache, function, aff):
+        report = self.report
+        report.occurrences += 1
+        key = _raw_key(aff)
+
+        try:
+            result = cache[key]
+        except KeyError:
+            start = time.time()
+            result = cache[key] = function(aff)
+            report.normalization_time += time.time() - start
+            report.unique += 1
+
+        return dict(result) if result is not None else None
+
+    def affiliation(self, aff):
+        """
+        This method retrieves the affiliation data of a v70 occurrence. See
+        scielodocument.affiliation.
+        """
+
+        return self._cached(self._affiliations, affiliation, aff)
+
+    def normalized_affiliation(self, aff):
+        """
+        This method retrieves the normalized affiliation data of a v240
+        occurrence. See scielodocument.normalized_affiliation.
+        """
+
+        return self._cached(self._normalized, normalized_affiliation, aff)
+
+    def has_conflicts(self, original_aff, normaff):
+        """
+        This method retrieves the conflicts of aff_validator.has_conflicts,
+        checked once per distinct country, state and city values.
+        """
+        if not original_aff:
+            return has_conflicts(original_aff, normaff)
+
+        report = self.report
+        report.comparisons += 1
+        key = tuple(original_aff.get(i) for i in _CONFLICT_LABELS) + tuple(
+            normaff.get(i) for i in _CONFLICT_LABELS)
+
+        try:
+            conflicts = self._conflicts[key]
+        except KeyError:
+            start = time.time()
+            conflicts = self._conflicts[key] = has_conflicts(original_aff, normaff)
+            report.normalization_time += time.time() - start
+            report.unique_comparisons += 1
+
+        return list(conflicts)
+
+    def normalize(self, article):
+        """
+        This method retrieves a dict with the 'affiliations' and the
+        'normalized_affiliations' of the given Article, as retrieved by the
+        Article properties.
+        """
+        data = article.data['article']
+        self.report.documents += 1
+
+        affiliations = [self.affiliation(aff) for aff in data.get('v70', [])] or None
+
+        normalized = [self.normalized_affiliation(aff) for aff in data.get('v240', [])]
+        normalized = [aff for aff in normalized if aff is not None]
+
+        result = {'affiliations': affiliations, 'normalized_affiliations': None}
+
+        if normalized:
+            indexed = dict((aff['index'], aff) for aff in affiliations or [])
+            result['normalized_affiliations'] = [
+                normaff for normaff in normalized
+                if normaff.get('index') and not self.has_conflicts(indexed.get(normaff['index']), normaff)
+            ]
+
+        return result
+
+    def normalize_corpus(self, articles):
+        """
+        This method yields (pid, result) tuples for the given Article
+        objects, see normalize.
+        """
+
+        for article in articles:
+            yield article.publisher_id, self.normalize(article)
@@ -0,0 +1,233 @@
+# coding: utf-8
+"""
+Out of line storage for the fulltext HTML bodies of the articles.
+
+A BodyStore appends the bodies of the records to a side file and keeps an
+offset table, persisted beside it as JSON. The 'body' of a detached record
+is replaced by a LazyBodies mapping, which holds only the offsets and reads
+each body from the side file when it is accessed, through a LRU cache of
+the recently read bodies.
+
+    store = BodyStore('/var/cache/bodies.dat')
+    for article in corpus.iter_articles(dump, body_store=store):
+        cache[article.publisher_id] = article
+    store.flush()
+"""
+import io
+import os
+import json
+import threading
+from collections import OrderedDict
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+from xylose.corpus import FieldNotLoadedException
+
+
+class LazyBodies(Mapping):
+    """
+    A read only {language: body} mapping whose bodies are read from a
+    BodyStore when they are accessed. It is not a dict, so dict(bodies) and
+    the copies see the bodies, never the offsets. The json module does not
+    encode it; use dict(bodies), or tools.json_default as the encoder default.
+    """
+
+    __slots__ = ('_store', '_offsets')
+
+    def __init__(self, store, offsets):
+        self._store = store
+        self._offsets = dict(offsets)
+
+    def offsets(self):
+
+        return dict(self._offsets)
+
+    def __getitem__(self, language):
+
+        return self._store.read(self._offsets[language])
+
+    def __contains__(self, language):
+
+        return language in self._offsets
+
+    def __iter__(self):
+
+        return iter(self._offsets)
+
+    def __len__(self):
+
+        return len(self._offsets)
+
+    def __repr__(self):
+
+        return 'LazyBodies(%r)' % sorted(self._offsets)
+
+    def __reduce__(self):
+
+        return (dict, (list(self.items()),))
+
+
+class BodyStore(object):
+
+    def __init__(self, path, cache_size=128):
+        """
+        Create a BodyStore object given the path of the side file. The offset
+        table is kept in the same path plus '.idx'. Existing files are
+        reopened, so a store can be written by a loading job and read by
+        other processes.
+
+        Keyword arguments:
+        cache_size -- the number of recently read bodies kept in memory.
+        """
+        self.path = path
+        self.index_path = path + '.idx'
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._index = {}
+
+        if os.path.exists(self.index_path):
+            with io.open(self.index_path, encoding='utf-8') as fp:
+                self._index = json.load(fp)
+
+        self._file = open(path, 'a+b')
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+
+        return len(self._index)
+
+    def __contains__(self, key):
+
+        return key in self._index
+
+    def _read_bytes(self, offset):
+        self._file.flush()
+        self._file.seek(offset[0])
+
+        return self._file.read(offset[1])
+
+    def put(self, key, bodies):
+        """
+        This method appends the {language: body} bodies of the given key to
+        the side file and returns their LazyBodies mapping. The bodies equal
+        to the ones already stored for the key are not appended again, so
+        reloading the same documents does not grow the side file.
+        """
+        offsets = {}
+
+        with self._lock:
+            stored = self._index.get(key) or {}
+
+            for language, body in bodies.items():
+                data = body.encode('utf-8')
+
+                offset = stored.get(language)
+                if offset is not None and offset[1] == len(data) and self._read_bytes(offset) == data:
+                    offsets[language] = tuple(offset)
+                    continue
+
+                self._file.seek(0, os.SEEK_END)
+                offsets[language] = (self._file.tell(), len(data))
+                self._file.write(data)
+
+            self._index[key] = offsets
+
+        return LazyBodies(self, offsets)
+
+    def get(self, key):
+        """
+        This method retrieves the LazyBodies mapping of the given key, or
+        None when the store does not have it.
+        """
+        offsets = self._index.get(key)
+
+        if offsets is None:
+            return None
+
+        return LazyBodies(self, dict((k, tuple(v)) for k, v in offsets.items()))
+
+    def read(self, offset):
+        """
+        This method retrieves the body stored at the given (offset, length).
+        """
+        offset = tuple(offset)
+
+        with self._lock:
+            # Moved to the end of the cache, as the most recently read.
+            body = self._cache.pop(offset, None)
+            if body is not None:
+                self._cache[offset] = body
+                return body
+
+            body = self._read_bytes(offset).decode('utf-8')
+
+            self._cache[offset] = body
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return body
+
+    def detach(self, record, key=None):
+        """
+        This method moves the bodies of the given record (isis2json type 3
+        SciELO document) to the store, replacing its 'body' with a
+        LazyBodies mapping. The key defaults to the document PID (v880).
+        """
+        try:
+            bodies = record.get('body')
+        except FieldNotLoadedException:
+            return record
+
+        if not bodies or isinstance(bodies, LazyBodies):
+            return record
+
+        key = key or record['article']['v880'][0]['_']
+        record['body'] = self.put(key, bodies)
+
+        return record
+
+    def attach(self, record, key=None):
+        """
+        This method replaces the 'body' of the given record with the
+        LazyBodies mapping stored for it, if any.
+        """
+        key = key or record['article']['v880'][0]['_']
+        bodies = self.get(key)
+
+        if bodies is not None:
+            record['body'] = bodies
+
+        return record
+
+    def flush(self):
+        """
+        This method flushes the side file and persists the offset table.
+        """
+        with self._lock:
+            self._file.flush()
+
+            tmp_path = self.index_path + '.tmp'
+            index = json.dumps(self._index, ensure_ascii=False)
+            if isinstance(index, bytes):  # Python 2, ASCII only index
+                index = index.decode('utf-8')
+
+            with io.open(tmp_path, 'w', encoding='utf-8') as fp:
+                fp.write(index)
+            getattr(os, 'replace', os.rename)(tmp_path, self.index_path)
+
+    def close(self):
+        if self._file.closed:
+            return
+
+        self.flush()
+        self._file.close()
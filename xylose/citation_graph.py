@@ -0,0 +1,333 @@
+# coding: utf-8
+"""
+Compact citation graph.
+
+The citing -> cited graph of a corpus is kept in compressed sparse row
+(CSR) arrays: the PIDs are mapped to integer node ids, indptr holds, for
+each node, the offset of its first cited node in indices, and indices holds
+the cited node ids, sorted per node. The arrays use NumPy when it is
+installed and are saved as raw array files beside a JSON header.
+
+    resolver = CitationResolver(corpus.iter_articles(open('articles.jsonl', 'rb')))
+    graph = build_citation_graph(resolver, corpus.iter_records(open('articles.jsonl', 'rb')))
+    graph.save('/var/cache/citations')
+"""
+import io
+import sys
+import json
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Typecodes of the saved arrays. Python 2 has no 'q' typecode; its 'l' is
+# 64 bits wide on the 64 bits Unix platforms.
+try:
+    array('q')
+    INDPTR_TYPECODE = 'q'
+except ValueError:
+    INDPTR_TYPECODE = 'l'
+INDICES_TYPECODE = 'i'
+
+
+def _write_array(path, data):
+    # array.tofile needs a builtin file object on Python 2.
+    with io.open(path, 'wb') as fp:
+        fp.write(data.tobytes() if hasattr(data, 'tobytes') else data.tostring())
+
+
+def _read_array(path, typecode, count):
+    data = array(typecode)
+
+    with io.open(path, 'rb') as fp:
+        raw = fp.read(count * data.itemsize)
+
+    if len(raw) != count * data.itemsize:
+        raise ValueError('Truncated graph file ({0})'.format(path))
+
+    if hasattr(data, 'frombytes'):
+        data.frombytes(raw)
+    else:
+        data.fromstring(raw)
+
+    return data
+
+
+def journal_key(pid):
+    """
+    This method retrieves the ISSN part of a document PID. Ex: S2179-975X2011000300002 -> 2179-975X
+    """
+
+    return pid[1:10]
+
+
+def _compress(size, sources, targets):
+    """
+    This method retrieves the (indptr, indices) CSR arrays of the given
+    edges, without duplicates and with the targets sorted per source.
+    """
+    if numpy is not None:
+        sources = numpy.frombuffer(sources, dtype=numpy.int32) if len(sources) else numpy.zeros(0, dtype=numpy.int32)
+        targets = numpy.frombuffer(targets, dtype=numpy.int32) if len(targets) else numpy.zeros(0, dtype=numpy.int32)
+        edges = numpy.unique(sources.astype(numpy.int64) * max(size, 1) + targets)
+        indices = (edges % max(size, 1)).astype(numpy.int32)
+        counts = numpy.bincount((edges // max(size, 1)).astype(numpy.intp), minlength=size)
+        indptr = numpy.zeros(size + 1, dtype=numpy.dtype(INDPTR_TYPECODE))
+        numpy.cumsum(counts, out=indptr[1:])
+        return array(INDPTR_TYPECODE, indptr.tobytes()), array(INDICES_TYPECODE, indices.tobytes())
+
+    rows = [set() for i in range(size)]
+    for source, target in zip(sources, targets):
+        rows[source].add(target)
+
+    indptr = array(INDPTR_TYPECODE, [0])
+    indices = array(INDICES_TYPECODE)
+    for row in rows:
+        indices.extend(sorted(row))
+        indptr.append(len(indices))
+
+    return indptr, indices
+
+
+class CitationGraphBuilder(object):
+
+    def __init__(self):
+        self.pids = []
+        self._ids = {}
+        self._sources = array(INDICES_TYPECODE)
+        self._targets = array(INDICES_TYPECODE)
+
+    def node(self, pid):
+        """
+        This method retrieves the node id of the given PID, adding it when
+        it is new.
+        """
+        node = self._ids.get(pid)
+
+        if node is None:
+            node = self._ids[pid] = len(self.pids)
+            self.pids.append(pid)
+
+        return node
+
+    def add(self, citing_pid, cited_pids=()):
+        """
+        This method adds the citing document and its edges to the cited
+        documents.
+        """
+        source = self.node(citing_pid)
+
+        for cited_pid in cited_pids:
+            self._sources.append(source)
+            self._targets.append(self.node(cited_pid))
+
+    def build(self):
+
+        indptr, indices = _compress(len(self.pids), self._sources, self._targets)
+
+        return CitationGraph(list(self.pids), indptr, indices)
+
+
+def build_citation_graph(resolver, records):
+    """
+    This method builds the CitationGraph of the given records or Article
+    objects, resolving their citations with the given CitationResolver.
+    """
+    builder = CitationGraphBuilder()
+    citing, cited = None, []
+
+    for citing_pid, index_number, cited_pid, method in resolver.join(records):
+        if citing_pid != citing:
+            if citing is not None:
+                builder.add(citing, cited)
+            citing, cited = citing_pid, []
+        if cited_pid is not None:
+            cited.append(cited_pid)
+
+    if citing is not None:
+        builder.add(citing, cited)
+
+    return builder.build()
+
+
+class CitationGraph(object):
+
+    def __init__(self, pids, indptr, indices):
+        """
+        Create a CitationGraph object given the PIDs of the node ids and the
+        CSR arrays. See CitationGraphBuilder for building them.
+        """
+        self.pids = pids
+        self.indptr = indptr
+        self.indices = indices
+        self._ids = dict((pid, i) for i, pid in enumerate(pids))
+        self._in_degrees = None
+        self._transposed = None
+
+    def __len__(self):
+
+        return len(self.pids)
+
+    def __contains__(self, pid):
+
+        return pid in self._ids
+
+    @property
+    def edges(self):
+
+        return len(self.indices)
+
+    def node(self, pid):
+        try:
+            return self._ids[pid]
+        except KeyError:
+            raise ValueError('PID not in the graph ({0})'.format(pid))
+
+    def _as_numpy(self, data, dtype):
+        if numpy is None:
+            return data
+
+        return numpy.frombuffer(data, dtype=dtype) if len(data) else numpy.zeros(0, dtype=dtype)
+
+    def out_degrees(self):
+        """
+        This method retrieves the number of cited documents of each node, as
+        a NumPy array when NumPy is installed.
+        """
+        indptr = self.indptr
+
+        if numpy is not None:
+            return numpy.diff(self._as_numpy(indptr, numpy.dtype(INDPTR_TYPECODE)))
+
+        return array(INDPTR_TYPECODE, [indptr[i + 1] - indptr[i] for i in range(len(self.pids))])
+
+    def in_degrees(self):
+        """
+        This method retrieves the number of citing documents of each node, as
+        a NumPy array when NumPy is installed.
+        """
+        if self._in_degrees is None:
+            if numpy is not None:
+                self._in_degrees = numpy.bincount(
+                    self._as_numpy(self.indices, numpy.int32), minlength=len(self.pids))
+            else:
+                degrees = array(INDPTR_TYPECODE, [0]) * len(self.pids)
+                for node in self.indices:
+                    degrees[node] += 1
+                self._in_degrees = degrees
+
+        return self._in_degrees
+
+    def out_degree(self, pid):
+        node = self.node(pid)
+
+        return int(self.indptr[node + 1] - self.indptr[node])
+
+    def in_degree(self, pid):
+
+        return int(self.in_degrees()[self.node(pid)])
+
+    def cited(self, pid):
+        """
+        This method retrieves the PIDs cited by the given document.
+        """
+        node = self.node(pid)
+
+        return [self.pids[i] for i in self.indices[self.indptr[node]:self.indptr[node + 1]]]
+
+    def citing(self, pid):
+        """
+        This method retrieves the PIDs of the documents citing the given one.
+        The transposed graph is built on the first call.
+        """
+        if self._transposed is None:
+            sources = array(INDICES_TYPECODE)
+            indptr = self.indptr
+            for node in range(len(self.pids)):
+                sources.extend([node] * int(indptr[node + 1] - indptr[node]))
+            self._transposed = _compress(len(self.pids), self.indices, sources)
+
+        indptr, indices = self._transposed
+        node = self.node(pid)
+
+        return [self.pids[i] for i in indices[indptr[node]:indptr[node + 1]]]
+
+    def degree_statistics(self):
+        """
+        This method retrieves the min, max and mean in and out degrees.
+        """
+        size = len(self.pids)
+        statistics = {'nodes': size, 'edges': self.edges}
+
+        for name, degrees in (('in', self.in_degrees()), ('out', self.out_degrees())):
+            if not size:
+                low = high = 0
+            elif numpy is not None:
+                low, high = degrees.min(), degrees.max()
+            else:
+                low, high = min(degrees), max(degrees)
+
+            statistics[name] = {
+                'min': int(low),
+                'max': int(high),
+                'mean': float(self.edges) / size if size else 0.0,
+            }
+
+        return statistics
+
+    def aggregate(self, key=journal_key):
+        """
+        This method retrieves a Counter of the number of citations between
+        groups of documents, keyed by (citing_group, cited_group). The groups
+        are given by the key function of the PIDs, the journal ISSN by
+        default.
+        """
+        groups = [key(pid) for pid in self.pids]
+        indptr, indices = self.indptr, self.indices
+        result = Counter()
+
+        for node in range(len(self.pids)):
+            citing_group = groups[node]
+            for cited in indices[indptr[node]:indptr[node + 1]]:
+                result[(citing_group, groups[cited])] += 1
+
+        return result
+
+    def save(self, path):
+        """
+        This method writes the graph to the given path plus '.json' (header
+        and PIDs), '.indptr' and '.indices' (raw arrays).
+        """
+        _write_array(path + '.indptr', self.indptr)
+        _write_array(path + '.indices', self.indices)
+
+        header = json.dumps({
+            'byteorder': sys.byteorder,
+            'edges': self.edges,
+            'pids': self.pids,
+        }, ensure_ascii=False)
+        if isinstance(header, bytes):  # Python 2, ASCII only header
+            header = header.decode('utf-8')
+
+        with io.open(path + '.json', 'w', encoding='utf-8') as fp:
+            fp.write(header)
+
+    @classmethod
+    def load(cls, path):
+        """
+        This method reads a graph written by save.
+        """
+        with io.open(path + '.json', encoding='utf-8') as fp:
+            header = json.load(fp)
+
+        indptr = _read_array(path + '.indptr', INDPTR_TYPECODE, len(header['pids']) + 1)
+        indices = _read_array(path + '.indices', INDICES_TYPECODE, header['edges'])
+
+        if header['byteorder'] != sys.byteorder:
+            indptr.byteswap()
+            indices.byteswap()
+
+        return cls(header['pids'], indptr, indices)
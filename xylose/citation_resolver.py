@@ -0,0 +1,295 @@
+# coding: utf-8
+"""
+Resolution of citations to the articles of a corpus.
+
+The CitationResolver indexes the articles of a corpus by DOI, by (ISSN,
+volume, start page) and by normalized (journal title, year, first author
+surname). The citations of the citing articles are then joined against
+these hash indexes, in this order of confidence, in one streaming pass,
+reading the citation fields straight from the records.
+
+    resolver = CitationResolver(corpus.iter_articles(open('articles.jsonl', 'rb')))
+    for citing_pid, index_number, cited_pid, method in resolver.join(
+            corpus.iter_records(open('articles.jsonl', 'rb'))):
+        ...
+    print(resolver.report)
+"""
+import re
+import json
+from collections import Counter
+
+from xylose.aff_validator import remove_diacritics
+from xylose.citation_table import citation_row
+from xylose.scielodocument import Citation, DOI_REGEX
+
+DOI = u'doi'
+ISSN_VOLUME_PAGE = u'issn_volume_page'
+SOURCE_YEAR_AUTHOR = u'source_year_author'
+
+METHODS = (DOI, ISSN_VOLUME_PAGE, SOURCE_YEAR_AUTHOR)
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_doi(doi):
+    """
+    This method retrieves the DOI of a raw DOI value, Ex: an URL, in lower
+    case, or None.
+    """
+    if not doi:
+        return None
+
+    found = DOI_REGEX.findall(doi.strip())
+
+    return found[0].lower() if found else None
+
+
+def normalize_text(text):
+    """
+    This method retrieves the given text in lower case, without diacritics
+    and without the non alphanumeric characters, or None.
+    """
+    if not text:
+        return None
+
+    return _NON_ALPHANUMERIC.sub(u'', remove_diacritics(text).lower()) or None
+
+
+def normalize_page(page):
+    if not page:
+        return None
+
+    return page.strip().lstrip(u'0') or None
+
+
+class ResolutionReport(object):
+
+    def __init__(self):
+        self.total = 0
+        self.unresolved = 0
+        self.invalid_index_numbers = 0
+        self.key_failures = Counter()
+        self.methods = Counter()
+        self.unresolved_types = Counter()
+
+    @property
+    def resolved(self):
+
+        return self.total - self.unresolved
+
+    def as_dict(self):
+
+        return {
+            'total': self.total,
+            'resolved': self.resolved,
+            'unresolved': self.unresolved,
+            'invalid_index_numbers': self.invalid_index_numbers,
+            'key_failures': dict(self.key_failures),
+            'methods': dict(self.methods),
+            'unresolved_types': dict(self.unresolved_types),
+        }
+
+    def __str__(self):
+
+        return u'%d citations: %d resolved (%s), %d unresolved.' % (
+            self.total,
+            self.resolved,
+            u', '.join(u'%s: %d' % (i, self.methods[i]) for i in METHODS),
+            self.unresolved
+        )
+
+
+class CitationResolver(object):
+
+    def __init__(self, articles=None):
+        """
+        Create a CitationResolver object, optionally indexing the given
+        Article objects.
+        """
+        self._indexes = dict((method, {}) for method in METHODS)
+        self._ambiguous = dict((method, set()) for method in METHODS)
+        self.report = ResolutionReport()
+        self.indexed = 0
+
+        if articles is not None:
+            self.extend(articles)
+
+    def __len__(self):
+
+        return self.indexed
+
+    def _index(self, method, key, pid):
+        index = self._indexes[method]
+        indexed = index.setdefault(key, pid)
+
+        if indexed != pid:
+            self._ambiguous[method].add(key)
+
+    def _doi_keys(self, article):
+        doi = normalize_doi(article.doi)
+
+        return [(DOI, doi)] if doi else []
+
+    def _issn_volume_page_keys(self, article):
+        volume = article.issue.volume
+        page = normalize_page(article.start_page)
+
+        if not (volume and page):
+            return []
+
+        journal = article.journal
+        issns = set([journal.print_issn, journal.electronic_issn, journal.scielo_issn])
+
+        return [(ISSN_VOLUME_PAGE, (issn.upper(), volume, page)) for issn in issns if issn]
+
+    def _source_year_author_keys(self, article):
+        date = article.issue_publication_date or article.document_publication_date
+        year = date[0:4] if date else None
+        first_author = article.first_author
+        surname = normalize_text(first_author.get('surname')) if first_author else None
+
+        if not (year and surname):
+            return []
+
+        journal = article.journal
+        titles = set([normalize_text(journal.title), normalize_text(journal.abbreviated_title)])
+
+        return [(SOURCE_YEAR_AUTHOR, (title, year, surname)) for title in titles if title]
+
+    def article_keys(self, article):
+        """
+        This method retrieves the (method, key) tuples of the given Article.
+        The keys of a method whose fields can not be read from the article,
+        such as a missing journal title, are left out and counted in the
+        report key_failures.
+        """
+        keys = []
+
+        for method, article_keys in (
+                (DOI, self._doi_keys),
+                (ISSN_VOLUME_PAGE, self._issn_volume_page_keys),
+                (SOURCE_YEAR_AUTHOR, self._source_year_author_keys)):
+            try:
+                keys.extend(article_keys(article))
+            except Exception:
+                self.report.key_failures[method] += 1
+
+        return keys
+
+    def add_article(self, article):
+        pid = article.publisher_id
+
+        for method, key in self.article_keys(article):
+            self._index(method, key, pid)
+
+        self.indexed += 1
+
+    def extend(self, articles):
+
+        for article in articles:
+            self.add_article(article)
+
+    def citation_keys(self, data):
+        """
+        This method retrieves the (method, key) tuples of a citation record,
+        in the order they are tried.
+        """
+
+        return self._row_keys(citation_row(data))
+
+    def _row_keys(self, row):
+        (publication_type, source, year, volume, issue, start_page, issn,
+         doi, surname) = row
+        keys = []
+
+        doi = normalize_doi(doi)
+        if doi:
+            keys.append((DOI, doi))
+
+        page = normalize_page(start_page)
+        if issn and volume and page:
+            keys.append((ISSN_VOLUME_PAGE, (issn.strip().upper(), volume, page)))
+
+        source = normalize_text(source)
+        surname = normalize_text(surname)
+        if source and year and surname:
+            keys.append((SOURCE_YEAR_AUTHOR, (source, str(year), surname)))
+
+        return keys
+
+    def resolve(self, citation):
+        """
+        This method retrieves the (pid, method) of the article cited by the
+        given Citation object or citation record, or (None, None).
+        """
+        data = citation.data if isinstance(citation, Citation) else citation
+
+        return self._lookup(self.citation_keys(data))
+
+    def _lookup(self, keys):
+
+        for method, key in keys:
+            pid = self._indexes[method].get(key)
+            if pid is not None and key not in self._ambiguous[method]:
+                return pid, method
+
+        return None, None
+
+    def join(self, records, unresolved=None):
+        """
+        This method yields (citing_pid, index_number, cited_pid, method)
+        tuples for each citation of the given records or Article objects;
+        cited_pid and method are None for the unresolved citations. The
+        index_number is the citation position when its v701 is missing or is
+        not a number; the latter are counted in the report. The report
+        attribute is updated as the tuples are consumed.
+
+        Keyword arguments:
+        unresolved -- a text file object where the unresolved citations are
+        written, one JSON object per line.
+        """
+        report = self.report
+
+        for record in records:
+            data = getattr(record, 'data', record)
+            citing_pid = data['article']['v880'][0]['_']
+
+            for position, citation in enumerate(data.get('citations') or [], 1):
+                row = citation_row(citation)
+                keys = self._row_keys(row)
+                cited_pid, method = self._lookup(keys)
+
+                index_number = position
+                if 'v701' in citation:
+                    try:
+                        index_number = int(citation['v701'][0]['_'])
+                    except (ValueError, TypeError, KeyError, IndexError):
+                        report.invalid_index_numbers += 1
+
+                report.total += 1
+                if cited_pid is None:
+                    publication_type = row[0]
+                    report.unresolved += 1
+                    report.unresolved_types[publication_type] += 1
+                    if unresolved is not None:
+                        unresolved.write(u'%s\n' % json.dumps({
+                            'citing_pid': citing_pid,
+                            'index_number': index_number,
+                            'publication_type': publication_type,
+                            'keys': [i[0] for i in keys],
+                        }))
+                else:
+                    report.methods[method] += 1
+
+                yield citing_pid, index_number, cited_pid, method
+
+    def cited_by(self, records):
+        """
+        This method retrieves a Counter of the number of citations received
+        by each article of the index, from the given citing records.
+        """
+
+        return Counter(
+            cited_pid for citing_pid, index_number, cited_pid, method in self.join(records)
+            if cited_pid is not None
+        )
@@ -0,0 +1,298 @@
+# coding: utf-8
+"""
+Columnar storage of the citations of many articles.
+
+The CitationTable reads the citations directly from the ISIS2JSON records,
+without building a Citation object per reference, and keeps the key fields
+in array backed columns. String columns are dictionary encoded, so the
+filters and the group by operations work over integer codes, using NumPy
+when it is installed.
+"""
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from xylose import tools
+from xylose.scielodocument import html_decode, citation_publication_type, typed_citation_field
+
+COLUMNS = (
+    'citing_pid',
+    'publication_type',
+    'source',
+    'year',
+    'volume',
+    'issue',
+    'start_page',
+    'issn',
+    'doi',
+    'first_author_surname',
+)
+
+
+def _first_value(data, field):
+
+    return data[field][0]['_']
+
+
+def _year(data, publication_type):
+    """
+    The year of the Citation.publication_date as an integer.
+    """
+    if 'v65' in data:
+        date = tools.get_date(_first_value(data, 'v65'))
+    else:
+        date = (typed_citation_field('thesis_date', data, publication_type) or
+                typed_citation_field('conference_date', data, publication_type))
+
+    year = (date or '')[0:4]
+
+    return int(year) if year.isdigit() else None
+
+
+def _start_page(data):
+    if 'v514' in data:
+        return html_decode(data['v514'][0].get('f', None))
+
+    if 'v14' in data:
+        return html_decode(_first_value(data, 'v14').split('-')[0])
+
+
+def _first_author_surname(data):
+    """
+    The surname of the Citation.first_author_info when the first author is
+    a person.
+    """
+    for field, institutions in (('v10', 'v11'), ('v16', 'v17')):
+        if field == 'v16' and 'v30' in data:
+            return None
+
+        for author in data.get(field, []):
+            if 's' in author:
+                return html_decode(author['s'])
+            if 'n' in author:
+                return None
+
+        if data.get(institutions):
+            return None
+
+
+def citation_row(data):
+    """
+    This method retrieves the table fields, but the citing_pid, of a
+    citation record.
+    """
+    publication_type = citation_publication_type(data)
+
+    return (
+        publication_type,
+        typed_citation_field('source', data, publication_type),
+        _year(data, publication_type),
+        typed_citation_field('volume', data, publication_type),
+        typed_citation_field('issue', data, publication_type),
+        _start_page(data),
+        typed_citation_field('issn', data, publication_type),
+        _first_value(data, 'v237') if 'v237' in data else None,
+        _first_author_surname(data),
+    )
+
+
+class _StringColumn(object):
+    """
+    Dictionary encoded column. The code 0 represents missing values.
+    """
+
+    __slots__ = ('codes', 'values', 'index')
+
+    def __init__(self):
+        self.codes = array('i')
+        self.values = [None]
+        self.index = {None: 0}
+
+    def append(self, value):
+        code = self.index.get(value)
+
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(value)
+
+        self.codes.append(code)
+
+    def code(self, value):
+
+        return self.index.get(value, -1)
+
+    def decode(self, code):
+
+        return self.values[code]
+
+
+class _IntColumn(object):
+    """
+    Integer column. The value 0 represents missing values.
+    """
+
+    __slots__ = ('codes',)
+
+    def __init__(self):
+        self.codes = array('i')
+
+    def append(self, value):
+
+        self.codes.append(value or 0)
+
+    def code(self, value):
+
+        return value or 0
+
+    def decode(self, code):
+
+        return code or None
+
+
+class CitationTable(object):
+
+    def __init__(self, records=None):
+        """
+        Create a CitationTable object, optionally ingesting the given
+        isis2json type 3 SciELO documents or Article objects.
+        """
+        self._columns = {}
+        for name in COLUMNS:
+            self._columns[name] = _IntColumn() if name == 'year' else _StringColumn()
+
+        if records is not None:
+            self.extend(records)
+
+    def __len__(self):
+
+        return len(self._columns['citing_pid'].codes)
+
+    def add_article(self, record):
+        """
+        This method appends one row per citation of the given document.
+        """
+        data = getattr(record, 'data', record)
+
+        citations = data.get('citations')
+        if not citations:
+            return
+
+        citing_pid = data['article']['v880'][0]['_']
+        columns = [self._columns[name] for name in COLUMNS]
+        citing_pid_column, other_columns = columns[0], columns[1:]
+
+        for citation in citations:
+            citing_pid_column.append(citing_pid)
+            for column, value in zip(other_columns, citation_row(citation)):
+                column.append(value)
+
+    def extend(self, records):
+
+        for record in records:
+            self.add_article(record)
+
+    def _get_column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise ValueError('Column not available ({0})'.format(name))
+
+    def codes(self, name):
+        """
+        This method retrieves a copy of the encoded values of the given
+        column, as a NumPy array when NumPy is installed. A copy, as a view
+        over the column would keep it from growing with new articles.
+        """
+        codes = self._get_column(name).codes
+
+        if numpy is not None:
+            return numpy.array(codes, dtype=numpy.int32)
+
+        return array('i', codes)
+
+    def column(self, name, rows=None):
+        """
+        This method retrieves the decoded values of the given column, for all
+        the rows or for the given row indexes.
+        """
+        column = self._get_column(name)
+        codes = column.codes
+
+        if rows is None:
+            return [column.decode(code) for code in codes]
+
+        return [column.decode(codes[i]) for i in rows]
+
+    def row(self, index):
+
+        return dict(
+            (name, self._columns[name].decode(self._columns[name].codes[index]))
+            for name in COLUMNS
+        )
+
+    def filter(self, **criteria):
+        """
+        This method retrieves the indexes of the rows matching all the given
+        criteria. A criterion is a value or a list, tuple or set of accepted
+        values.
+
+        table.filter(publication_type=u'article', year=[2010, 2011])
+        """
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            for name, value in criteria.items():
+                column = self._get_column(name)
+                codes = self.codes(name)
+                if isinstance(value, (list, tuple, set, frozenset)):
+                    mask &= numpy.isin(codes, [column.code(i) for i in value])
+                else:
+                    mask &= codes == column.code(value)
+
+            return numpy.flatnonzero(mask)
+
+        rows = range(len(self))
+        for name, value in criteria.items():
+            column = self._get_column(name)
+            codes = column.codes
+            if isinstance(value, (list, tuple, set, frozenset)):
+                accepted = set(column.code(i) for i in value)
+                rows = [i for i in rows if codes[i] in accepted]
+            else:
+                code = column.code(value)
+                rows = [i for i in rows if codes[i] == code]
+
+        return list(rows)
+
+    def count(self, **criteria):
+
+        return len(self.filter(**criteria))
+
+    def group_by(self, name, rows=None):
+        """
+        This method retrieves the number of rows per value of the given
+        column, for all the rows or for the given row indexes.
+        """
+        column = self._get_column(name)
+
+        if numpy is not None:
+            codes = self.codes(name)
+            if rows is not None:
+                codes = codes[numpy.asarray(rows, dtype=numpy.intp)]
+            values, counts = numpy.unique(codes, return_counts=True)
+            return dict(
+                (column.decode(int(code)), int(total))
+                for code, total in zip(values, counts)
+            )
+
+        codes = column.codes
+        if rows is not None:
+            codes = [codes[i] for i in rows]
+
+        return dict(
+            (column.decode(code), total) for code, total in Counter(codes).items()
+        )
@@ -0,0 +1,371 @@
+# coding: utf-8
+"""
+Corpus loading layer.
+
+A corpus dump is a stream with one ISIS2JSON type 3 record per line. The
+functions of this module decode the records with the fastest JSON parser
+available (orjson, ujson or simdjson) falling back to the standard library
+json module, and wrap them in the xylose document objects. Records can be
+loaded with a projection of their top level fields, skipping the large
+fulltext bodies and citations of metadata only jobs.
+"""
+import re
+import sys
+import json
+from collections import OrderedDict
+
+from xylose.scielodocument import Article, Issue, Journal, XyloseException
+
+
+def _orjson_loads():
+    import orjson
+    return orjson.loads
+
+
+def _ujson_loads():
+    import ujson
+    return ujson.loads
+
+
+def _simdjson_loads():
+    import simdjson
+    return simdjson.loads
+
+
+def _stdlib_loads():
+    return json.loads
+
+
+# Known backends in order of preference.
+KNOWN_BACKENDS = OrderedDict([
+    ('orjson', _orjson_loads),
+    ('ujson', _ujson_loads),
+    ('simdjson', _simdjson_loads),
+    ('json', _stdlib_loads),
+])
+
+
+def load_backends():
+
+    data = OrderedDict()
+    for name, loader in KNOWN_BACKENDS.items():
+        try:
+            data[name] = loader()
+        except ImportError:
+            continue
+
+    return data
+
+
+JSON_BACKENDS = load_backends()
+
+_default_backend = next(iter(JSON_BACKENDS))
+
+
+def available_backends():
+    """
+    This method retrieves the names of the installed JSON backends, the
+    preferred one first.
+    """
+
+    return list(JSON_BACKENDS.keys())
+
+
+def default_backend():
+
+    return _default_backend
+
+
+def set_default_backend(name):
+    """
+    This method changes the JSON backend used when no backend is given
+    explicitly to the loading functions.
+    """
+    global _default_backend
+
+    get_backend(name)
+    _default_backend = name
+
+
+def get_backend(name=None):
+    """
+    This method retrieves the loads function of the given JSON backend. When
+    no name is given the default backend is used.
+    """
+
+    name = name or _default_backend
+
+    if name not in KNOWN_BACKENDS:
+        raise ValueError('JSON backend not allowed ({0})'.format(name))
+
+    if name not in JSON_BACKENDS:
+        raise ValueError('JSON backend not installed ({0})'.format(name))
+
+    return JSON_BACKENDS[name]
+
+
+class FieldNotLoadedException(XyloseException):
+    pass
+
+
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_SCALAR = re.compile(r'[^,}\]\s]*')
+_SPACE = re.compile(r'\s*')
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+def _string_end(text, pos):
+    """
+    This method retrieves the end offset of the JSON string starting at pos.
+    The closing quote is searched with str.find, so long texts, such as the
+    fulltext bodies, are skipped at memchr speed.
+    """
+    end = pos + 1
+
+    while True:
+        end = text.find(u'"', end)
+        if end < 0:
+            raise ValueError('Unterminated JSON string at offset %d' % pos)
+
+        escaped = False
+        index = end - 1
+        while text[index] == u'\\':
+            escaped = not escaped
+            index -= 1
+
+        end += 1
+        if not escaped:
+            return end
+
+
+def _value_end(text, pos):
+    """
+    This method retrieves the end offset of the JSON value starting at pos.
+    The value is scanned bracket by bracket, skipping the strings with
+    _string_end, so nothing of the value is decoded.
+    """
+    first = text[pos:pos + 1]
+
+    if first == u'"':
+        return _string_end(text, pos)
+
+    if first not in (u'{', u'['):
+        return _SCALAR.match(text, pos).end()
+
+    depth = 0
+    while True:
+        token = _STRUCTURAL.search(text, pos)
+        if token is None:
+            raise ValueError('Unterminated JSON value at offset %d' % pos)
+
+        char = token.group()
+        if char == u'"':
+            pos = _string_end(text, token.start())
+            continue
+
+        pos = token.end()
+        if char in (u'{', u'['):
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 0:
+            return pos
+
+
+def top_level_members(text, fields):
+    """
+    This method walks the members of the JSON object in text, decoding the
+    values of the given fields and retrieving the raw offsets of the others.
+    It returns a (decoded, skipped) tuple, where decoded is a dict and
+    skipped maps the other keys to their (value_start, value_end) offsets.
+    """
+    pos = _SPACE.match(text).end()
+    if text[pos:pos + 1] != u'{':
+        raise ValueError('Record is not a JSON object')
+    pos = _SPACE.match(text, pos + 1).end()
+
+    decoded, skipped = {}, {}
+    while text[pos:pos + 1] == u'"':
+        key_end = _string_end(text, pos)
+        key = json.loads(text[pos:key_end])
+        pos = _SPACE.match(text, key_end).end()
+        if text[pos:pos + 1] != u':':
+            raise ValueError('Invalid JSON object member at offset %d' % pos)
+        value_start = _SPACE.match(text, pos + 1).end()
+
+        if key in fields:
+            decoded[key], value_end = _raw_decode(text, value_start)
+        else:
+            value_end = _value_end(text, value_start)
+            skipped[key] = (value_start, value_end)
+
+        pos = _SPACE.match(text, value_end).end()
+        if text[pos:pos + 1] != u',':
+            break
+        pos = _SPACE.match(text, pos + 1).end()
+
+    return decoded, skipped
+
+
+class ProjectedRecord(dict):
+    """
+    A record loaded with a fields projection. The top level keys out of the
+    projection are either kept as raw JSON text, decoded on their first
+    access (lazy mode), or dropped, raising FieldNotLoadedException when
+    they are accessed.
+    Only the loaded keys are listed by keys(), items(), values() and len(),
+    and only those are serialized by the JSON encoders; the skipped ones are
+    given by skipped_fields. tools.fingerprint digests both.
+    """
+
+    __slots__ = ('_skipped', '_backend')
+
+    def __init__(self, data, skipped, backend=None):
+        dict.__init__(self, data)
+        self._skipped = skipped
+        self._backend = backend
+
+    def _load(self, key):
+        raw = self._skipped[key]
+
+        if raw is None:
+            raise FieldNotLoadedException(
+                'Field "{0}" was not loaded. Add it to the loading fields '
+                'projection or load the record in lazy mode.'.format(key)
+            )
+
+        value = get_backend(self._backend)(raw)
+        dict.__setitem__(self, key, value)
+        del self._skipped[key]
+
+        return value
+
+    @property
+    def skipped_fields(self):
+
+        return set(self._skipped.keys())
+
+    def __getitem__(self, key):
+        if key in self._skipped:
+            return self._load(key)
+
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+
+        return key in self._skipped or dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if key in self._skipped:
+            return self._load(key)
+
+        return dict.get(self, key, default)
+
+    def __setitem__(self, key, value):
+        self._skipped.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __reduce__(self):
+
+        return (ProjectedRecord, (dict(self), dict(self._skipped), self._backend))
+
+
+def loads_projected(data, fields, backend=None, lazy=False):
+    """
+    This method decodes a JSON record (str or bytes) keeping only the given
+    top level fields. The values of the other fields are not decoded; they
+    are kept as raw JSON text, decoded by the given backend on access, when
+    lazy is True.
+
+    loads_projected(line, fields={'article', 'title', 'issue', 'collection'})
+    """
+    get_backend(backend)
+
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    decoded, skipped = top_level_members(data, fields)
+
+    for key, (start, end) in skipped.items():
+        skipped[key] = data[start:end] if lazy else None
+
+    return ProjectedRecord(decoded, skipped, backend)
+
+
+def loads(data, backend=None, fields=None, lazy=False):
+    """
+    This method decodes a JSON record (str or bytes).
+
+    Keyword arguments:
+    backend -- the JSON backend name, see get_backend.
+    fields -- the top level fields to decode, all of them when None. See
+    loads_projected.
+    lazy -- keep the fields out of the projection to be decoded on access.
+    """
+    if fields is not None:
+        return loads_projected(data, fields, backend=backend, lazy=lazy)
+
+    return get_backend(backend)(data)
+
+
+def iter_records(lines, backend=None, fields=None, lazy=False):
+    """
+    This method decodes an iterable of JSON lines (str or bytes), such as an
+    opened dump file, yielding one record per non blank line.
+    See loads for the keyword arguments.
+    """
+    parse = get_backend(backend)
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        if fields is not None:
+            yield loads_projected(line, fields, backend=backend, lazy=lazy)
+            continue
+
+        yield parse(line)
+
+
+def iter_articles(lines, backend=None, iso_format=None, fields=None, lazy=False, body_store=None):
+    """
+    This method yields the Article objects of an iterable of JSON lines.
+    See loads for the keyword arguments.
+
+    Keyword arguments:
+    body_store -- a xylose.bodystore.BodyStore where the fulltext bodies
+    are moved to as the records are loaded.
+    """
+
+    for record in iter_records(lines, backend=backend, fields=fields, lazy=lazy):
+        if body_store is not None:
+            body_store.detach(record)
+
+        yield Article(record, iso_format=iso_format)
+
+
+def iter_issues(lines, backend=None, iso_format=None, fields=None, lazy=False):
+
+    for record in iter_records(lines, backend=backend, fields=fields, lazy=lazy):
+        yield Issue(record, iso_format=iso_format)
+
+
+def iter_journals(lines, backend=None, iso_format=None, fields=None, lazy=False):
+
+    for record in iter_records(lines, backend=backend, fields=fields, lazy=lazy):
+        yield Journal(record, iso_format=iso_format)
+
+
+def _parse_records(lines, backend, iso_format):
+
+    return list(iter_records(lines, backend=backend))
+
+
+def _parse_articles(lines, backend, iso_format):
+
+    return list(iter_articles(lines, backend=backend, iso_format=iso_format))
+
+
+if sys.version_info >= (3, 6):
+    from xylose._aiocorpus import aiter_records, aiter_articles
@@ -0,0 +1,112 @@
+# coding: utf-8
+"""
+Deprecation warnings of the document accessors.
+
+The deprecated accessors are hit millions of times by legacy callers. A
+Deprecation keeps its message built once and decides, once per call site
+and per state of the warnings filters, whether warnings.warn must be called
+at all: never when the site is ignored, once when the warnings machinery
+would show it only once anyway ('default', 'module' and 'once' actions),
+and on every call for the 'always' and 'error' actions. The silent mode
+skips the warnings machinery entirely.
+
+    >>> from xylose import deprecation
+    >>> deprecation.set_silent(True)
+"""
+import sys
+import warnings
+
+# Actions of the warnings filters that emit on every call.
+_REPEATED_ACTIONS = ('always', 'error')
+
+_silent = False
+
+
+def set_silent(silent=True):
+    """
+    This method enables, or disables, the silent mode, where the deprecated
+    accessors do not warn at all.
+    """
+    global _silent
+
+    _silent = bool(silent)
+
+
+def is_silent():
+
+    return _silent
+
+
+def filter_action(category, message, module, lineno):
+    """
+    This method retrieves the action of the warnings filters for the given
+    warning, as warnings.warn would apply it.
+    """
+    for action, msg, cat, mod, ln in warnings.filters:
+        if ((msg is None or msg.match(message)) and issubclass(category, cat) and
+                (mod is None or mod.match(module)) and (ln == 0 or lineno == ln)):
+            return action
+
+    return warnings.defaultaction
+
+
+class Deprecation(object):
+
+    __slots__ = ('message', 'category', '_filters', '_length', '_head', '_sites')
+
+    def __init__(self, message, category=DeprecationWarning):
+        self.message = message
+        self.category = category
+        self._filters = None
+        self._length = 0
+        self._head = None
+        self._sites = {}
+
+    @classmethod
+    def future(cls, old, new, details=''):
+        """
+        This method retrieves the PendingDeprecationWarning Deprecation of an
+        accessor that will be replaced, with the message of
+        warn_future_deprecation.
+        """
+        message = '"{}" will be deprecated in future version. '.format(old) + \
+            'Use "{}" instead. {}'.format(new, details)
+
+        return cls(message, PendingDeprecationWarning)
+
+    def warn(self):
+        """
+        This method warns about the deprecated accessor calling it, on behalf
+        of the caller of the accessor.
+        """
+        if _silent:
+            return
+
+        try:
+            frame = sys._getframe(2)
+        except (AttributeError, ValueError):
+            warnings.warn(self.message, self.category, stacklevel=3)
+            return
+
+        # The filters are replaced by catch_warnings and prepended to, or
+        # appended to, by filterwarnings and simplefilter.
+        filters = warnings.filters
+        head = filters[0] if filters else None
+        if filters is not self._filters or len(filters) != self._length or head is not self._head:
+            self._filters, self._length, self._head = filters, len(filters), head
+            self._sites = {}
+
+        site = (frame.f_code.co_filename, frame.f_lineno)
+        repeated = self._sites.get(site)
+
+        if repeated is None:
+            action = filter_action(
+                self.category, self.message, frame.f_globals.get('__name__', '<string>'),
+                frame.f_lineno)
+            repeated = self._sites[site] = action in _REPEATED_ACTIONS
+            if action == 'ignore':
+                return
+        elif not repeated:
+            return
+
+        warnings.warn(self.message, self.category, stacklevel=3)
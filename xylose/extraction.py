@@ -0,0 +1,235 @@
+# coding: utf-8
+"""
+Error isolating batch extraction of fields of many documents.
+
+An Extractor evaluates a list of fields (Article properties, methods
+without required arguments or functions of the Article) for each record.
+The fields of a record are evaluated under a single try; only when a field
+raises is the record evaluated again field by field, applying the policy
+of each failing field: skip the field, use a default value or drop the
+record. The failures are counted per field and the failing raw records can
+be written to a dead letter file, as they were read when the records are
+given as JSON lines.
+
+    extractor = Extractor(['publisher_id', 'original_title', 'doi'],
+                          policy=SKIP, policies={'publisher_id': DROP},
+                          dead_letter=open('dead_letter.jsonl', 'w'))
+    for row in extractor.extract_lines(dump):
+        ...
+    print(extractor.report)
+"""
+import json
+from collections import Counter
+from operator import attrgetter, methodcaller
+
+from xylose import corpus, tools
+from xylose.scielodocument import Article
+
+SKIP = u'skip'
+DEFAULT = u'default'
+DROP = u'drop'
+
+POLICIES = (SKIP, DEFAULT, DROP)
+
+
+def field_getter(name):
+    """
+    This method retrieves the function of the Article that evaluates the
+    property or the method, without arguments, of the given name.
+    """
+    attribute = getattr(Article, name, None)
+
+    if attribute is None:
+        raise ValueError('Field not allowed ({0})'.format(name))
+
+    if isinstance(attribute, property):
+        return attrgetter(name)
+
+    return methodcaller(name)
+
+
+class ExtractionReport(object):
+
+    def __init__(self):
+        self.records = 0
+        self.extracted = 0
+        self.dropped = 0
+        self.failed_records = 0
+        self.errors = Counter()
+
+    def as_dict(self):
+
+        return {
+            'records': self.records,
+            'extracted': self.extracted,
+            'dropped': self.dropped,
+            'failed_records': self.failed_records,
+            'errors': dict(self.errors),
+        }
+
+    def __str__(self):
+
+        return u'%d records: %d extracted, %d dropped, %d with errors (%s).' % (
+            self.records, self.extracted, self.dropped, self.failed_records,
+            u', '.join(u'%s: %d' % i for i in self.errors.most_common())
+        )
+
+
+class Extractor(object):
+
+    def __init__(self, fields, policy=SKIP, policies=None, defaults=None,
+                 dead_letter=None, iso_format=None, backend=None,
+                 projection=None, lazy=False):
+        """
+        Create an Extractor object given the fields to extract: names of
+        Article properties or methods, or (name, function) tuples where the
+        function receives the Article.
+
+        Keyword arguments:
+        policy -- the policy of the failing fields. ['skip', 'default', 'drop']
+        policies -- {field: policy} overriding the policy per field.
+        defaults -- {field: value} used by the 'default' policy, None for the
+        fields not given.
+        dead_letter -- a text file object where the failing records are
+        written, one JSON object per line, with their errors.
+        iso_format -- the language format of the Article objects.
+        backend, projection, lazy -- the JSON backend name, the top level
+        fields to decode and the lazy mode of the lines given to
+        extract_lines. See xylose.corpus.loads.
+        """
+        self.policies = dict(policies or {})
+        self.policy = policy
+
+        for value in [policy] + list(self.policies.values()):
+            if value not in POLICIES:
+                raise ValueError('Policy not allowed ({0})'.format(value))
+
+        self.getters = []
+        for field in fields:
+            if isinstance(field, tuple):
+                self.getters.append(field)
+            else:
+                self.getters.append((field, field_getter(field)))
+
+        self.defaults = dict(defaults or {})
+        self.dead_letter = dead_letter
+        self.iso_format = iso_format
+        self.backend = backend
+        self.projection = projection
+        self.lazy = lazy
+        self.report = ExtractionReport()
+
+    def _write_dead_letter(self, errors, article, line):
+        if line is None:
+            record = json.dumps(article.data, ensure_ascii=False, default=tools.json_default)
+        else:
+            # The source line is written as read: the record of a projected
+            # load lacks the fields left out of the projection.
+            record = (line.decode('utf-8') if isinstance(line, bytes) else line).strip()
+
+        self.dead_letter.write(u'{"errors": %s, "record": %s}\n' % (
+            json.dumps(errors, ensure_ascii=False), record))
+
+    def _invalid_line(self, line, exc):
+        report = self.report
+        report.records += 1
+        report.failed_records += 1
+        report.dropped += 1
+        report.errors[u'record'] += 1
+
+        if self.dead_letter is not None:
+            line = (line.decode('utf-8', 'replace') if isinstance(line, bytes) else line).strip()
+            self.dead_letter.write(u'%s\n' % json.dumps({
+                'errors': {u'record': u'%s: %s' % (type(exc).__name__, exc)},
+                'line': line,
+            }, ensure_ascii=False))
+
+    def _isolated(self, article, line=None):
+        """
+        This method evaluates the fields one by one, applying the policies of
+        the failing ones. It retrieves the row, or None when it is dropped.
+        """
+        report = self.report
+        row, errors, dropped = {}, {}, False
+
+        for name, get in self.getters:
+            try:
+                row[name] = get(article)
+            except Exception as exc:
+                report.errors[name] += 1
+                errors[name] = u'%s: %s' % (type(exc).__name__, exc)
+
+                policy = self.policies.get(name, self.policy)
+                if policy == DROP:
+                    dropped = True
+                elif policy == DEFAULT:
+                    row[name] = self.defaults.get(name)
+
+        report.failed_records += 1
+
+        if self.dead_letter is not None:
+            self._write_dead_letter(errors, article, line)
+
+        if dropped:
+            report.dropped += 1
+            return None
+
+        return row
+
+    def extract_one(self, record, line=None):
+        """
+        This method retrieves the row of the given record or Article object,
+        or None when it is dropped. The line is the JSON text the record was
+        decoded from, written to the dead letter file instead of the record.
+        """
+        article = record if isinstance(record, Article) else Article(record, iso_format=self.iso_format)
+        report = self.report
+        report.records += 1
+
+        try:
+            row = dict((name, get(article)) for name, get in self.getters)
+        except Exception:
+            row = self._isolated(article, line)
+            if row is None:
+                return None
+
+        report.extracted += 1
+
+        return row
+
+    def extract(self, records):
+        """
+        This method yields the rows of the given records or Article objects,
+        but the dropped ones.
+        """
+        extract_one = self.extract_one
+
+        for record in records:
+            row = extract_one(record)
+            if row is not None:
+                yield row
+
+    def extract_lines(self, lines):
+        """
+        This method yields the rows of the records of an iterable of JSON
+        lines, such as an opened dump file, but the dropped ones. The records
+        are decoded with the backend, projection and lazy mode of the
+        Extractor. The lines that can not be decoded are dropped, counted as
+        'record' errors and written to the dead letter file as a string.
+        """
+        extract_one = self.extract_one
+
+        for line in lines:
+            if not line.strip():
+                continue
+
+            try:
+                record = corpus.loads(
+                    line, backend=self.backend, fields=self.projection, lazy=self.lazy)
+            except Exception as exc:
+                self._invalid_line(line, exc)
+                continue
+
+            row = extract_one(record, line)
+            if row is not None:
+                yield row
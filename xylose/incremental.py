@@ -0,0 +1,227 @@
+# coding: utf-8
+"""
+Incremental reprocessing of a corpus.
+
+A StateStore keeps, for each document PID, the update date and a digest of
+the content seen in the previous run. IncrementalRun streams the current
+corpus against the store and forwards only the new, changed and deleted
+documents.
+"""
+import io
+import os
+import json
+import time
+
+from xylose import tools
+from xylose.scielodocument import Article
+
+NEW = u'new'
+CHANGED = u'changed'
+DELETED = u'deleted'
+
+
+def record_digest(data, exclude=None):
+    """
+    This method retrieves a digest of the given record content.
+    """
+
+    return tools.fingerprint(data, exclude=exclude)
+
+
+class StateStore(object):
+
+    def __init__(self, path=None):
+        """
+        Create a StateStore object given the path of the JSON lines file where
+        the state is persisted. Without path the state lives only in memory.
+        """
+        self.path = path
+        self._data = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+
+        return len(self._data)
+
+    def __contains__(self, pid):
+
+        return pid in self._data
+
+    def pids(self):
+
+        return set(self._data.keys())
+
+    def get(self, pid):
+        """
+        This method retrieves the (update_date, digest) stored for the given
+        PID, or None.
+        """
+
+        return self._data.get(pid)
+
+    def set(self, pid, update_date, digest):
+
+        self._data[pid] = (update_date, digest)
+
+    def discard(self, pid):
+
+        self._data.pop(pid, None)
+
+    def load(self):
+        self._data = {}
+
+        with io.open(self.path, encoding='utf-8') as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                pid, update_date, digest = json.loads(line)
+                self._data[pid] = (update_date, digest)
+
+    def save(self):
+        if not self.path:
+            return
+
+        tmp_path = self.path + '.tmp'
+        with io.open(tmp_path, 'w', encoding='utf-8') as fp:
+            for pid in sorted(self._data):
+                update_date, digest = self._data[pid]
+                fp.write(u'%s\n' % json.dumps([pid, update_date, digest]))
+
+        getattr(os, 'replace', os.rename)(tmp_path, self.path)
+
+
+class IncrementalReport(object):
+
+    def __init__(self):
+        self.total = 0
+        self.new = 0
+        self.changed = 0
+        self.skipped = 0
+        self.deleted = 0
+        self.missing_pid = 0
+        self.elapsed = 0.0
+        self.downstream_time = 0.0
+
+    @property
+    def forwarded(self):
+
+        return self.new + self.changed
+
+    @property
+    def estimated_time_saved(self):
+        """
+        The downstream time the skipped records would have taken, given the
+        mean downstream time of the forwarded ones.
+        """
+        if not self.forwarded:
+            return 0.0
+
+        return self.skipped * self.downstream_time / self.forwarded
+
+    def as_dict(self):
+
+        return {
+            'total': self.total,
+            'new': self.new,
+            'changed': self.changed,
+            'skipped': self.skipped,
+            'deleted': self.deleted,
+            'missing_pid': self.missing_pid,
+            'elapsed': self.elapsed,
+            'downstream_time': self.downstream_time,
+            'estimated_time_saved': self.estimated_time_saved,
+        }
+
+    def __str__(self):
+
+        return (
+            u'%d records: %d new, %d changed, %d skipped, %d deleted, '
+            u'%d without PID. %.2fs spent, about %.2fs saved by skipping.' % (
+                self.total, self.new, self.changed, self.skipped, self.deleted,
+                self.missing_pid, self.elapsed, self.estimated_time_saved
+            )
+        )
+
+
+class IncrementalRun(object):
+
+    def __init__(self, state, trust_dates=False, exclude=None):
+        """
+        Create an IncrementalRun object given a StateStore.
+
+        Keyword arguments:
+        trust_dates -- skip the records whose update date did not change
+        without computing their digest.
+        exclude -- top level keys left out of the digest. Ex: ['processing_date']
+        The keys dropped by a projected load must be excluded, or the records
+        loaded in lazy mode; see tools.fingerprint.
+        """
+        self.state = state
+        self.trust_dates = trust_dates
+        self.exclude = exclude
+        self.report = IncrementalReport()
+
+    def process(self, articles):
+        """
+        This method yields (status, pid, article) tuples for the new and the
+        changed documents of the given Article objects (or records), and, once
+        the stream is exhausted, (u'deleted', pid, None) for the PIDs of the
+        state store missing in the stream. The records without PID (v880)
+        are counted in the report and left out.
+
+        The state of a document is updated once the consumer takes its tuple
+        and asks for the next one, so a document whose processing raised is
+        forwarded again by the next run. The state store is not saved.
+        """
+        report = self.report
+        start = time.time()
+        seen = set()
+
+        for article in articles:
+            if not isinstance(article, Article):
+                article = Article(article)
+
+            report.total += 1
+
+            try:
+                pid = article.publisher_id
+            except (KeyError, IndexError, TypeError):
+                report.missing_pid += 1
+                continue
+
+            seen.add(pid)
+            update_date = article.update_date or article.processing_date
+            stored = self.state.get(pid)
+
+            # Without a date the digest is the only way to tell the changes.
+            if stored is not None and self.trust_dates and update_date and stored[0] == update_date:
+                report.skipped += 1
+                continue
+
+            digest = article.fingerprint(exclude=self.exclude)
+
+            if stored is not None and stored[1] == digest:
+                self.state.set(pid, update_date, digest)
+                report.skipped += 1
+                continue
+
+            status = NEW if stored is None else CHANGED
+            if status == NEW:
+                report.new += 1
+            else:
+                report.changed += 1
+
+            yielded_at = time.time()
+            yield status, pid, article
+            report.downstream_time += time.time() - yielded_at
+
+            self.state.set(pid, update_date, digest)
+
+        for pid in sorted(self.state.pids() - seen):
+            report.deleted += 1
+            yield DELETED, pid, None
+            self.state.discard(pid)
+
+        report.elapsed = time.time() - start
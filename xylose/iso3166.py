@@ -1,7 +1,13 @@
 # coding: utf-8
 
 import os
+import re
 import csv
+from collections import Counter
+from difflib import SequenceMatcher
+from unicodedata import combining, normalize
+
+from xylose.aff_validator import remove_diacritics
 
 COUNTRY_CODES = []
 try:
@@ -80,3 +86,126 @@ def load_alpha_3_forms():
 
 COUNTRY_CODES_ALPHA_2_FORMS = load_alpha_2_forms()
 COUNTRY_CODES_ALPHA_3_FORMS = load_alpha_3_forms()
+
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_country_name(name):
+    """
+    This method retrieves the index form of a country name: lower case,
+    without diacritics, with the punctuation and white spaces collapsed.
+    Ex: u' México. ' -> u'mexico'
+
+    The combining marks are removed before the punctuation is collapsed, as
+    they are not word characters in the decomposed (NFD) forms.
+    Ex: u'Me\\u0301xico' -> u'mexico'
+    """
+    name = normalize('NFKD', name.lower())
+    name = u''.join(char for char in name if not combining(char))
+    name = _NON_WORD.sub(u' ', name)
+
+    return u' '.join(remove_diacritics(name).split())
+
+
+def trigrams(text):
+
+    text = u'  %s ' % text
+
+    return set(text[i:i + 3] for i in range(len(text) - 2))
+
+
+class CountryResolver(object):
+
+    def __init__(self, forms=None, fuzzy=False, min_similarity=0.85,
+                 max_candidates=5, cache_size=10000):
+        """
+        Create a CountryResolver object over the given {form: code} mapping,
+        COUNTRY_CODES_ALPHA_2_FORMS by default. The forms are indexed by
+        their normalized name; the normalized names shared by forms of
+        different countries are left out.
+
+        Keyword arguments:
+        fuzzy -- resolve the names missing in the index to the most similar
+        indexed name, looked up through a trigram index.
+        min_similarity -- the minimum similarity ratio of a fuzzy match.
+        max_candidates -- the number of trigram candidates compared.
+        cache_size -- the number of resolved names memoized.
+        """
+        self.forms = COUNTRY_CODES_ALPHA_2_FORMS if forms is None else forms
+        self.fuzzy = fuzzy
+        self.min_similarity = min_similarity
+        self.max_candidates = max_candidates
+        self.cache_size = cache_size
+        self._cache = {}
+        self._index = {}
+        self._trigrams = None
+
+        ambiguous = set()
+        for form, code in self.forms.items():
+            key = normalize_country_name(form)
+            if not key or key in ambiguous:
+                continue
+            if self._index.setdefault(key, code) != code:
+                ambiguous.add(key)
+                del self._index[key]
+
+        if fuzzy:
+            self._trigrams = {}
+            for key in self._index:
+                for trigram in trigrams(key):
+                    self._trigrams.setdefault(trigram, []).append(key)
+
+    def _fuzzy(self, key):
+        if len(key) < 4:
+            return None
+
+        key_trigrams = trigrams(key)
+        shared = Counter()
+        for trigram in key_trigrams:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        best, best_ratio = None, self.min_similarity
+        for candidate, total in shared.most_common(self.max_candidates):
+            # Dice coefficient of the trigrams, an upper bound of the overlap.
+            if 2.0 * total / (len(key_trigrams) + len(trigrams(candidate))) < 0.5:
+                continue
+            ratio = SequenceMatcher(None, key, candidate).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+
+        return self._index[best] if best else None
+
+    def _resolve(self, name):
+        code = self.forms.get(name.lower())
+        if code:
+            return code
+
+        key = normalize_country_name(name)
+        code = self._index.get(key)
+        if code or not self.fuzzy:
+            return code
+
+        return self._fuzzy(key)
+
+    def resolve(self, name):
+        """
+        This method retrieves the ISO 3166 code of the given country name or
+        code, or None.
+        """
+        if not name:
+            return None
+
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+
+        code = self._cache[name] = self._resolve(name)
+
+        return code
+
+
+COUNTRY_RESOLVER = CountryResolver()
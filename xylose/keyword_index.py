@@ -0,0 +1,290 @@
+# coding: utf-8
+"""
+Inverted index of the article keywords, per language.
+
+The KeywordIndex maps each normalized keyword of a language to the sorted
+ids of the articles indexed with it; the ids are positions in the list of
+indexed PIDs. The terms are interned, so each distinct keyword is stored
+once whatever the number of articles using it, and the posting lists are
+saved delta encoded as variable length integers.
+
+    with open('articles.jsonl', 'rb') as dump:
+        index = build_keyword_index(corpus.iter_articles(dump, fields={'article'}))
+    index.save('/var/cache/keywords.idx')
+
+    index = KeywordIndex.load('/var/cache/keywords.idx')
+    index.lookup(u'Sexual Maturity', u'en')
+"""
+import io
+import re
+import json
+import struct
+import unicodedata
+from array import array
+from collections import Counter
+
+MAGIC = b'XKWI1'
+
+_SPACES = re.compile(r'\s+', re.UNICODE)
+_EDGE_PUNCTUATION = u' .,;:'
+
+
+def normalize_keyword(keyword):
+    """
+    This method retrieves the index form of a keyword: NFKC normalized, lower
+    case, with the white spaces collapsed and no trailing punctuation.
+    """
+
+    keyword = unicodedata.normalize('NFKC', keyword).lower()
+
+    return _SPACES.sub(u' ', keyword).strip(_EDGE_PUNCTUATION)
+
+
+def encode_postings(ids):
+    """
+    This method encodes a sorted sequence of ids as the variable length
+    integers of their deltas.
+    """
+    data = bytearray()
+    previous = 0
+
+    for i in ids:
+        delta = i - previous
+        previous = i
+        while delta >= 0x80:
+            data.append((delta & 0x7f) | 0x80)
+            delta >>= 7
+        data.append(delta)
+
+    return bytes(data)
+
+
+def decode_postings(data, start=0, end=None):
+    """
+    This method decodes the ids encoded by encode_postings in data[start:end].
+    """
+    data = bytearray(data[start:end])
+    ids = array('I')
+    value = shift = previous = 0
+
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += value
+        ids.append(previous)
+        value = shift = 0
+
+    return ids
+
+
+class KeywordIndex(object):
+
+    def __init__(self):
+        self.pids = []
+        self._ids = {}
+        self._terms = {}
+        self._postings = {}
+        self._encoded = {}
+        self._blob = b''
+
+    def __len__(self):
+
+        return len(self.pids)
+
+    def __contains__(self, pid):
+
+        return pid in self._ids
+
+    def _intern(self, term):
+
+        return self._terms.setdefault(term, term)
+
+    def _posting_list(self, term, language):
+        postings = self._postings.setdefault(language, {})
+        ids = postings.get(term)
+
+        if ids is not None:
+            return ids
+
+        encoded = self._encoded.get(language, {}).pop(term, None)
+        ids = postings[self._intern(term)] = decode_postings(
+            self._blob, *encoded) if encoded else array('I')
+
+        return ids
+
+    def add(self, pid, keywords):
+        """
+        This method indexes the {language: [keywords]} of the given PID.
+        """
+        if pid in self._ids:
+            raise ValueError('PID already indexed ({0})'.format(pid))
+
+        doc_id = self._ids[pid] = len(self.pids)
+        self.pids.append(pid)
+
+        for language, group in (keywords or {}).items():
+            language = self._intern(language)
+            for term in set(normalize_keyword(i) for i in group):
+                if term:
+                    self._posting_list(term, language).append(doc_id)
+
+        return doc_id
+
+    def add_article(self, article, iso_format=None):
+
+        return self.add(article.publisher_id, article.keywords(iso_format=iso_format))
+
+    def extend(self, articles, iso_format=None):
+
+        for article in articles:
+            self.add_article(article, iso_format=iso_format)
+
+    def languages(self):
+
+        return sorted(set(self._postings) | set(self._encoded))
+
+    def terms(self, language):
+        """
+        This method retrieves the sorted normalized keywords of a language.
+        """
+        terms = set(self._postings.get(language, ()))
+        terms.update(self._encoded.get(language, ()))
+
+        return sorted(terms)
+
+    def _postings_of(self, keyword, language):
+        """
+        This method retrieves the sorted ids of the articles indexed with the
+        given keyword; the postings of the in memory terms are not copied.
+        """
+        term = normalize_keyword(keyword)
+
+        ids = self._postings.get(language, {}).get(term)
+        if ids is not None:
+            return ids
+
+        encoded = self._encoded.get(language, {}).get(term)
+        if encoded is not None:
+            return decode_postings(self._blob, *encoded)
+
+        return array('I')
+
+    def ids(self, keyword, language):
+        """
+        This method retrieves a copy of the sorted ids of the articles indexed
+        with the given keyword.
+        """
+
+        return array('I', self._postings_of(keyword, language))
+
+    def lookup(self, keyword, language):
+        """
+        This method retrieves the PIDs of the articles indexed with the given
+        keyword, in the order they were indexed.
+        """
+        pids = self.pids
+
+        return [pids[i] for i in self._postings_of(keyword, language)]
+
+    def frequency(self, keyword, language):
+
+        return len(self._postings_of(keyword, language))
+
+    def intersection(self, keywords, language):
+        """
+        This method retrieves the PIDs of the articles indexed with all the
+        given keywords.
+        """
+        postings = sorted((self._postings_of(i, language) for i in keywords), key=len)
+
+        if not postings:
+            return []
+
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result.intersection_update(ids)
+
+        return [self.pids[i] for i in sorted(result)]
+
+    def related(self, keywords, language, limit=10, exclude=None):
+        """
+        This method retrieves the (pid, shared_keywords) of the articles
+        sharing most of the given keywords, Ex: the keywords of an article.
+        """
+        counter = Counter()
+
+        for keyword in set(normalize_keyword(i) for i in keywords):
+            counter.update(self._postings_of(keyword, language))
+
+        excluded = self._ids.get(exclude)
+        if excluded is not None:
+            counter.pop(excluded, None)
+
+        return [(self.pids[i], total) for i, total in counter.most_common(limit)]
+
+    def save(self, path):
+        """
+        This method writes the index to the given path. The PIDs and the
+        term table are kept in a JSON header followed by the encoded posting
+        lists.
+        """
+        blob = bytearray()
+        table = {}
+
+        for language in self.languages():
+            entries = table[language] = []
+            for term in self.terms(language):
+                data = encode_postings(self._postings_of(term, language))
+                entries.append([term, len(blob), len(data)])
+                blob.extend(data)
+
+        header = json.dumps(
+            {'pids': self.pids, 'terms': table}, ensure_ascii=False
+        ).encode('utf-8')
+
+        with io.open(path, 'wb') as fp:
+            fp.write(MAGIC)
+            fp.write(struct.pack('>I', len(header)))
+            fp.write(header)
+            fp.write(bytes(blob))
+
+    @classmethod
+    def load(cls, path):
+        """
+        This method reads an index written by save. The posting lists are
+        decoded when they are looked up.
+        """
+        with io.open(path, 'rb') as fp:
+            if fp.read(len(MAGIC)) != MAGIC:
+                raise ValueError('Keyword index file not allowed ({0})'.format(path))
+            size = struct.unpack('>I', fp.read(4))[0]
+            header = json.loads(fp.read(size).decode('utf-8'))
+            blob = fp.read()
+
+        index = cls()
+        index.pids = header['pids']
+        index._ids = dict((pid, i) for i, pid in enumerate(index.pids))
+        index._blob = blob
+
+        for language, entries in header['terms'].items():
+            language = index._intern(language)
+            index._encoded[language] = dict(
+                (index._intern(term), (start, start + length))
+                for term, start, length in entries
+            )
+
+        return index
+
+
+def build_keyword_index(articles, iso_format=None):
+    """
+    This method builds the KeywordIndex of the given Article objects. Only
+    the 'article' field of the records is read, so they can be loaded with
+    corpus.iter_articles(dump, fields={'article'}).
+    """
+    index = KeywordIndex()
+    index.extend(articles, iso_format=iso_format)
+
+    return index
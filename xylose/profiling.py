@@ -0,0 +1,435 @@
+# coding: utf-8
+"""
+Profiling of the extraction of fields of a corpus dump.
+
+The records are extracted with an Extractor in separate passes: one under
+cProfile, for the hot document properties and helper functions, one under
+tracemalloc, for the peak memory and the allocation sites per document
+class, and optionally one under a stack collector, for a collapsed stack
+file that flamegraph.pl, speedscope or inferno can render.
+
+    $ python -m xylose profile articles.jsonl --fields publisher_id,original_title --limit 1000
+"""
+import io
+import os
+import sys
+import time
+import cProfile
+import inspect
+import pstats
+import warnings
+from bisect import bisect_right
+from collections import Counter
+from itertools import islice
+
+try:
+    import tracemalloc
+except ImportError:  # Keep compatibility with python 2.7
+    tracemalloc = None
+
+from xylose import corpus, tools
+from xylose.aff_validator import has_conflicts
+from xylose.extraction import Extractor
+from xylose.scielodocument import Article, Journal, Issue, Citation, html_decode
+from xylose.validator import members
+
+DOCUMENT_CLASSES = (Article, Journal, Issue, Citation)
+
+HELPERS = (html_decode, tools.get_date, has_conflicts)
+
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+def code_label(function):
+    """
+    This method retrieves the (filename, line, name) label cProfile gives to
+    the given function.
+    """
+    code = function.__code__
+
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+def _with_subclasses(classes):
+    """
+    This method retrieves the given classes followed by their subclasses,
+    such as the Citation ones of each publication type.
+    """
+    result = []
+
+    for cls in classes:
+        result.append(cls)
+        result.extend(cls.__subclasses__())
+
+    return result
+
+
+def member_labels(classes=DOCUMENT_CLASSES):
+    """
+    This method retrieves {cProfile label: 'Class.member'} for the
+    properties and methods of the given classes and of their subclasses,
+    the members of a subclass labelled with the given class, Ex:
+    Citation.source for the ArticleCitation one. The functions shared by
+    several members are left out.
+    """
+    labels = {}
+
+    for base in classes:
+        for cls in _with_subclasses([base]):
+            for name, attribute in vars(cls).items():
+                if isinstance(attribute, property):
+                    attribute = attribute.fget
+                if inspect.isfunction(attribute) and attribute.__name__ == name:
+                    labels[code_label(attribute)] = u'%s.%s' % (base.__name__, name)
+
+    return labels
+
+
+def class_lines(classes=DOCUMENT_CLASSES):
+    """
+    This method retrieves (filename, first line, last line, class name)
+    tuples of the source of the given classes and of their subclasses.
+    """
+    ranges = []
+
+    for cls in _with_subclasses(classes):
+        try:
+            lines, start = inspect.getsourcelines(cls)
+            filename = inspect.getsourcefile(cls)
+        except (IOError, TypeError):
+            continue
+        ranges.append((filename, start, start + len(lines) - 1, cls.__name__))
+
+    return ranges
+
+
+def _document_class(traceback, ranges):
+    """
+    This method retrieves the (class name, frame) of the innermost frame of
+    the traceback within the source of a document class, or (None, None).
+    """
+    for frame in reversed(list(traceback)):
+        for filename, start, end, name in ranges:
+            if frame.lineno >= start and frame.lineno <= end and frame.filename == filename:
+                return name, frame
+
+    return None, None
+
+
+class StackCollector(object):
+    """
+    Deterministic profiler of the self time spent per call stack.
+    """
+
+    def __init__(self):
+        self.stacks = Counter()
+        self._stack = []
+        self._last = None
+
+    def _label(self, frame, event, arg):
+        if event == 'c_call':
+            return u'%s:%s' % (getattr(arg, '__module__', None) or 'builtins', arg.__name__)
+
+        code = frame.f_code
+
+        return u'%s:%s' % (os.path.basename(code.co_filename), code.co_name)
+
+    def _profile(self, frame, event, arg):
+        now = _timer()
+        stack = self._stack
+
+        if stack:
+            self.stacks[tuple(stack)] += now - self._last
+
+        if event == 'call' or event == 'c_call':
+            stack.append(self._label(frame, event, arg))
+        elif stack:
+            stack.pop()
+
+        self._last = _timer()
+
+    def run(self, function, *args):
+        self._last = _timer()
+        sys.setprofile(self._profile)
+        try:
+            return function(*args)
+        finally:
+            sys.setprofile(None)
+
+    def write(self, fp):
+        """
+        This method writes the stacks in the collapsed format, one
+        'frame;frame;frame microseconds' line per stack.
+        """
+        for stack, elapsed in sorted(self.stacks.items()):
+            microseconds = int(round(elapsed * 1000000))
+            if microseconds:
+                fp.write(u'%s %d\n' % (u';'.join(stack), microseconds))
+
+
+class ProfileReport(object):
+
+    def __init__(self, records, fields, elapsed, stats, extraction,
+                 peak_memory=None, allocations=None, top=20):
+        self.records = records
+        self.fields = fields
+        self.elapsed = elapsed
+        self.stats = stats
+        self.extraction = extraction
+        self.peak_memory = peak_memory
+        self.allocations = allocations or {}
+        self.top = top
+
+    def _entries(self, labels):
+        # Several functions may have the same label, Ex: the Citation.source
+        # getters of each publication type.
+        entries = {}
+
+        for label, (cc, nc, tt, ct, callers) in self.stats.stats.items():
+            name = labels.get(label)
+            if name is not None:
+                calls, own, cumulative = entries.get(name, (0, 0.0, 0.0))
+                entries[name] = (calls + nc, own + tt, cumulative + ct)
+
+        return sorted(
+            ((name, ) + values for name, values in entries.items()),
+            key=lambda i: (-i[3], i[0])
+        )
+
+    def hot_properties(self):
+        """
+        This method retrieves (Class.member, calls, own time, cumulative time)
+        tuples of the document properties and methods, the slower first.
+        """
+
+        return self._entries(member_labels())[:self.top]
+
+    def hot_helpers(self):
+        """
+        This method retrieves (function, calls, own time, cumulative time)
+        tuples of the HELPERS functions.
+        """
+
+        return self._entries(dict((code_label(i), i.__name__) for i in HELPERS))
+
+    def __str__(self):
+        lines = [
+            u'%d records, %d fields, %.3fs extracting.' % (
+                self.records, len(self.fields), self.elapsed),
+            u'%s' % self.extraction,
+            u'',
+            u'%-48s %10s %10s %10s' % (u'property', u'calls', u'own s', u'cumul. s'),
+        ]
+        lines.extend(u'%-48s %10d %10.3f %10.3f' % i for i in self.hot_properties())
+
+        lines.extend([u'', u'%-48s %10s %10s %10s' % (u'helper', u'calls', u'own s', u'cumul. s')])
+        lines.extend(u'%-48s %10d %10.3f %10.3f' % i for i in self.hot_helpers())
+
+        if self.peak_memory is not None:
+            lines.extend([u'', u'peak memory: %.1f KiB' % (self.peak_memory / 1024.0)])
+
+        for name, sites in sorted(self.allocations.items()):
+            lines.extend([u'', u'%-64s %10s %10s' % (u'%s allocation sites' % name, u'blocks', u'KiB')])
+            lines.extend(
+                u'%-64s %10d %10.1f' % (site, count, size / 1024.0)
+                for site, size, count in sites[:self.top]
+            )
+
+        return u'\n'.join(lines)
+
+
+def allocation_sites(snapshot, ranges=None):
+    """
+    This method retrieves {class name: [(site, bytes, blocks)]} of the
+    allocations of a tracemalloc snapshot, by the innermost line of a
+    document class in their tracebacks, the larger first. The sites are
+    given as 'file:line (Class.member)'.
+    """
+    ranges = class_lines() if ranges is None else ranges
+    starts = sorted((label[0], label[1], name) for label, name in member_labels().items())
+    sites = {}
+
+    for trace in snapshot.traces:
+        name, frame = _document_class(trace.traceback, ranges)
+        if name is None:
+            continue
+        site = u'%s:%d' % (os.path.basename(frame.filename), frame.lineno)
+        position = bisect_right(starts, (frame.filename, frame.lineno, u'\uffff'))
+        if position and starts[position - 1][0] == frame.filename:
+            site = u'%s (%s)' % (site, starts[position - 1][2])
+        size, count = sites.setdefault(name, {}).get(site, (0, 0))
+        sites[name][site] = (size + trace.size, count + 1)
+
+    return dict(
+        (name, sorted(((site, size, count) for site, (size, count) in items.items()),
+                      key=lambda i: (-i[1], i[0])))
+        for name, items in sites.items()
+    )
+
+
+def measure_allocations(objects, name, is_method=False):
+    """
+    This method retrieves the mean 'blocks' and 'bytes' retained, and the
+    mean 'peak_bytes' (None before python 3.9), per evaluation of the
+    property, or of the method without arguments, of the given name on each
+    of the given objects. The objects must be created before, as the
+    tracing is started and stopped here.
+    """
+    results = [None] * len(objects)
+    peak = 0
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            for i in range(len(objects)):
+                current = tracemalloc.get_traced_memory()[0]
+                if reset_peak is not None:
+                    reset_peak()
+                value = getattr(objects[i], name)
+                results[i] = value() if is_method else value
+                peak += tracemalloc.get_traced_memory()[1] - current
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), 'filename')
+    calls = float(len(objects))
+
+    return {
+        'blocks': sum(i.count_diff for i in differences) / calls,
+        'bytes': sum(i.size_diff for i in differences) / calls,
+        'peak_bytes': peak / calls if reset_peak is not None else None,
+    }
+
+
+def allocation_budget(factory, repeat=10, names=None):
+    """
+    This method retrieves {'Class.member': measure_allocations(...)} of the
+    members of the objects given by factory, a function retrieving a list
+    of new document objects of the same class. Every member is measured on
+    repeat fresh lists, so the cached values are computed on each call,
+    after a first evaluation warming up the module level caches. The members
+    that raise are left out.
+    """
+    cls = type(factory()[0])
+    names = members(cls) if names is None else names
+    # The public class of the objects, Ex: Citation for ArticleCitation.
+    label = next((i for i in cls.__mro__ if i in DOCUMENT_CLASSES), cls).__name__
+    result = {}
+
+    for name, is_method in names:
+        objects = [obj for i in range(repeat) for obj in factory()]
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                value = getattr(factory()[0], name)
+                if is_method:
+                    value()
+            result[u'%s.%s' % (label, name)] = measure_allocations(objects, name, is_method)
+        except Exception:
+            continue
+
+    return result
+
+
+# Allowed increase of each measure, besides the tolerance ratio, keeping
+# the members that allocate little out of the noise.
+ALLOCATION_SLACK = {'blocks': 1, 'bytes': 64, 'peak_bytes': 256}
+
+
+def allocation_regressions(baseline, current, tolerance=0.1, slack=None):
+    """
+    This method retrieves (member, metric, baseline, current) tuples of the
+    measures of allocation_budget above the baseline ones by more than the
+    tolerance ratio and more than the slack, ALLOCATION_SLACK by default.
+    """
+    slack = ALLOCATION_SLACK if slack is None else slack
+    regressions = []
+
+    for name in sorted(current):
+        if name not in baseline:
+            continue
+        for metric in sorted(slack):
+            before = baseline[name].get(metric)
+            after = current[name].get(metric)
+            if before is None or after is None:
+                continue
+            if after > before * (1 + tolerance) and after - before > slack[metric]:
+                regressions.append((name, metric, before, after))
+
+    return regressions
+
+
+def profile_extraction(lines, fields=None, limit=None, backend=None,
+                       iso_format=None, memory=True, collapsed=None, top=20,
+                       nframes=25):
+    """
+    This method profiles the extraction of the given fields of the records
+    of an iterable of JSON lines, such as an opened dump file, and retrieves
+    the ProfileReport. The records are decoded before profiling.
+
+    Keyword arguments:
+    fields -- the Article fields, every property and method without
+    required arguments when None.
+    limit -- the maximum number of records.
+    memory -- run the tracemalloc pass (python 3 only).
+    collapsed -- a text file object where the collapsed stacks are written.
+    top -- the number of properties and allocation sites reported.
+    nframes -- the traceback depth kept by tracemalloc.
+    """
+    if fields is None:
+        fields = [name for name, is_method in members(Article)]
+
+    records = list(islice(corpus.iter_records(lines, backend=backend), limit))
+
+    def extract():
+        extractor = Extractor(fields, iso_format=iso_format)
+        rows = list(extractor.extract(records))
+        return extractor, rows
+
+    profiler = cProfile.Profile()
+    start = _timer()
+    profiler.enable()
+    extractor, rows = extract()
+    profiler.disable()
+    elapsed = _timer() - start
+    del rows
+
+    peak_memory, allocations = None, None
+    if memory and tracemalloc is not None:
+        tracemalloc.start(nframes)
+        try:
+            retained = extract()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        del retained
+        allocations = allocation_sites(snapshot)
+
+    if collapsed is not None:
+        collector = StackCollector()
+        collector.run(extract)
+        collector.write(collapsed)
+
+    return ProfileReport(
+        len(records), fields, elapsed, pstats.Stats(profiler), extractor.report,
+        peak_memory=peak_memory, allocations=allocations, top=top
+    )
+
+
+def profile_file(path, collapsed_path=None, **kwargs):
+    """
+    This method profiles the dump of the given path, see profile_extraction,
+    writing the collapsed stacks to collapsed_path when given.
+    """
+    with io.open(path, 'rb') as lines:
+        if collapsed_path is None:
+            return profile_extraction(lines, **kwargs)
+
+        with io.open(collapsed_path, 'w', encoding='utf-8') as collapsed:
+            return profile_extraction(lines, collapsed=collapsed, **kwargs)
@@ -1,3 +1,11 @@
+import json
+import hashlib
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
 from . import choices
 
 
@@ -64,4 +72,81 @@ def get_country_ISO_3166_code_from_name(something):
 
     iso_country_ISP_3166 = None
 
-    return iso_country_ISP_3166
\ No newline at end of file
+    return iso_country_ISP_3166
+
+
+def json_default(value):
+    """
+    The default function of the JSON encoders of the records: the mappings
+    that are not dicts, such as xylose.bodystore.LazyBodies, are encoded as
+    dicts.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+
+    raise TypeError('Object of type %s is not JSON serializable' % type(value).__name__)
+
+
+_canonical_encoder = json.JSONEncoder(
+    sort_keys=True, separators=(',', ':'), default=json_default)
+
+
+def _fingerprint_parts(value, parts, walk=True):
+    """
+    Appends to parts an unambiguous, key order independent, byte
+    representation of the given JSON value. Strings, and the strings of a
+    top level mapping of strings (Ex: the fulltext bodies of each language),
+    are hashed as they are, without escaping. The other values are
+    serialized by the C accelerated json encoder. A mapping is digested as
+    the dict of its items.
+    """
+    if isinstance(value, Mapping) and not isinstance(value, dict):
+        value = dict(value)
+
+    if isinstance(value, type(u'')):
+        value = value.encode('utf-8')
+        parts.append(b's%d:' % len(value))
+        parts.append(value)
+    elif walk and isinstance(value, dict) and all(isinstance(i, type(u'')) for i in value.values()):
+        parts.append(b'{%d:' % len(value))
+        for key in sorted(value):
+            _fingerprint_parts(key, parts, False)
+            _fingerprint_parts(value[key], parts, False)
+    else:
+        value = _canonical_encoder.encode(value).encode('utf-8')
+        parts.append(b'j%d:' % len(value))
+        parts.append(value)
+
+
+def fingerprint(data, exclude=None, digest_size=16):
+    """
+    This method retrieves a stable blake2b hex digest of a JSON like record,
+    or a truncated sha256 one on the interpreters without blake2b (before
+    Python 3.6). The digest does not depend on the order of the keys and it
+    is computed without building a canonical JSON string of the whole record.
+
+    The keys left out of a projected load (see xylose.corpus.loads) are
+    digested too: the lazy ones are decoded, and the dropped ones raise
+    FieldNotLoadedException unless they are excluded, as a digest of only
+    the loaded keys would miss the changes of the others.
+
+    Keyword arguments:
+    exclude -- top level keys left out of the digest. Ex: ['body', 'processing_date']
+    digest_size -- the digest size in bytes.
+    """
+    exclude = set(exclude or [])
+    if hasattr(hashlib, 'blake2b'):
+        hasher = hashlib.blake2b(digest_size=digest_size)
+    else:
+        hasher = hashlib.sha256()
+
+    keys = set(data) | set(getattr(data, 'skipped_fields', ()))
+    keys = sorted(key for key in keys if key not in exclude)
+    hasher.update(b'{%d:' % len(keys))
+    for key in keys:
+        parts = []
+        _fingerprint_parts(key, parts)
+        _fingerprint_parts(data[key], parts)
+        hasher.update(b''.join(parts))
+
+    return hasher.hexdigest()[:digest_size * 2]
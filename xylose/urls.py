@@ -0,0 +1,291 @@
+# coding: utf-8
+"""
+URL building and sitemap generation.
+
+A UrlBuilder keeps the URL prefixes of one collection domain already
+formatted, so the URLs of a whole corpus are built without probing the
+collection and formatting the whole template for each one. The builders
+are cached per domain.
+write_sitemaps streams the URLs of a corpus to sitemap files, splitting
+them at the limits of the sitemaps protocol (50,000 URLs or 50MB per file).
+
+    with open('articles.jsonl', 'rb') as dump:
+        write_sitemaps(corpus.iter_articles(dump), '/var/www/sitemaps',
+                       base_url='http://www.scielo.br/sitemaps/')
+"""
+import io
+import os
+import gzip
+from xml.sax.saxutils import escape
+
+from . import choices
+
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+
+URL_KINDS = ('html', 'pdf', 'issue')
+
+_SITEMAP_HEADER = (
+    u'<?xml version="1.0" encoding="UTF-8"?>\n'
+    u'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_SITEMAP_FOOTER = u'</urlset>\n'
+_INDEX_HEADER = (
+    u'<?xml version="1.0" encoding="UTF-8"?>\n'
+    u'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_INDEX_FOOTER = u'</sitemapindex>\n'
+_XML_ENTITIES = {'"': '&quot;', "'": '&apos;'}
+
+
+def collection_domain(collection_acronym):
+    """
+    This method retrieves the domain of the given collection acronym, or None
+    when the collection is not registered in choices.collections.
+    """
+
+    return choices.collections.get(
+        collection_acronym,
+        [u'Undefined: %s' % collection_acronym, None]
+    )[1] or None
+
+
+class UrlBuilder(object):
+
+    __slots__ = ('domain', '_pdf', '_html', '_issue')
+
+    def __init__(self, domain):
+        """
+        Create a UrlBuilder object given a collection domain. Ex: www.scielo.br
+        """
+        self.domain = domain
+        self._pdf = u'http://%s/scielo.php?script=sci_pdf&pid=' % domain
+        self._html = u'http://%s/scielo.php?script=sci_arttext&pid=' % domain
+        self._issue = u'http://%s/scielo.php?script=sci_issuetoc&pid=' % domain
+
+    def pdf_url(self, publisher_id, language='en'):
+
+        return self._pdf + u'%s&lng=%s&tlng=%s' % (publisher_id, language, language)
+
+    def html_url(self, publisher_id, language='en'):
+
+        return self._html + u'%s&lng=%s&tlng=%s' % (publisher_id, language, language)
+
+    def issue_url(self, publisher_id, language='en'):
+        """
+        This method retrieves the issue url given the issue PID or the PID of
+        any of its documents.
+        """
+
+        return self._issue + u'%s&lng=%s' % (publisher_id[0:18], language)
+
+    def url(self, kind, publisher_id, language='en'):
+        """
+        This method retrieves the url of the given kind. ['html', 'pdf', 'issue']
+        """
+        if kind not in URL_KINDS:
+            raise ValueError('URL kind not allowed ({0})'.format(kind))
+
+        return getattr(self, kind + '_url')(publisher_id, language)
+
+
+_builders = {}
+
+
+def url_builder(domain):
+    """
+    This method retrieves the cached UrlBuilder of the given domain.
+    """
+    builder = _builders.get(domain)
+
+    if builder is None:
+        builder = _builders[domain] = UrlBuilder(domain)
+
+    return builder
+
+
+def article_urls(articles, kinds=('html',), languages=None):
+    """
+    This method yields (url, lastmod) tuples for the given Article objects.
+    The articles without a collection domain are skipped.
+
+    Keyword arguments:
+    kinds -- the kinds of URL of each article. ['html', 'pdf', 'issue']
+    languages -- the languages of the URLs, the fulltext languages of each
+    article when None. The issue URLs are given once per issue.
+    """
+    for kind in kinds:
+        if kind not in URL_KINDS:
+            raise ValueError('URL kind not allowed ({0})'.format(kind))
+
+    builders = {}
+    seen_issues = set()
+
+    for article in articles:
+        acronym = article.collection_acronym
+        builder = builders.get(acronym)
+
+        if builder is None:
+            domain = article.scielo_domain
+            if not domain:
+                continue
+            builder = url_builder(domain)
+            if acronym:
+                builders[acronym] = builder
+
+        pid = article.publisher_id
+        lastmod = article.update_date
+        article_languages = languages or sorted(article.languages() or [])
+
+        for kind in kinds:
+            if kind == 'issue':
+                issue_key = (builder.domain, pid[0:18])
+                if issue_key in seen_issues:
+                    continue
+                seen_issues.add(issue_key)
+
+            build = getattr(builder, kind + '_url')
+            for language in article_languages:
+                yield build(pid, language), lastmod
+
+
+class SitemapWriter(object):
+
+    def __init__(self, directory, prefix='sitemap', max_urls=SITEMAP_MAX_URLS,
+                 max_bytes=SITEMAP_MAX_BYTES, compress=False):
+        """
+        Create a SitemapWriter object given the directory where the sitemap
+        files are written, named prefix-00001.xml, prefix-00002.xml, ...
+
+        Keyword arguments:
+        max_urls -- the maximum number of URLs per file.
+        max_bytes -- the maximum uncompressed size of each file.
+        compress -- write gzip compressed files (.xml.gz).
+        """
+        if max_urls < 1:
+            raise ValueError('Sitemap max_urls not allowed ({0})'.format(max_urls))
+
+        self.directory = directory
+        self.prefix = prefix
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.files = []
+        self.total = 0
+        self._file = None
+        self._urls = 0
+        self._bytes = 0
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _open(self):
+        name = '%s-%05d.xml%s' % (self.prefix, len(self.files) + 1, '.gz' if self.compress else '')
+        path = os.path.join(self.directory, name)
+
+        self._file = gzip.open(path, 'wb') if self.compress else io.open(path, 'wb')
+        self.files.append(path)
+        self._urls = 0
+        self._bytes = self._write(_SITEMAP_HEADER) + len(_SITEMAP_FOOTER)
+
+    def _write(self, text):
+        data = text.encode('utf-8')
+        self._file.write(data)
+
+        return len(data)
+
+    def _close_file(self):
+        if self._file is None:
+            return
+
+        self._write(_SITEMAP_FOOTER)
+        self._file.close()
+        self._file = None
+
+    def add(self, loc, lastmod=None):
+        """
+        This method appends an URL to the current sitemap file, starting a
+        new one when the current file is full.
+        """
+        entry = u'<url><loc>%s</loc>%s</url>\n' % (
+            escape(loc, _XML_ENTITIES),
+            u'<lastmod>%s</lastmod>' % lastmod if lastmod else u''
+        )
+        data = entry.encode('utf-8')
+
+        if self._file is not None and (
+                self._urls >= self.max_urls or self._bytes + len(data) > self.max_bytes):
+            self._close_file()
+
+        if self._file is None:
+            self._open()
+
+        self._file.write(data)
+        self._urls += 1
+        self._bytes += len(data)
+        self.total += 1
+
+    def extend(self, urls):
+        """
+        This method appends the (url, lastmod) tuples of the given iterable.
+        """
+
+        for loc, lastmod in urls:
+            self.add(loc, lastmod)
+
+    def write_index(self, base_url, path=None):
+        """
+        This method writes the sitemap index of the written files, given the
+        base URL where they are published, and retrieves its path.
+        """
+        path = path or os.path.join(self.directory, '%s-index.xml' % self.prefix)
+        base_url = base_url if base_url.endswith('/') else base_url + '/'
+
+        with io.open(path, 'w', encoding='utf-8') as fp:
+            fp.write(_INDEX_HEADER)
+            for name in self.files:
+                fp.write(u'<sitemap><loc>%s</loc></sitemap>\n' % escape(
+                    base_url + os.path.basename(name), _XML_ENTITIES))
+            fp.write(_INDEX_FOOTER)
+
+        return path
+
+    def close(self):
+
+        self._close_file()
+
+
+def write_sitemaps(articles, directory, base_url=None, kinds=('html',),
+                   languages=None, **kwargs):
+    """
+    This method writes the sitemap files of the given Article objects and
+    retrieves their paths. The sitemap index is written, and its path
+    appended, when the base URL of the files is given.
+    See article_urls and SitemapWriter for the other keyword arguments.
+    """
+    with SitemapWriter(directory, **kwargs) as writer:
+        writer.extend(article_urls(articles, kinds=kinds, languages=languages))
+
+    files = list(writer.files)
+    if base_url is not None and files:
+        files.append(writer.write_index(base_url))
+
+    return files
+
+
+def write_url_list(articles, fp, kinds=('html',), languages=None):
+    """
+    This method writes the URLs of the given Article objects, one per line,
+    to the given text file object and retrieves the number of URLs written.
+    """
+    total = 0
+
+    for loc, lastmod in article_urls(articles, kinds=kinds, languages=languages):
+        fp.write(loc + u'\n')
+        total += 1
+
+    return total
@@ -0,0 +1,276 @@
+# coding: utf-8
+"""
+Validation of a corpus dump against the xylose document classes.
+
+Every property, and every method without required arguments, of the
+Article of each record, of its Journal, Issue and Citation objects, is
+evaluated; the exceptions are aggregated by (class, property, exception
+type) with sample PIDs. The records are validated across a process pool,
+in chunks of lines, and the partial reports are merged.
+
+    with open('articles.jsonl', 'rb') as dump:
+        report = validate_corpus(dump, processes=8)
+    report.write('validation.json')
+"""
+import io
+import json
+import inspect
+import warnings
+from collections import Counter, deque
+from multiprocessing import Pool, cpu_count
+
+from xylose import corpus
+from xylose.scielodocument import Article, Citation
+
+_MEMBERS = {}
+
+
+def _required_arguments(function):
+    try:
+        spec = inspect.getfullargspec(function)
+    except AttributeError:  # Keep compatibility with python 2.7
+        spec = inspect.getargspec(function)
+
+    return len(spec.args) - len(spec.defaults or ()) - 1
+
+
+def members(cls):
+    """
+    This method retrieves the names of the public properties and of the
+    public methods without required arguments of the given class.
+    """
+    names = _MEMBERS.get(cls)
+
+    if names is None:
+        names = []
+        for name in sorted(dir(cls)):
+            if name.startswith('_'):
+                continue
+            attribute = getattr(cls, name)
+            if isinstance(attribute, property):
+                names.append((name, False))
+            elif inspect.isfunction(attribute) or inspect.ismethod(attribute):
+                if _required_arguments(attribute) == 0:
+                    names.append((name, True))
+        _MEMBERS[cls] = names
+
+    return names
+
+
+def validate_object(obj):
+    """
+    This method yields (property, exception) for the members of the given
+    object that raise.
+    """
+
+    for name, is_method in members(type(obj)):
+        try:
+            value = getattr(obj, name)
+            if is_method:
+                value()
+        except Exception as exc:
+            yield name, exc
+
+
+class ValidationReport(object):
+
+    def __init__(self, sample_size=5):
+        self.sample_size = sample_size
+        self.records = 0
+        self.failed_records = 0
+        self.failures = Counter()
+        self.samples = {}
+        self.messages = {}
+
+    def add(self, pid, failures):
+        """
+        This method accounts the (class, property, exception) failures of the
+        record of the given PID.
+        """
+        self.records += 1
+
+        if not failures:
+            return
+
+        self.failed_records += 1
+        for class_name, name, exc in failures:
+            key = (class_name, name, type(exc).__name__)
+            self.failures[key] += 1
+            samples = self.samples.setdefault(key, [])
+            if len(samples) < self.sample_size and pid not in samples:
+                samples.append(pid)
+            self.messages.setdefault(key, str(exc))
+
+    def merge(self, other):
+        self.records += other.records
+        self.failed_records += other.failed_records
+        self.failures.update(other.failures)
+
+        for key, pids in other.samples.items():
+            samples = self.samples.setdefault(key, [])
+            for pid in pids:
+                if len(samples) < self.sample_size and pid not in samples:
+                    samples.append(pid)
+            self.messages.setdefault(key, other.messages[key])
+
+    def as_dict(self):
+
+        return {
+            'records': self.records,
+            'failed_records': self.failed_records,
+            'failures': [
+                {
+                    'class': key[0],
+                    'property': key[1],
+                    'exception': key[2],
+                    'count': count,
+                    'message': self.messages[key],
+                    'samples': self.samples[key],
+                }
+                for key, count in sorted(self.failures.items(), key=lambda i: (-i[1], i[0]))
+            ],
+        }
+
+    def write(self, path):
+        """
+        This method writes the report to the given path as JSON.
+        """
+
+        data = json.dumps(self.as_dict(), indent=2, ensure_ascii=False)
+        if isinstance(data, bytes):  # Python 2, ASCII only report
+            data = data.decode('utf-8')
+
+        with io.open(path, 'w', encoding='utf-8') as fp:
+            fp.write(data)
+
+    def __str__(self):
+        lines = [u'%d records, %d with failures.' % (self.records, self.failed_records)]
+
+        for item in self.as_dict()['failures']:
+            lines.append(u'%(count)8d %(class)s.%(property)s %(exception)s: %(message)s' % item)
+
+        return u'\n'.join(lines)
+
+
+def record_pid(record, default=None):
+    try:
+        return record['article']['v880'][0]['_']
+    except Exception:
+        return default
+
+
+def validate_record(record, iso_format=None):
+    """
+    This method retrieves the (class, property, exception) failures of the
+    given isis2json type 3 SciELO document.
+    """
+    failures = []
+    article = Article(record, iso_format=iso_format)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for name, exc in validate_object(article):
+            failures.append(('Article', name, exc))
+
+        related = []
+        for name in ('journal', 'issue'):
+            try:
+                related.append(getattr(article, name))
+            except Exception:
+                continue
+        try:
+            related.extend(article.citations or [])
+        except Exception:
+            pass
+
+        for obj in related:
+            class_name = 'Citation' if isinstance(obj, Citation) else type(obj).__name__
+            for name, exc in validate_object(obj):
+                failures.append((class_name, name, exc))
+
+    return failures
+
+
+def _validate_chunk(arguments):
+    lines, backend, iso_format, sample_size = arguments
+    parse = corpus.get_backend(backend)
+    report = ValidationReport(sample_size=sample_size)
+
+    for number, line in lines:
+        pid = u'line %d' % number
+        try:
+            record = parse(line)
+        except Exception as exc:
+            report.add(pid, [('record', 'json', exc)])
+            continue
+
+        pid = record_pid(record, pid)
+        try:
+            failures = validate_record(record, iso_format=iso_format)
+        except Exception as exc:
+            failures = [('Article', '__init__', exc)]
+        report.add(pid, failures)
+
+    return report
+
+
+def _chunks(lines, chunk_size, backend, iso_format, sample_size):
+    chunk = []
+
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        chunk.append((number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk, backend, iso_format, sample_size
+            chunk = []
+
+    if chunk:
+        yield chunk, backend, iso_format, sample_size
+
+
+def validate_corpus(lines, processes=None, chunk_size=100, sample_size=5,
+                    backend=None, iso_format=None, max_pending=None):
+    """
+    This method validates the records of an iterable of JSON lines, such as
+    an opened dump file, and retrieves the ValidationReport.
+
+    Keyword arguments:
+    processes -- the size of the process pool, the number of CPUs when None.
+    With 1 the records are validated in the current process.
+    chunk_size -- the number of lines sent to a process at once.
+    sample_size -- the number of sample PIDs kept per failure.
+    max_pending -- the maximum number of chunks sent to the pool and not yet
+    merged, twice the pool size when None. The lines are not read further
+    while the pool is behind, so the memory does not grow with the dump.
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size not allowed ({0})'.format(chunk_size))
+
+    processes = processes or cpu_count()
+    max_pending = max_pending or 2 * processes
+
+    report = ValidationReport(sample_size=sample_size)
+    chunks = _chunks(lines, chunk_size, backend, iso_format, sample_size)
+
+    if processes == 1:
+        for chunk in chunks:
+            report.merge(_validate_chunk(chunk))
+        return report
+
+    pool = Pool(processes)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.apply_async(_validate_chunk, (chunk,)))
+            if len(pending) >= max_pending:
+                report.merge(pending.popleft().get())
+
+        while pending:
+            report.merge(pending.popleft().get())
+    finally:
+        pool.close()
+        pool.join()
+
+    return report